@@ -20,8 +20,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
     from src.advanced_agent_orchestrator import LinkedInAgentOrchestrator
-    from src.langchain_post_agent import LangChainPostAgent
     from src.email_sender import EmailSender
+    from src.ui_assets import inject_css
 except ImportError as e:
     st.error(f"🚨 Module Error: {e}")
     st.stop()
@@ -42,306 +42,8 @@ st.set_page_config(
 # ============================================================================
 
 def load_custom_css():
-    """Load custom CSS for futuristic design"""
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Space+Grotesk:wght@300;400;600;700&display=swap');
-    
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    /* ==================== GLOBAL STYLES ==================== */
-    
-    .stApp {
-        background: linear-gradient(135deg, #0a0e27 0%, #0f1b35 50%, #0a0e27 100%);
-        background-attachment: fixed;
-        color: #ffffff;
-        font-family: 'Space Grotesk', sans-serif;
-        overflow-x: hidden;
-    }
-    
-    /* Animated background particles */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            radial-gradient(2px 2px at 20% 30%, rgba(0, 255, 136, 0.3), transparent),
-            radial-gradient(2px 2px at 60% 70%, rgba(56, 152, 236, 0.2), transparent),
-            radial-gradient(1px 1px at 50% 50%, rgba(255, 255, 255, 0.1), transparent);
-        background-size: 200px 200px, 300px 300px, 150px 150px;
-        animation: particleFloat 20s linear infinite;
-        pointer-events: none;
-        z-index: 0;
-    }
-    
-    @keyframes particleFloat {
-        from { transform: translateY(0px); }
-        to { transform: translateY(-1000px); }
-    }
-    
-    /* ==================== TITLE STYLES ==================== */
-    
-    .main-title {
-        text-align: center;
-        font-size: 3.5rem;
-        font-weight: 900;
-        font-family: 'Orbitron', sans-serif;
-        background: linear-gradient(90deg, #00ff88, #00ffff, #00ff88);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        text-shadow: 0 0 30px rgba(0, 255, 136, 0.5);
-        letter-spacing: 3px;
-        margin: 2rem 0 0.5rem 0;
-        animation: titleGlow 3s ease-in-out infinite;
-    }
-    
-    @keyframes titleGlow {
-        0%, 100% { filter: drop-shadow(0 0 15px rgba(0, 255, 136, 0.5)); }
-        50% { filter: drop-shadow(0 0 30px rgba(0, 255, 255, 0.8)); }
-    }
-    
-    .subtitle {
-        text-align: center;
-        font-size: 1.1rem;
-        color: #b0b8c1;
-        letter-spacing: 2px;
-        margin-bottom: 2rem;
-    }
-    
-    /* ==================== GLOWING CARDS ==================== */
-    
-    .glow-card {
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.05) 0%, rgba(56, 152, 236, 0.05) 100%);
-        border: 2px solid rgba(0, 255, 136, 0.2);
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        backdrop-filter: blur(10px);
-        transition: all 0.3s ease;
-        box-shadow: 0 0 20px rgba(0, 255, 136, 0.1);
-    }
-    
-    .glow-card:hover {
-        border-color: #00ff88;
-        box-shadow: 0 0 40px rgba(0, 255, 136, 0.3);
-        transform: translateY(-5px);
-    }
-    
-    .glow-card-title {
-        color: #00ff88;
-        font-size: 1.2rem;
-        font-weight: bold;
-        margin-bottom: 1rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        text-shadow: 0 0 10px rgba(0, 255, 136, 0.5);
-    }
-    
-    /* ==================== STAT BOXES ==================== */
-    
-    .stat-box {
-        background: linear-gradient(135deg, rgba(10, 102, 194, 0.1) 0%, rgba(0, 255, 136, 0.05) 100%);
-        border: 1px solid rgba(0, 255, 136, 0.3);
-        border-radius: 10px;
-        padding: 1.5rem;
-        text-align: center;
-        backdrop-filter: blur(8px);
-        transition: all 0.3s ease;
-    }
-    
-    .stat-box:hover {
-        border-color: #00ff88;
-        box-shadow: 0 0 30px rgba(0, 255, 136, 0.2);
-    }
-    
-    .stat-value {
-        font-size: 2.5rem;
-        color: #00ff88;
-        font-weight: bold;
-        text-shadow: 0 0 10px rgba(0, 255, 136, 0.5);
-        margin: 0.5rem 0;
-    }
-    
-    .stat-label {
-        color: #b0b8c1;
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-    
-    /* ==================== FORM ELEMENTS ==================== */
-    
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div > select {
-        background-color: rgba(15, 27, 53, 0.8) !important;
-        border: 1px solid rgba(0, 255, 136, 0.3) !important;
-        color: #ffffff !important;
-        border-radius: 8px !important;
-        padding: 0.8rem !important;
-        font-family: 'Space Grotesk', sans-serif !important;
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus {
-        border-color: #00ff88 !important;
-        box-shadow: 0 0 15px rgba(0, 255, 136, 0.3) !important;
-    }
-    
-    /* ==================== BUTTONS ==================== */
-    
-    .stButton > button {
-        background: linear-gradient(135deg, #00ff88 0%, #00cccc 100%) !important;
-        color: #000000 !important;
-        font-weight: bold !important;
-        border: none !important;
-        border-radius: 10px !important;
-        padding: 0.8rem 1.5rem !important;
-        font-size: 1rem !important;
-        letter-spacing: 1px !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 0 20px rgba(0, 255, 136, 0.3) !important;
-        text-transform: uppercase !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-3px) !important;
-        box-shadow: 0 0 40px rgba(0, 255, 136, 0.6) !important;
-    }
-    
-    .stButton > button:active {
-        transform: translateY(-1px) !important;
-    }
-    
-    /* ==================== SIDEBAR STYLES ==================== */
-    
-    [data-testid="stSidebar"] {
-        background: linear-gradient(135deg, rgba(10, 20, 40, 0.95) 0%, rgba(13, 31, 45, 0.95) 100%) !important;
-        border-right: 2px solid rgba(0, 255, 136, 0.3) !important;
-    }
-    
-    [data-testid="stSidebar"] > div {
-        background-color: transparent !important;
-    }
-    
-    .sidebar-section {
-        background: rgba(0, 255, 136, 0.05);
-        border-left: 3px solid #00ff88;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    
-    .sidebar-title {
-        color: #00ff88;
-        font-weight: bold;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 0.8rem;
-        font-size: 0.95rem;
-    }
-    
-    .sidebar-stat {
-        display: flex;
-        justify-content: space-between;
-        padding: 0.5rem 0;
-        color: #b0b8c1;
-        font-size: 0.9rem;
-    }
-    
-    .sidebar-stat-value {
-        color: #00ff88;
-        font-weight: bold;
-    }
-    
-    /* ==================== LOADING ANIMATION ==================== */
-    
-    .loading-bar {
-        height: 4px;
-        background: linear-gradient(90deg, #00ff88, #00ffff, #00ff88);
-        border-radius: 2px;
-        animation: loading 2s ease-in-out infinite;
-        margin: 1rem 0;
-    }
-    
-    @keyframes loading {
-        0%, 100% { width: 0%; }
-        50% { width: 100%; }
-    }
-    
-    /* ==================== TYPING ANIMATION ==================== */
-    
-    .typing-text {
-        animation: typing 0.05s steps(1, end);
-        white-space: pre-wrap;
-        word-wrap: break-word;
-    }
-    
-    @keyframes typing {
-        from { width: 0; }
-    }
-    
-    /* ==================== STATUS INDICATOR ==================== */
-    
-    .status-online {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        background-color: #00ff88;
-        border-radius: 50%;
-        margin-right: 0.5rem;
-        animation: pulse 2s ease-in-out infinite;
-        box-shadow: 0 0 10px rgba(0, 255, 136, 0.8);
-    }
-    
-    @keyframes pulse {
-        0%, 100% { box-shadow: 0 0 10px rgba(0, 255, 136, 0.8); }
-        50% { box-shadow: 0 0 20px rgba(0, 255, 136, 1); }
-    }
-    
-    /* ==================== SUCCESS MESSAGE ==================== */
-    
-    .success-message {
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.1) 0%, rgba(56, 152, 236, 0.1) 100%);
-        border-left: 4px solid #00ff88;
-        padding: 1rem;
-        border-radius: 8px;
-        animation: slideIn 0.5s ease-out;
-    }
-    
-    @keyframes slideIn {
-        from {
-            transform: translateX(-100%);
-            opacity: 0;
-        }
-        to {
-            transform: translateX(0);
-            opacity: 1;
-        }
-    }
-    
-    /* ==================== RESPONSIVE ==================== */
-    
-    @media (max-width: 768px) {
-        .main-title {
-            font-size: 2rem;
-        }
-        
-        .stat-value {
-            font-size: 1.8rem;
-        }
-    }
-    
-    </style>
-    """, unsafe_allow_html=True)
+    """Load custom CSS for futuristic design (assets/app.css, includes the workflow popup styles)"""
+    inject_css('app')
 
 # ============================================================================
 # SESSION STATE INITIALIZATION
@@ -853,54 +555,7 @@ def render_workflow_popup():
     
     # Show popup when pending generation (BEFORE generating post)
     if st.session_state.show_workflow_popup and not st.session_state.generated_post:
-        with st.container():
-            st.markdown("""
-            <style>
-            .workflow-modal {
-                position: fixed;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 100%;
-                background: rgba(0, 0, 0, 0.7);
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                z-index: 999;
-                animation: fadeIn 0.3s ease-in;
-            }
-            
-            .workflow-content {
-                background: linear-gradient(135deg, #0f0c29 0%, #302b63 50%, #24243e 100%);
-                border: 2px solid #00ff88;
-                border-radius: 15px;
-                padding: 2rem;
-                max-width: 600px;
-                max-height: 80vh;
-                overflow-y: auto;
-                box-shadow: 0 0 40px rgba(0, 255, 136, 0.5);
-                animation: slideUp 0.4s ease-out;
-            }
-            
-            @keyframes fadeIn {
-                from { opacity: 0; }
-                to { opacity: 1; }
-            }
-            
-            @keyframes slideUp {
-                from { 
-                    opacity: 0;
-                    transform: translateY(50px);
-                }
-                to { 
-                    opacity: 1;
-                    transform: translateY(0);
-                }
-            }
-            </style>
-            """, unsafe_allow_html=True)
-        
-        # Modal background
+        # Modal background (styles are in assets/app.css)
         col1, col2, col3 = st.columns([1, 2, 1])
         
         with col2:
@@ -0,0 +1,68 @@
+"""
+CSS payload per Streamlit rerun
+Bytes each app sends for its stylesheet on every rerun: the source CSS, the
+minified <style> markup the app sends, its gzip size on the websocket, and
+(with --before-ref) the inline <style> blocks the app files contained at an
+earlier git revision. Also reports the one-off minify cost and the per-rerun
+cost of building the markup.
+
+Usage:
+    python -m benchmarks.bench_css_payload
+    python -m benchmarks.bench_css_payload --before-ref HEAD~1
+"""
+
+import argparse
+import gzip
+import re
+import subprocess
+import time
+
+from src import ui_assets
+
+APPS = {
+    'streamlit_app_modern.py': 'agent',
+    'app.py': 'app',
+    'linkedin_post_generator.py': 'generator',
+}
+_STYLE_RE = re.compile(r'<style>.*?</style>', re.DOTALL)
+
+
+def inline_style_bytes(ref: str, path: str) -> int:
+    """Bytes of all <style> blocks in `path` at git revision `ref`"""
+    source = subprocess.run(['git', 'show', f'{ref}:{path}'], cwd=ui_assets.ROOT_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    return sum(len(block.encode('utf-8')) for block in _STYLE_RE.findall(source))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--before-ref', help='git revision whose inline <style> blocks are the baseline')
+    parser.add_argument('--reruns', type=int, default=10000)
+    args = parser.parse_args()
+
+    header = f"{'app':<28} {'source':>8} {'minified':>9} {'gzip':>6} {'minify ms':>10} {'µs/rerun':>9}"
+    if args.before_ref:
+        header += f" {'before':>8} {'saved/rerun':>12}"
+    print(header)
+    for path, name in APPS.items():
+        ui_assets._stylesheets.pop(name, None)
+        started = time.perf_counter()
+        sheet = ui_assets.load_stylesheet(name)
+        minify_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for _ in range(args.reruns):
+            ui_assets.load_stylesheet(name).markup
+        rerun_us = (time.perf_counter() - started) / args.reruns * 1e6
+
+        markup = sheet.markup.encode('utf-8')
+        row = (f"{path:<28} {sheet.source_bytes:>8} {len(markup):>9} {len(gzip.compress(markup)):>6} "
+               f"{minify_ms:>10.2f} {rerun_us:>9.2f}")
+        if args.before_ref:
+            before = inline_style_bytes(args.before_ref, path)
+            row += f" {before:>8} {before - len(markup):>12}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
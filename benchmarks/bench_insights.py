@@ -0,0 +1,95 @@
+"""
+Insight extractor benchmark
+Times the TextRank/TF-IDF sentence ranker behind extract_key_insights on long
+documents, with and without the frozen post-template background IDF table,
+and compares it with the previous keyword scan over the first ten sentences,
+including how much of the document each one looks at.
+
+Usage:
+    python -m benchmarks.bench_insights
+    python -m benchmarks.bench_insights --words 10000 50000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from src.insights import INSIGHT_KEYWORDS, BackgroundIDF, InsightExtractor
+
+
+def keyword_insights(content: str) -> Dict[str, object]:
+    """The previous extract_key_insights: keyword scan of the first ten '.'-split pieces"""
+    sentences = content.split('.')
+    insights = [s.strip() for s in sentences[:10] if any(k in s.lower() for k in INSIGHT_KEYWORDS)]
+    return {'insights': insights[:5], 'total_analyzed': len(sentences)}
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    letters = 'abcdefghijklmnoprstuvwy'
+    words = {''.join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(size * 2)}
+    return sorted(words)[:size] + sorted(INSIGHT_KEYWORDS)
+
+
+def make_document(words: int, vocabulary: List[str], rng: random.Random) -> str:
+    # Zipf-like term distribution: a few frequent terms, a long tail
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    tokens = rng.choices(vocabulary, weights=weights, k=words)
+    sentences, start = [], 0
+    while start < len(tokens):
+        length = rng.randint(8, 25)
+        sentence = tokens[start:start + length]
+        if rng.random() < 0.2:
+            sentence.append(f"{rng.randint(2, 95)}%")
+        sentences.append(' '.join(sentence).capitalize() + '.')
+        start += length
+    return ' '.join(sentences)
+
+
+def timed(run: Callable[[], object], min_seconds: float = 1.0) -> float:
+    """Mean seconds per call"""
+    iterations, started = 0, time.perf_counter()
+    while True:
+        run()
+        iterations += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            return elapsed / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--vocabulary', type=int, default=5000)
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = make_vocabulary(args.vocabulary, rng)
+
+    started = time.perf_counter()
+    background = BackgroundIDF.from_templates()
+    print(f"Background IDF: {background.documents} sentences, {len(background.frequency)} terms, "
+          f"built once in {(time.perf_counter() - started) * 1000:.2f} ms")
+    print(f"{'case':<14} {'extractor':<16} {'ms/call':>10} {'words/s':>12} {'sentences':>10} {'method':>11}")
+    for words in args.words:
+        document = make_document(words, vocabulary, rng)
+        extractor = InsightExtractor()
+        with_background = InsightExtractor(background=background)
+
+        cases = (
+            ('textrank', lambda: extractor.extract(document, top_k=args.top_k)),
+            ('textrank bg', lambda: with_background.extract(document, top_k=args.top_k)),
+            ('keyword scan', lambda: keyword_insights(document)),
+        )
+        for name, run in cases:
+            result = run()
+            seconds = timed(run)
+            looked_at = min(10, result['total_analyzed']) if name == 'keyword scan' else result['total_analyzed']
+            print(f"{f'{words} words':<14} {name:<16} {seconds * 1000:>10.2f} {words / seconds:>12.0f} "
+                  f"{looked_at:>10} {result.get('method', '-'):>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""
+Offline orchestrator benchmark
+Runs LinkedInAgentOrchestrator against a fake chat model, local tool stubs and
+an SMTP sink, and reports p50/p95/p99 latency and posts/second per concurrency
+level. Results are saved as JSON and can be compared against a baseline run.
+
+Usage:
+    python -m benchmarks.bench_orchestrator --concurrency 1 4 16 --requests 64
+    python -m benchmarks.bench_orchestrator --output new.json --baseline old.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fakes import FakeChatModel, SMTPSink, StubToolServer
+
+
+TOPICS = [
+    "AI in Healthcare", "Remote Work Culture", "Sustainable Supply Chains",
+    "Cloud Cost Optimization", "Developer Productivity", "Data Privacy",
+    "Edge Computing", "Leadership in Tech",
+]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def run_level(orchestrator, concurrency: int, requests: int, send_email: bool) -> Dict[str, Any]:
+    """Run `requests` orchestrations with `concurrency` worker threads"""
+
+    def one(i: int) -> float:
+        topic = TOPICS[i % len(TOPICS)]
+        start = time.perf_counter()
+        post = orchestrator.orchestrate_post_creation(
+            topic=topic,
+            tone="professional",
+            length=2,
+            target_audience="technology professionals",
+            # TOPICS repeat, so the topic cache would turn every request after
+            # the first into a lookup instead of an orchestration
+            use_cache=False
+        )
+        if send_email:
+            orchestrator.send_email("sink@localhost", post)
+        if post.get('error'):
+            raise RuntimeError(post['error'])
+        return time.perf_counter() - start
+
+    latencies, errors = [], 0
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(one, i) for i in range(requests)]
+        for future in futures:
+            try:
+                latencies.append(future.result())
+            except Exception:
+                errors += 1
+    wall = time.perf_counter() - wall_start
+
+    return {
+        'concurrency': concurrency,
+        'requests': requests,
+        'errors': errors,
+        'wall_seconds': round(wall, 4),
+        'posts_per_second': round(len(latencies) / wall, 3) if wall else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50) * 1000, 2),
+            'p95': round(percentile(latencies, 95) * 1000, 2),
+            'p99': round(percentile(latencies, 99) * 1000, 2),
+            'max': round(max(latencies) * 1000, 2) if latencies else 0.0,
+        }
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Human-readable deltas per concurrency level against a baseline run"""
+    base_levels = {level['concurrency']: level for level in baseline.get('levels', [])}
+    lines = []
+    for level in current['levels']:
+        base = base_levels.get(level['concurrency'])
+        if not base:
+            continue
+        for key in ('p50', 'p95', 'p99'):
+            old, new = base['latency_ms'][key], level['latency_ms'][key]
+            change = (new - old) / old * 100 if old else 0.0
+            lines.append(f"  c={level['concurrency']:<3} {key}: {old:9.2f} -> {new:9.2f} ms ({change:+.1f}%)")
+        old, new = base['posts_per_second'], level['posts_per_second']
+        change = (new - old) / old * 100 if old else 0.0
+        lines.append(f"  c={level['concurrency']:<3} posts/s: {old:7.2f} -> {new:7.2f} ({change:+.1f}%)")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--requests', type=int, default=32, help='orchestrations per concurrency level')
+    parser.add_argument('--llm-latency', type=float, default=0.05, help='fake LLM time to first token (s)')
+    parser.add_argument('--token-rate', type=float, default=250.0, help='fake LLM output tokens per second')
+    parser.add_argument('--http-latency', type=float, default=0.02, help='stub tool server latency (s)')
+    parser.add_argument('--with-email', action='store_true', help='also send each post to the SMTP sink')
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', help='previous results JSON to compare against')
+    args = parser.parse_args(argv)
+
+    with StubToolServer(latency=args.http_latency) as stubs, SMTPSink() as sink:
+        os.environ.update(stubs.env_overrides())
+        os.environ.update(sink.env_overrides())
+
+        from src.advanced_agent_orchestrator import LinkedInAgentOrchestrator
+
+        llm = FakeChatModel(latency=args.llm_latency, tokens_per_second=args.token_rate)
+        orchestrator = LinkedInAgentOrchestrator(llm=llm)
+
+        # Warm up imports, connection pools and the compiled graph
+        run_level(orchestrator, 1, 2, args.with_email)
+
+        levels = []
+        for concurrency in args.concurrency:
+            result = run_level(orchestrator, concurrency, args.requests, args.with_email)
+            levels.append(result)
+            lat = result['latency_ms']
+            print(f"c={concurrency:<3} p50={lat['p50']:8.2f}ms p95={lat['p95']:8.2f}ms "
+                  f"p99={lat['p99']:8.2f}ms  {result['posts_per_second']:7.2f} posts/s  errors={result['errors']}")
+
+        emails = sink.messages_received
+
+    results = {
+        'benchmark': 'orchestrator',
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'llm_latency': args.llm_latency,
+            'token_rate': args.token_rate,
+            'http_latency': args.http_latency,
+            'requests_per_level': args.requests,
+            'with_email': args.with_email,
+        },
+        'emails_received': emails,
+        'levels': levels,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"Comparison against {args.baseline}:")
+        for line in compare(results, baseline):
+            print(line)
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Post quality scorer benchmark
+Times PostQualityScorer (the inline quality step of the orchestrator) for
+single posts and for batches, and fails if a single post takes longer than
+--budget-ms.
+
+Usage:
+    python -m benchmarks.bench_quality
+    python -m benchmarks.bench_quality --paragraphs 1 5 10 --batch 1000 --budget-ms 10
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from benchmarks.bench_sentiment import make_text
+from src.post_quality import PARAGRAPH_WORD_TARGETS, PostQualityScorer
+
+
+def make_post(paragraphs: int, rng: random.Random) -> dict:
+    body = '\n\n'.join(make_text(PARAGRAPH_WORD_TARGETS[paragraphs] // paragraphs, rng) for _ in range(paragraphs))
+    return {
+        'title': 'What we learned shipping faster',
+        'content': body + '\n\nWhat would you add?',
+        'hashtags': '#Engineering #Leadership #DevOps #Productivity',
+        'call_to_action': 'Share your experience in the comments!',
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[1, 3, 10])
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--budget-ms', type=float, default=10.0)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    scorer = PostQualityScorer()
+    scorer.score(make_post(1, rng), 1)  # imports NumPy
+
+    worst = 0.0
+    print(f"{'paragraphs':>10} {'single ms':>10} {'batch ms/post':>14} {'score':>7}")
+    for paragraphs in args.paragraphs:
+        post = make_post(paragraphs, rng)
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            result = scorer.score(post, paragraphs)
+        single_ms = (time.perf_counter() - started) / args.iterations * 1000
+
+        posts = [make_post(paragraphs, rng) for _ in range(args.batch)]
+        started = time.perf_counter()
+        scorer.score_batch(posts, paragraphs)
+        batch_ms = (time.perf_counter() - started) / args.batch * 1000
+
+        worst = max(worst, single_ms)
+        print(f"{paragraphs:>10} {single_ms:>10.3f} {batch_ms:>14.3f} {result['score']:>7}")
+
+    if worst > args.budget_ms:
+        print(f"❌ Single-post scoring took {worst:.2f} ms (budget {args.budget_ms} ms)")
+        sys.exit(1)
+    print(f"✅ Single-post scoring within {args.budget_ms} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+DuckDuckGo result extraction benchmark
+Compares the streaming extractor used by AgentTools.search_web (stops after
+N results) with full-page parsing, reporting CPU time and peak traced memory
+per parse over the saved result page and a full-size synthetic page.
+
+Usage:
+    python -m benchmarks.bench_search_parse
+    python -m benchmarks.bench_search_parse --iterations 500 --results 30 --limit 3
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from src.search_parser import DuckDuckGoResultParser, extract_duckduckgo_results
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'duckduckgo.html')
+CHUNK_SIZE = 8192
+
+
+def load_fixture() -> bytes:
+    with open(FIXTURE, 'rb') as f:
+        return f.read()
+
+
+def build_full_page(fixture: bytes, results: int, head_kb: int) -> bytes:
+    """
+    A page shaped like a live DuckDuckGo response: inline CSS/JS in the head
+    and `results` result blocks (cycled from the fixture) in the body
+    """
+    html = fixture.decode('utf-8')
+    blocks = re.findall(r'(  <div class="result .*?\n  </div>\n)', html, re.S)
+    head = '<style>' + ('.result__body{margin:0 0 1em}' * (head_kb * 1024 // 31)) + '</style>'
+    body = ''.join(blocks[i % len(blocks)] for i in range(results))
+    page = html.replace('</head>', head + '</head>', 1)
+    page = page[:page.index('  <div class="result ')] + body + page[page.index('</div>\n</body>'):]
+    return page.encode('utf-8')
+
+
+def _chunks(page: bytes):
+    for i in range(0, len(page), CHUNK_SIZE):
+        yield page[i:i + CHUNK_SIZE]
+
+
+def streaming_parse(page: bytes, limit: int) -> List[Dict[str, str]]:
+    return extract_duckduckgo_results(_chunks(page), limit=limit)
+
+
+def full_parse(page: bytes, limit: int) -> List[Dict[str, str]]:
+    """Decode the whole body and parse every result, then keep `limit`"""
+    parser = DuckDuckGoResultParser(limit=10 ** 9)
+    parser.feed(page.decode('utf-8'))
+    parser.close()
+    return parser.results[:limit]
+
+
+def beautifulsoup_parse(page: bytes, limit: int, features: str = 'html.parser') -> List[Dict[str, str]]:
+    """The previous implementation: full tree, then find_all"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page.decode('utf-8'), features)
+    results = []
+    for result in soup.find_all('div', class_='result')[:limit]:
+        title = result.find('a', class_='result__a')
+        snippet = result.find('a', class_='result__snippet')
+        if title:
+            results.append({
+                'title': title.get_text(strip=True),
+                'snippet': snippet.get_text(strip=True) if snippet else 'No snippet available',
+                'url': title.get('href', 'N/A')
+            })
+    return results
+
+
+def available_parsers() -> Dict[str, Callable[[bytes, int], List[Dict[str, str]]]]:
+    parsers = {'streaming': streaming_parse, 'full html.parser': full_parse}
+    if importlib.util.find_spec('bs4') is not None:
+        parsers['bs4 html.parser'] = beautifulsoup_parse
+        if importlib.util.find_spec('lxml') is not None:
+            parsers['bs4 lxml'] = lambda page, limit: beautifulsoup_parse(page, limit, 'lxml')
+    return parsers
+
+
+def measure(parse: Callable[[bytes, int], List[Dict[str, str]]], page: bytes,
+            limit: int, iterations: int) -> Dict[str, float]:
+    results = parse(page, limit)
+
+    tracemalloc.start()
+    parse(page, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.process_time()
+    for _ in range(iterations):
+        parse(page, limit)
+    cpu = time.process_time() - started
+
+    return {
+        'results': len(results),
+        'cpu_us_per_parse': round(cpu / iterations * 1e6, 1),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--limit', type=int, default=3, help='results kept per search (AgentTools keeps 3)')
+    parser.add_argument('--results', type=int, default=30, help='result blocks in the full-size page')
+    parser.add_argument('--head-kb', type=int, default=24, help='inline CSS/JS in the full-size page')
+    parser.add_argument('--output', help='write the report as JSON')
+    args = parser.parse_args()
+
+    fixture = load_fixture()
+    pages = {
+        'fixture': fixture,
+        'full-size': build_full_page(fixture, args.results, args.head_kb),
+    }
+    report = {}
+    for page_name, page in pages.items():
+        print(f"\n{page_name}: {len(page) / 1024:.1f} KiB")
+        print(f"  {'parser':<18} {'results':>7} {'cpu us/parse':>13} {'peak KiB':>9}")
+        for parser_name, parse in available_parsers().items():
+            row = measure(parse, page, args.limit, args.iterations)
+            report.setdefault(page_name, {})[parser_name] = row
+            print(f"  {parser_name:<18} {row['results']:>7} {row['cpu_us_per_parse']:>13} {row['peak_kib']:>9}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Sentiment engine throughput benchmark
+Compares the tokenizing lexicon engine behind AgentTools.analyze_sentiment
+with the previous substring scan on long documents and on a batch of
+post-sized texts, reporting words/s and MB/s.
+
+Usage:
+    python -m benchmarks.bench_sentiment
+    python -m benchmarks.bench_sentiment --words 10000 100000 --batch 5000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from src.sentiment import SentimentAnalyzer
+
+VOCABULARY = (
+    "the team shipped a new release this quarter and customers reported great results "
+    "growth was strong but the migration caused problems for some users who were not happy "
+    "leaders see an opportunity to improve onboarding while costs remain a risk for the business "
+    "innovative tooling helped engineers avoid failure and the decline in churn is a success"
+).split()
+
+
+def substring_sentiment(text: str) -> Dict[str, object]:
+    """The previous analyze_sentiment: one substring scan per lexicon word"""
+    positive_words = ['great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+                      'innovative', 'success', 'growth', 'opportunity']
+    negative_words = ['bad', 'poor', 'terrible', 'failure', 'decline',
+                      'problem', 'issue', 'crisis']
+    text_lower = text.lower()
+    positive_count = sum(1 for word in positive_words if word in text_lower)
+    negative_count = sum(1 for word in negative_words if word in text_lower)
+    return {'positive_indicators': positive_count, 'negative_indicators': negative_count}
+
+
+def make_text(words: int, rng: random.Random) -> str:
+    sentences, sentence = [], []
+    for _ in range(words):
+        sentence.append(rng.choice(VOCABULARY))
+        if len(sentence) >= rng.randint(8, 20):
+            sentences.append(' '.join(sentence).capitalize() + '.')
+            sentence = []
+    if sentence:
+        sentences.append(' '.join(sentence).capitalize() + '.')
+    return ' '.join(sentences)
+
+
+def throughput(run: Callable[[], object], words: int, chars: int, min_seconds: float = 0.5) -> Dict[str, float]:
+    iterations, started = 0, time.perf_counter()
+    while True:
+        run()
+        iterations += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds:
+            break
+    return {
+        'ms_per_call': round(elapsed / iterations * 1000, 3),
+        'words_per_s': round(words * iterations / elapsed),
+        'mb_per_s': round(chars * iterations / elapsed / 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--batch', type=int, default=5000, help='number of ~150-word texts per batch call')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    analyzer = SentimentAnalyzer()
+
+    print(f"{'case':<24} {'engine':<10} {'ms/call':>10} {'words/s':>12} {'MB/s':>7}")
+    for words in args.words:
+        text = make_text(words, rng)
+        for name, run in (('lexicon', lambda: analyzer.analyze(text)),
+                          ('substring', lambda: substring_sentiment(text))):
+            row = throughput(run, words, len(text))
+            print(f"{f'{words} words':<24} {name:<10} {row['ms_per_call']:>10} {row['words_per_s']:>12} {row['mb_per_s']:>7}")
+
+    texts: List[str] = [make_text(150, rng) for _ in range(args.batch)]
+    total_words = sum(len(t.split()) for t in texts)
+    total_chars = sum(len(t) for t in texts)
+    row = throughput(lambda: analyzer.analyze_batch(texts), total_words, total_chars)
+    print(f"{f'batch {args.batch} x 150 words':<24} {'lexicon':<10} {row['ms_per_call']:>10} "
+          f"{row['words_per_s']:>12} {row['mb_per_s']:>7}  "
+          f"({args.batch / (row['ms_per_call'] / 1000):.0f} texts/s)")
+
+
+if __name__ == '__main__':
+    main()
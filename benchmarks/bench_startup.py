@@ -0,0 +1,114 @@
+"""
+Startup import benchmark
+Measures the import cost of the modules the home page and email path need
+using `python -X importtime`, checks that heavy agent dependencies stay
+unloaded and fails when the budget is exceeded.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget-ms 150 --runs 7 --top 20
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What the home page and EmailSender need
+STARTUP_IMPORTS = (
+    'src.advanced_agent_orchestrator',
+    'src.email_sender',
+)
+
+# Must not be imported until an agent actually runs
+DEFERRED_MODULES = (
+    'langgraph',
+    'langchain_google_genai',
+    'langchain_core',
+    'pydantic',
+    'bs4',
+    'requests',
+    'plotly',
+)
+
+_PROBE = """
+import sys
+{imports}
+import json
+print(json.dumps(sorted(m for m in {deferred!r} if m in sys.modules)))
+"""
+
+
+def parse_importtime(stderr: str) -> Tuple[int, List[Tuple[str, int, int]]]:
+    """
+    Parse `-X importtime` output into (total_us, [(module, self_us, cumulative_us)]).
+    The total is the sum of cumulative times of top-level imports.
+    """
+    rows, total = [], 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue
+        # Top-level entries have exactly one space before the module name
+        if not name.startswith('  '):
+            total += cumulative_us
+        rows.append((name.strip(), self_us, cumulative_us))
+    return total, rows
+
+
+def measure_once(imports: Tuple[str, ...]) -> Dict:
+    code = _PROBE.format(imports='\n'.join(f'import {m}' for m in imports),
+                         deferred=DEFERRED_MODULES)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else 'probe failed')
+    total_us, rows = parse_importtime(proc.stderr)
+    return {
+        'total_us': total_us,
+        'rows': rows,
+        'deferred_loaded': json.loads(proc.stdout.strip().splitlines()[-1]),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=250.0, help='maximum startup import time')
+    parser.add_argument('--runs', type=int, default=5, help='take the fastest of N cold interpreter runs')
+    parser.add_argument('--top', type=int, default=15, help='show the N slowest modules (self time)')
+    args = parser.parse_args(argv)
+
+    runs = [measure_once(STARTUP_IMPORTS) for _ in range(args.runs)]
+    best = min(runs, key=lambda r: r['total_us'])
+    total_ms = best['total_us'] / 1000
+
+    print(f"Startup imports: {', '.join(STARTUP_IMPORTS)}")
+    print(f"Best of {args.runs}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print("Slowest modules by self time:")
+    for name, self_us, cumulative_us in sorted(best['rows'], key=lambda r: -r[1])[:args.top]:
+        print(f"  {self_us / 1000:8.2f} ms self {cumulative_us / 1000:8.2f} ms cumulative  {name}")
+
+    ok = True
+    if best['deferred_loaded']:
+        print(f"❌ Deferred modules loaded at startup: {', '.join(best['deferred_loaded'])}")
+        ok = False
+    if total_ms > args.budget_ms:
+        print(f"❌ Startup import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        ok = False
+    if ok:
+        print("✅ Startup within budget and heavy dependencies deferred")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
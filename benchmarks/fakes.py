@@ -0,0 +1,234 @@
+"""
+Offline fakes for benchmarks
+A deterministic chat model, local HTTP stubs serving recorded tool responses
+and an SMTP sink, so the orchestrator can run without any network access
+"""
+
+import os
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import unquote
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+RESEARCH_TOOLS = ('search_web', 'fetch_statistics', 'get_trending_topics')
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic stand-in for ChatGoogleGenerativeAI.
+
+    The first call asks for the three research tools, the next call returns a
+    formatted post. Latency is simulated as time-to-first-token plus output
+    tokens divided by the token rate.
+    """
+
+    latency: float = 0.05
+    tokens_per_second: float = 250.0
+    words_per_paragraph: int = 90
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        prompt = next((m.content for m in messages if getattr(m, 'type', '') == 'human'), '')
+        topic_match = re.search(r'about "([^"]+)"', prompt)
+        topic = topic_match.group(1) if topic_match else 'Technology'
+        paragraphs_match = re.search(r'\((\d+) paragraph', prompt)
+        paragraphs = int(paragraphs_match.group(1)) if paragraphs_match else 1
+
+        called_tools = any(isinstance(m, ToolMessage) for m in messages)
+        if not called_tools and 'Steps to follow' in prompt:
+            message = AIMessage(
+                content='',
+                tool_calls=[
+                    {'name': name, 'args': {'__arg1': topic}, 'id': f'call_{i}'}
+                    for i, name in enumerate(RESEARCH_TOOLS)
+                ],
+                usage_metadata={'input_tokens': len(prompt) // 4, 'output_tokens': 30, 'total_tokens': len(prompt) // 4 + 30}
+            )
+            self._simulate(30)
+        else:
+            text = self._render_post(topic, paragraphs)
+            output_tokens = int(len(text.split()) * 1.3)
+            message = AIMessage(
+                content=text,
+                usage_metadata={'input_tokens': len(prompt) // 4, 'output_tokens': output_tokens,
+                                'total_tokens': len(prompt) // 4 + output_tokens}
+            )
+            self._simulate(output_tokens)
+
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _simulate(self, output_tokens: int):
+        delay = self.latency + (output_tokens / self.tokens_per_second if self.tokens_per_second else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _render_post(self, topic: str, paragraphs: int) -> str:
+        sentence = (f"{topic} keeps changing how teams plan, build and measure their work, "
+                    f"and the organisations that invest early see compounding returns.")
+        per_paragraph = max(1, self.words_per_paragraph // len(sentence.split()))
+        body = '\n\n'.join(' '.join([sentence] * per_paragraph) for _ in range(max(1, paragraphs)))
+        tag = re.sub(r'\W+', '', topic.title())
+        return (f"TITLE: What {topic} Means for Your Team\n\n"
+                f"CONTENT:\n{body}\n\n"
+                f"HASHTAGS:\n#{tag} #Innovation #Leadership #Future #Growth\n\n"
+                f"CALL_TO_ACTION:\nHow is {topic} changing your work? Share below!")
+
+
+def _load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    fixtures: Dict[str, str] = {}
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        path = self.path.split('?')[0]
+        if path.startswith('/html'):
+            body, content_type = self.fixtures['duckduckgo.html'], 'text/html; charset=utf-8'
+        elif path.startswith('/search/repositories'):
+            body, content_type = self.fixtures['github_search.json'], 'application/json'
+        elif path.startswith('/page/summary/'):
+            topic = unquote(path.rsplit('/', 1)[-1])
+            body = self.fixtures['wikipedia_summary.json'].replace('{topic}', topic)
+            content_type = 'application/json'
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubToolServer:
+    """
+    Local HTTP server replaying recorded DuckDuckGo, GitHub and Wikipedia
+    responses. Use env_overrides() to point AgentTools at it.
+    """
+
+    def __init__(self, latency: float = 0.0, host: str = '127.0.0.1'):
+        fixtures = {name: _load_fixture(name) for name in
+                    ('duckduckgo.html', 'github_search.json', 'wikipedia_summary.json')}
+        handler = type('StubHandler', (_StubHandler,), {'latency': latency, 'fixtures': fixtures})
+        self.server = ThreadingHTTPServer((host, 0), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env_overrides(self) -> Dict[str, str]:
+        return {
+            'SEARCH_ENDPOINT': f"{self.base_url}/html/",
+            'GITHUB_API_ENDPOINT': self.base_url,
+            'WIKIPEDIA_API_ENDPOINT': self.base_url,
+        }
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue: accepts any login and discards the message"""
+
+    def _reply(self, line: str):
+        self.wfile.write((line + '\r\n').encode('ascii'))
+
+    def handle(self):
+        self._reply('220 localhost SMTP sink ready')
+        in_data = False
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+            if in_data:
+                if line == '.':
+                    in_data = False
+                    with self.server.lock:
+                        self.server.messages_received += 1
+                    self._reply('250 OK: queued')
+                continue
+            command = line.split(' ', 1)[0].upper()
+            if command == 'EHLO':
+                self._reply('250-localhost')
+                self._reply('250 AUTH PLAIN LOGIN')
+            elif command == 'HELO':
+                self._reply('250 localhost')
+            elif command == 'AUTH':
+                self._reply('235 Authentication successful')
+            elif command == 'DATA':
+                in_data = True
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+            elif command == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('250 OK')
+
+
+class SMTPSink:
+    """Local SMTP server that accepts and counts messages without TLS"""
+
+    def __init__(self, host: str = '127.0.0.1'):
+        self.server = socketserver.ThreadingTCPServer((host, 0), _SMTPSinkHandler)
+        self.server.daemon_threads = True
+        self.server.messages_received = 0
+        self.server.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def messages_received(self) -> int:
+        return self.server.messages_received
+
+    def env_overrides(self) -> Dict[str, str]:
+        host, port = self.server.server_address[:2]
+        return {
+            'SMTP_SERVER': host,
+            'SMTP_PORT': str(port),
+            'SMTP_STARTTLS': 'false',
+            'EMAIL_SENDER': 'bench@localhost',
+            'EMAIL_PASSWORD': 'bench',
+            'EMAIL_RECIPIENT': 'sink@localhost',
+        }
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
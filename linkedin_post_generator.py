@@ -5,8 +5,6 @@ from datetime import datetime, timedelta
 import json
 import time
 from typing import List, Dict, Any
-import plotly.graph_objects as go
-import plotly.express as px
 import random
 import smtplib
 from email.mime.text import MIMEText
@@ -15,6 +13,9 @@ from email.mime.multipart import MIMEMultipart
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from src.post_templates import get_template_registry, new_seed
+from src.ui_assets import inject_css
+
 # Try importing custom modules
 try:
     from src.agent_tools import AgentTools
@@ -36,308 +37,7 @@ st.set_page_config(
 # CUSTOM CSS - MODERN & ATTRACTIVE DESIGN
 # ============================================================================
 def load_custom_css():
-    st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700;800&family=Inter:wght@300;400;500;600;700&display=swap');
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        /* Main App Background */
-        .stApp {
-            background: linear-gradient(135deg, #0f172a 0%, #1e293b 25%, #0f172a 50%, #1e293b 75%, #0f172a 100%);
-            background-attachment: fixed;
-            font-family: 'Inter', sans-serif;
-            color: #e2e8f0;
-        }
-        
-        /* Header Styling */
-        .header-container {
-            background: linear-gradient(135deg, #0ea5e9 0%, #06b6d4 100%);
-            padding: 2.5rem 2rem;
-            border-radius: 15px;
-            margin-bottom: 2rem;
-            box-shadow: 0 20px 60px rgba(6, 182, 212, 0.2);
-            text-align: center;
-            animation: slideDown 0.6s ease-out;
-        }
-        
-        .header-container h1 {
-            color: #ffffff;
-            font-size: 2.5rem;
-            font-weight: 800;
-            margin-bottom: 0.5rem;
-            text-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-            font-family: 'Poppins', sans-serif;
-        }
-        
-        .header-container p {
-            color: #e0f2fe;
-            font-size: 1.1rem;
-            font-weight: 300;
-            letter-spacing: 0.5px;
-        }
-        
-        /* Sidebar Styling */
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
-            border-right: 2px solid #0ea5e9;
-        }
-        
-        [data-testid="stSidebar"] [data-testid="stSidebarContent"] {
-            padding-top: 2rem;
-        }
-        
-        .sidebar-header {
-            color: #0ea5e9;
-            font-size: 1.3rem;
-            font-weight: 700;
-            margin-bottom: 1.5rem;
-            padding-bottom: 1rem;
-            border-bottom: 2px solid #0ea5e9;
-            font-family: 'Poppins', sans-serif;
-        }
-        
-        /* Card Styling */
-        .stat-card {
-            background: linear-gradient(135deg, #1e293b 0%, #334155 100%);
-            padding: 1.5rem;
-            border-radius: 12px;
-            border-left: 4px solid #0ea5e9;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-            margin-bottom: 1rem;
-            transition: all 0.3s ease;
-        }
-        
-        .stat-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 15px 40px rgba(14, 165, 233, 0.2);
-            border-left: 4px solid #06b6d4;
-        }
-        
-        .stat-label {
-            color: #94a3b8;
-            font-size: 0.9rem;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 0.5rem;
-        }
-        
-        .stat-value {
-            color: #ffffff;
-            font-size: 2rem;
-            font-weight: 700;
-            font-family: 'Poppins', sans-serif;
-        }
-        
-        .stat-subtext {
-            color: #64748b;
-            font-size: 0.85rem;
-            margin-top: 0.5rem;
-        }
-        
-        /* Input Sections */
-        .input-section {
-            background: linear-gradient(135deg, #1e293b 0%, #334155 100%);
-            padding: 2rem;
-            border-radius: 12px;
-            border: 1px solid #0ea5e9;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2);
-        }
-        
-        .input-section h3 {
-            color: #0ea5e9;
-            font-size: 1.3rem;
-            font-weight: 700;
-            margin-bottom: 1.5rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            font-family: 'Poppins', sans-serif;
-        }
-        
-        /* Button Styling */
-        .stButton > button {
-            background: linear-gradient(135deg, #0ea5e9 0%, #06b6d4 100%);
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 0.75rem 2rem;
-            font-weight: 600;
-            font-size: 1rem;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            box-shadow: 0 10px 25px rgba(14, 165, 233, 0.3);
-        }
-        
-        .stButton > button:hover {
-            background: linear-gradient(135deg, #06b6d4 0%, #0891b2 100%);
-            box-shadow: 0 15px 35px rgba(14, 165, 233, 0.4);
-            transform: translateY(-2px);
-        }
-        
-        .stButton > button:active {
-            transform: translateY(0px);
-        }
-        
-        /* Text Area Styling */
-        .stTextArea textarea {
-            background-color: #0f172a !important;
-            color: #e2e8f0 !important;
-            border: 1px solid #0ea5e9 !important;
-            border-radius: 8px !important;
-            font-family: 'Inter', sans-serif;
-        }
-        
-        .stTextArea textarea:focus {
-            border-color: #06b6d4 !important;
-            box-shadow: 0 0 0 3px rgba(6, 182, 212, 0.1) !important;
-        }
-        
-        /* Text Input Styling */
-        .stTextInput input {
-            background-color: #0f172a !important;
-            color: #e2e8f0 !important;
-            border: 1px solid #0ea5e9 !important;
-            border-radius: 8px !important;
-        }
-        
-        .stTextInput input:focus {
-            border-color: #06b6d4 !important;
-            box-shadow: 0 0 0 3px rgba(6, 182, 212, 0.1) !important;
-        }
-        
-        /* Select Box Styling */
-        .stSelectbox > div > div {
-            background-color: #0f172a !important;
-            color: #e2e8f0 !important;
-            border: 1px solid #0ea5e9 !important;
-            border-radius: 8px !important;
-        }
-        
-        /* Success/Info Messages */
-        .stSuccess {
-            background-color: rgba(16, 185, 129, 0.1) !important;
-            border: 1px solid #10b981 !important;
-            border-radius: 8px !important;
-        }
-        
-        .stInfo {
-            background-color: rgba(14, 165, 233, 0.1) !important;
-            border: 1px solid #0ea5e9 !important;
-            border-radius: 8px !important;
-        }
-        
-        .stWarning {
-            background-color: rgba(245, 158, 11, 0.1) !important;
-            border: 1px solid #f59e0b !important;
-            border-radius: 8px !important;
-        }
-        
-        /* Tabs Styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 0px;
-            background-color: #1e293b;
-            border-bottom: 2px solid #0ea5e9;
-            border-radius: 0px;
-            padding: 0px;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            padding: 0px 20px;
-            background-color: #1e293b;
-            border-radius: 0px;
-            color: #94a3b8;
-            font-weight: 600;
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background-color: #0ea5e9;
-            color: white;
-        }
-        
-        /* Generated Post Container */
-        .post-container {
-            background: linear-gradient(135deg, #1e293b 0%, #334155 100%);
-            border: 2px solid #0ea5e9;
-            border-radius: 12px;
-            padding: 2rem;
-            margin-top: 1.5rem;
-            box-shadow: 0 15px 40px rgba(14, 165, 233, 0.15);
-        }
-        
-        .post-container h4 {
-            color: #0ea5e9;
-            margin-bottom: 1rem;
-            font-size: 1.2rem;
-            font-weight: 700;
-        }
-        
-        .post-content {
-            background-color: #0f172a;
-            padding: 1.5rem;
-            border-radius: 8px;
-            border-left: 4px solid #06b6d4;
-            color: #e2e8f0;
-            line-height: 1.8;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-        }
-        
-        /* Animations */
-        @keyframes slideDown {
-            from {
-                opacity: 0;
-                transform: translateY(-20px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-        
-        @keyframes fadeIn {
-            from {
-                opacity: 0;
-            }
-            to {
-                opacity: 1;
-            }
-        }
-        
-        .fade-in {
-            animation: fadeIn 0.6s ease-out;
-        }
-        
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .header-container h1 {
-                font-size: 1.8rem;
-            }
-            
-            .stat-card {
-                padding: 1rem;
-            }
-            
-            .stat-value {
-                font-size: 1.5rem;
-            }
-        }
-        
-        /* Divider */
-        .divider {
-            border-top: 2px solid #0ea5e9;
-            margin: 2rem 0;
-            opacity: 0.3;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_css('generator')
 
 # Load CSS
 load_custom_css()
@@ -367,112 +67,13 @@ if 'email_password' not in st.session_state:
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
-def generate_comprehensive_post(topic: str, expertise_level: str, tone: str, num_paragraphs: int, hashtags: int) -> str:
-    """Generate a comprehensive, multi-paragraph LinkedIn post"""
-    
-    # Extensive paragraph templates for different expertise levels
-    opening_paragraphs = {
-        'beginner': [
-            f"Just started exploring {topic} and I'm genuinely impressed! 🚀\n\nI've been diving deep into understanding how {topic} is reshaping the way we work and think. What started as curiosity has turned into a genuine passion for this space.",
-            f"Never thought I'd say this, but {topic} has completely changed my perspective. 💡\n\nAfter spending the last few weeks learning about {topic}, I realize how crucial it is for anyone in tech to understand its fundamentals.",
-        ],
-        'intermediate': [
-            f"After months of working with {topic}, I've discovered some game-changing insights. 🔥\n\nMy journey with {topic} has been transformative, and I want to share what I've learned with everyone in this community.",
-            f"{topic} is not just a buzzword - it's a fundamental shift in how we approach problems. 📊\n\nHaving implemented {topic} in several projects, I can confidently say that understanding its core principles is essential for modern professionals.",
-        ],
-        'expert': [
-            f"After years of working in {topic}, I can tell you with certainty that we're at an inflection point. 🎯\n\nThe evolution of {topic} over the past decade has been remarkable, and we're only scratching the surface of its potential.",
-            f"As someone who's been deep in the {topic} space for years, I've witnessed both the hype and the reality. 💼\n\nToday, I want to share my perspective on where {topic} is headed and why it matters for your career.",
-        ]
-    }
-    
-    insight_paragraphs = {
-        'beginner': [
-            f"What makes {topic} so important right now? Here's my take:\n\n✅ First, it's solving real-world problems that were previously unsolvable\n✅ Second, it's creating new opportunities for innovation across industries\n✅ Third, the learning curve is becoming more accessible than ever before\n\nEveryone can benefit from understanding {topic}, regardless of their background.",
-            f"Key things I've learned about {topic}:\n\n🔑 It's not as complicated as it seems at first\n🔑 The fundamentals matter more than you think\n🔑 Hands-on practice is crucial for mastery\n🔑 Community support is invaluable\n\nThe {topic} ecosystem is growing rapidly, and now is the perfect time to jump in.",
-            f"The impact of {topic} is undeniable:\n\n📈 Industry adoption is accelerating\n📈 Job opportunities are skyrocketing\n📈 Innovation is happening at an unprecedented pace\n📈 Skills in {topic} are becoming highly valuable\n\nIf you haven't started learning {topic} yet, what are you waiting for?",
-        ],
-        'intermediate': [
-            f"The practical applications of {topic} are expanding rapidly:\n\n💪 Enterprise-level implementations are becoming mainstream\n💪 Startups are using it to gain competitive advantages\n💪 Cross-industry collaboration is opening new possibilities\n💪 The ROI is becoming increasingly measurable\n\nFrom my experience, the key to success with {topic} is strategic implementation.",
-            f"What I've learned from implementing {topic}:\n\n🎯 Planning and strategy are critical before diving in\n🎯 Integration with existing systems requires careful consideration\n🎯 Training and change management are often overlooked\n🎯 Continuous improvement is essential\n\nThe teams that succeed with {topic} are those that treat it as a long-term investment.",
-            f"Current trends in {topic}:\n\n📊 Automation is reaching new levels of sophistication\n📊 Integration with AI is becoming standard\n📊 Security and compliance are top priorities\n📊 Scalability solutions are improving significantly\n\nThese trends are shaping the future of how {topic} will be used across organizations.",
-        ],
-        'expert': [
-            f"The evolution of {topic} has been fascinating to witness:\n\n🔬 Early adoption challenges have been largely overcome\n🔬 Standardization efforts are creating better interoperability\n🔬 Advanced use cases are pushing the boundaries of what's possible\n🔬 The talent pool is finally catching up to demand\n\nWe're entering a maturity phase where {topic} is becoming as essential as electricity in many industries.",
-            f"My predictions for the {topic} landscape:\n\n🚀 Consolidation among vendors will accelerate\n🚀 New regulations will emerge to ensure responsible use\n🚀 Integration with emerging technologies will create new paradigms\n🚀 Ethical considerations will take center stage\n\nOrganizations that adapt quickly will have significant competitive advantages.",
-            f"The technical depth required for {topic}:\n\n🔧 Deep understanding of underlying principles is crucial\n🔧 Cross-disciplinary knowledge becomes increasingly valuable\n🔧 Practical experience with edge cases is essential\n🔧 Continuous learning is non-negotiable\n\nThe future belongs to those who master both the art and science of {topic}.",
-        ]
-    }
-    
-    reflection_paragraphs = {
-        'beginner': [
-            f"What excites me most about {topic} is the potential it holds:\n\nImagine a world where {topic} has solved major challenges in our society. That's not far-fetched. We're already seeing glimpses of this future in forward-thinking organizations.\n\nIf you're on the fence about learning {topic}, I'd encourage you to take the first step today. The learning journey is rewarding, and the community is incredibly supportive.",
-            f"The beauty of {topic} is that it's still early:\n\nWhile it may seem like everyone is talking about {topic}, most people still don't truly understand it. This is an incredible opportunity for those willing to invest the time to learn.\n\nThe people who act now and become proficient in {topic} will have significant advantages in the coming years.",
-        ],
-        'intermediate': [
-            f"Looking ahead, {topic} will continue to evolve:\n\nThe next generation of {topic} applications will be more intuitive, more powerful, and more accessible than what exists today. Organizations that build expertise now will lead this transformation.\n\nMy advice? Don't just learn about {topic} - actively participate in shaping its future. Share your insights, collaborate with others, and push the boundaries of what's possible.",
-            f"The competitive advantage goes to those who embrace {topic} early:\n\nHistory shows us that early adopters of transformative technologies gain disproportionate benefits. The {topic} revolution is happening now, and the window of opportunity won't remain open forever.\n\nInvest in your {topic} expertise, build networks within the community, and position yourself for the future.",
-        ],
-        'expert': [
-            f"As we look toward the future of {topic}:\n\nWe stand at a unique moment where the theoretical foundations are well-established, and practical applications are being refined daily. The next frontier is not whether {topic} will succeed, but how it will reshape entire industries.\n\nFor those of us who've been in this space, our responsibility is to guide the next generation, ensure ethical implementation, and push for responsible innovation.",
-            f"The maturation of {topic} brings new challenges and opportunities:\n\nWe must address questions of governance, sustainability, and societal impact. The technical challenges are largely solved; now we face strategic and ethical ones. Those who can navigate this complexity will define the future of {topic}.\n\nMy commitment is to continue exploring, learning, and sharing insights as this field evolves. I hope you'll join this journey.",
-        ]
-    }
-    
-    closing_paragraphs = {
-        'beginner': [
-            f"This is just the beginning of my {topic} journey, and I can't wait to see where it takes me. If you're interested in {topic}, let's connect and learn together!",
-            f"Whether you're a complete beginner or have some {topic} experience, there's always more to discover. I'd love to hear your thoughts on {topic} in the comments below.",
-            f"The {topic} community is amazing, and I'm grateful to be part of it. If this resonated with you, share your own {topic} journey in the comments!",
-        ],
-        'intermediate': [
-            f"I'm genuinely excited about where {topic} is heading, and I'd love to collaborate with others who share this passion. Let's build something great together!",
-            f"Your experience with {topic} might be different from mine, and that's valuable. Let's discuss in the comments - what aspects of {topic} excite you the most?",
-            f"If you're working on {{topic}} projects or have insights to share, please reach out. I'm always eager to learn from others in this space.",
-        ],
-        'expert': [
-            f"The future of {{topic}} is being written by all of us. I'm excited to see where the community takes this technology. What are your predictions for {{topic}}?",
-            f"For those diving deep into {{topic}}, let's connect and share knowledge. The best innovations come from collaborative effort within our community.",
-            f"My mission is to advance {{topic}} knowledge and foster responsible innovation. If you share this vision, let's connect and make an impact together.",
-        ]
-    }
-    
-    # Build the post
-    post_parts = []
-    
-    # Opening paragraph
-    post_parts.append(random.choice(opening_paragraphs[expertise_level]))
-    
-    # Add insight paragraphs based on number requested
-    available_insights = insight_paragraphs[expertise_level]
-    num_insights = min(num_paragraphs - 1, len(available_insights))
-    
-    if num_insights > 0:
-        selected_insights = random.sample(available_insights, num_insights)
-        post_parts.extend(selected_insights)
-    
-    # Add reflection paragraph if there's room
-    if num_paragraphs > 2:
-        post_parts.append("\n" + random.choice(reflection_paragraphs[expertise_level]))
-    
-    # Closing paragraph
-    post_parts.append("\n" + random.choice(closing_paragraphs[expertise_level]))
-    
-    # Join all paragraphs
-    full_post = "\n\n".join(post_parts)
-    
-    # Add hashtags
-    if hashtags > 0:
-        hashtag_list = [
-            f"#{topic.replace(' ', '')}", "#LinkedIn", "#CareerGrowth", "#Innovation", 
-            "#Leadership", "#TechTrends", "#FutureOfWork", "#Learning", "#Success",
-            "#Inspiration", "#Entrepreneurship", "#Networking", "#ProfessionalDevelopment",
-            "#SkillBuilding", "#MindsetMatters"
-        ]
-        selected_hashtags = random.sample(hashtag_list, min(hashtags, len(hashtag_list)))
-        full_post += "\n\n" + " ".join(selected_hashtags)
-    
-    return full_post
+def generate_comprehensive_post(topic: str, expertise_level: str, tone: str, num_paragraphs: int, hashtags: int,
+                                seed: int = None) -> str:
+    """
+    Generate a comprehensive, multi-paragraph LinkedIn post from the precompiled template registry.
+    The same arguments and seed always produce the same post.
+    """
+    return get_template_registry().render(topic, expertise_level, tone, num_paragraphs, hashtags, seed)['post']
 
 
 def send_email(recipient_email: str, post_content: str, topic: str, sender_email: str = None, sender_password: str = None) -> tuple:
@@ -659,6 +260,11 @@ with tab1:
     
     with col6:
         add_cta = st.checkbox("🎯 Add Call-to-Action", value=True)
+        seed_input = st.text_input(
+            "🎲 Seed (optional)",
+            placeholder="random",
+            help="Reuse a post's seed with the same settings to reproduce it exactly"
+        )
     
     # Email sending option
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
@@ -723,13 +329,15 @@ with tab1:
         expertise_lower = expertise_level.lower()
         st.session_state.post_stats[expertise_lower] += 1
         
-        # Generate the post
+        # Generate the post (per-request RNG, so sessions never disturb each other)
+        seed = int(seed_input) if seed_input.strip().isdigit() else new_seed()
         generated_post = generate_comprehensive_post(
             topic=topic,
             expertise_level=expertise_lower,
             tone=tone.lower(),
             num_paragraphs=num_paragraphs,
-            hashtags=hashtags
+            hashtags=hashtags,
+            seed=seed
         )
         
         if add_cta:
@@ -740,7 +348,7 @@ with tab1:
                 "\n\n👉 Share your insights - I'd love to hear your perspective!",
                 "\n\n👉 Your feedback helps me grow. Please share your thoughts below!"
             ]
-            generated_post += random.choice(cta_options)
+            generated_post += random.Random(seed).choice(cta_options)
         
         st.session_state.generated_posts.append({
             'post': generated_post,
@@ -748,12 +356,13 @@ with tab1:
             'expertise_level': expertise_level,
             'tone': tone,
             'paragraphs': num_paragraphs,
+            'seed': seed,
             'timestamp': datetime.now(),
             'stats': get_stats_data()
         })
         
         # Success message
-        st.success("✅ Post generated successfully!")
+        st.success(f"✅ Post generated successfully! (seed {seed})")
         
         # Display the generated post in an enlarged container
         st.markdown(f"""
@@ -868,7 +477,10 @@ with tab3:
         
         st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
         
-        # Analytics Charts
+        # Analytics Charts (plotly is only loaded when charts are drawn)
+        import plotly.graph_objects as go
+        import plotly.express as px
+        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -2,37 +2,108 @@
 
 from typing import Dict, List, Optional, Any
 import logging
+import threading
+import time
+import uuid
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# LangChainPostAgent (LangGraph, Gemini) and EmailSender (smtplib, email.mime)
+# are imported on first use so that importing the orchestrator stays cheap
 try:
-    from src.langchain_post_agent import LangChainPostAgent
-    from src.email_sender import EmailSender
-    from src.agent_tools import AgentTools
+    from src.agent_tools import get_shared_tools_instance
+    from src.agent_memory import AgentMemory
+    from src.topic_cache import TopicSimilarityCache
+    from src.research_cache import ResearchBundleCache
+    from src.config import get_secret
+    from src.metrics import GENERATION_LATENCY, record_error
+    from src.tracing import tracer, build_waterfall
+    from src.deadlines import deadline, budget
+    from src.post_quality import get_scorer
 except ImportError:
-    from langchain_post_agent import LangChainPostAgent
-    from email_sender import EmailSender
-    from agent_tools import AgentTools
+    from agent_tools import get_shared_tools_instance
+    from agent_memory import AgentMemory
+    from topic_cache import TopicSimilarityCache
+    from research_cache import ResearchBundleCache
+    from config import get_secret
+    from metrics import GENERATION_LATENCY, record_error
+    from tracing import tracer, build_waterfall
+    from deadlines import deadline, budget
+    from post_quality import get_scorer
+
+
+class AgentSession:
+    """
+    Per-session context over a shared LinkedInAgentOrchestrator.
+    
+    The orchestrator holds the immutable, process-wide resources (LLM client,
+    compiled graph, tool registry, HTTP pools, email agent); a session only
+    owns its memory, so concurrent sessions never see each other's history.
+    Anything not defined here is delegated to the orchestrator.
+    """
+    
+    __slots__ = ('session_id', 'orchestrator', 'memory', 'created_at')
+    
+    def __init__(self, orchestrator: "LinkedInAgentOrchestrator", session_id: Optional[str] = None):
+        self.session_id = session_id or uuid.uuid4().hex
+        self.orchestrator = orchestrator
+        self.memory = AgentMemory(capacity=int(get_secret('SESSION_MEMORY_CAPACITY', 50)), ttl_seconds=None)
+        self.created_at = datetime.now().isoformat()
+    
+    def orchestrate_post_creation(self, topic: str, **kwargs) -> Dict[str, Any]:
+        return self.orchestrator.orchestrate_post_creation(topic, session=self, **kwargs)
+    
+    def get_recent_generations(self, topic: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        return self.memory.recent_generations(topic=topic, limit=limit)
+    
+    def __getattr__(self, name):
+        return getattr(self.orchestrator, name)
 
 
 class LinkedInAgentOrchestrator:
     
-    def __init__(self):
-        # Initialize specialized agents - NOW USING LANGCHAIN!
-        self.post_agent = LangChainPostAgent()
-        self.email_agent = EmailSender()
-        self.tools = AgentTools()
+    def __init__(self, llm=None):
+        # Specialized agents are created lazily on first use - NOW USING LANGCHAIN!
+        self._llm = llm
+        self._post_agent = None
+        self._email_agent = None
+        self._agent_lock = threading.Lock()
+        # Same AgentTools instance that backs the agents' shared tool registry
+        self.tools = get_shared_tools_instance()
         
-        # Agent memory - stores conversation history and context
-        self.memory = {
-            'conversations': [],
-            'generated_content': [],
-            'tool_usage': [],
-            'agent_decisions': []
-        }
+        # Agent memory - bounded per category, evictions spill to disk if configured
+        ttl_hours = get_secret('AGENT_MEMORY_TTL_HOURS', 168)
+        self.memory = AgentMemory(
+            capacity=int(get_secret('AGENT_MEMORY_CAPACITY', 500)),
+            ttl_seconds=float(ttl_hours) * 3600 if ttl_hours else None,
+            spill_path=get_secret('AGENT_MEMORY_DB')
+        )
+        
+        # Near-duplicate topic cache shared by all sessions (returns copies)
+        self.topic_cache = None
+        if str(get_secret('TOPIC_CACHE_ENABLED', 'true')).lower() not in ('0', 'false', 'no'):
+            cache_ttl_hours = get_secret('TOPIC_CACHE_TTL_HOURS', 24)
+            self.topic_cache = TopicSimilarityCache(
+                threshold=float(get_secret('TOPIC_CACHE_THRESHOLD', 0.85)),
+                max_entries=int(get_secret('TOPIC_CACHE_SIZE', 1000)),
+                ttl_seconds=float(cache_ttl_hours) * 3600 if cache_ttl_hours else None
+            )
+        
+        # Research bundles (search, statistics, trending) served stale-while-revalidate
+        refresh_interval = get_secret('RESEARCH_REFRESH_INTERVAL_SECONDS', 300)
+        self.research_cache = ResearchBundleCache(
+            self.tools,
+            ttl_seconds=float(get_secret('RESEARCH_CACHE_TTL_SECONDS', 900)),
+            max_stale_seconds=float(get_secret('RESEARCH_CACHE_MAX_STALE_HOURS', 6)) * 3600,
+            max_entries=int(get_secret('RESEARCH_CACHE_SIZE', 500)),
+            fallback_ttl_seconds=float(get_secret('RESEARCH_CACHE_FALLBACK_TTL_SECONDS', 60)),
+            refresh_interval=float(refresh_interval) if refresh_interval else None
+        )
+        # The agent's search/statistics tool calls wait for a load of the same topic instead of repeating it
+        self.tools.research_cache = self.research_cache
         
         # Set up logging
         logging.basicConfig(level=logging.INFO)
@@ -41,36 +112,149 @@ class LinkedInAgentOrchestrator:
         self.logger.info("🚀 LinkedIn Agent Orchestrator initialized with LangChain")
         self.logger.info("✅ Multi-agent system ready with LangChain ReAct framework")
     
+    def create_session(self, session_id: Optional[str] = None) -> "AgentSession":
+        """Cheap per-session view over this orchestrator's shared resources"""
+        return AgentSession(self, session_id)
+    
+    @property
+    def post_agent(self):
+        """LangGraph post agent, built on first access"""
+        if self._post_agent is None:
+            with self._agent_lock:
+                if self._post_agent is None:
+                    try:
+                        from src.langchain_post_agent import LangChainPostAgent
+                    except ImportError:
+                        from langchain_post_agent import LangChainPostAgent
+                    self._post_agent = LangChainPostAgent(llm=self._llm)
+        return self._post_agent
+    
+    @property
+    def email_agent(self):
+        """SMTP email agent, built on first access (does not load LangGraph)"""
+        if self._email_agent is None:
+            with self._agent_lock:
+                if self._email_agent is None:
+                    try:
+                        from src.email_sender import EmailSender
+                    except ImportError:
+                        from email_sender import EmailSender
+                    self._email_agent = EmailSender()
+        return self._email_agent
+    
     def orchestrate_post_creation(self, 
                                   topic: str,
                                   tone: str = "professional",
                                   length: str = "medium",
                                   target_audience: str = "professionals",
                                   enable_research: bool = True,
-                                  enable_statistics: bool = True) -> Dict[str, Any]:
-        
+                                  enable_statistics: bool = True,
+                                  session: Optional["AgentSession"] = None,
+                                  use_cache: bool = True,
+                                  deadline_seconds: Optional[float] = None,
+                                  candidates: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Generate a post. When a session is given, its per-session memory is
+        used instead of the orchestrator-wide memory. With use_cache, a post
+        generated for a near-identical topic (same tone, length and audience)
+        is served from the topic cache instead of running the agent.
+        Tools get whatever is left of deadline_seconds (default
+        GENERATION_DEADLINE_SECONDS) as their timeout. With candidates > 1
+        (default BEST_OF_N), that many posts are generated concurrently and
+        the best by quality score is returned, with the rest as 'alternates'.
+        """
         self.logger.info(f"🎯 LangChain Orchestrator starting workflow for: {topic}")
-        orchestration_log = []
+        started = time.perf_counter()
+        memory = session.memory if session is not None else self.memory
+        partition = (tone, str(length), ' '.join(target_audience.lower().split()))
         
-        try:
-            # PHASE 1: Planning
-            orchestration_log.append("🧩 Phase 1: LangChain Agent analyzing topic and planning workflow...")
-            orchestration_log.append(f"📋 Topic: {topic} | Tone: {tone} | Audience: {target_audience}")
+        with tracer.span('orchestrator.post_creation',
+                         topic=topic, tone=tone, length=str(length),
+                         target_audience=target_audience) as root_span:
+            if session is not None:
+                root_span.set_attribute('session_id', session.session_id)
             
-            # PHASE 2: Research Execution (handled by LangChain Agent autonomously)
-            orchestration_log.append("🔍 Phase 2: LangChain Agent executing research tools autonomously...")
-            orchestration_log.append(f"✓ Tools available: search_web, fetch_statistics, get_trending_topics")
+            cached = None
+            if use_cache and self.topic_cache is not None:
+                with tracer.span('cache.lookup') as cache_span:
+                    cached = self.topic_cache.lookup(topic, partition)
+                    cache_span.set_attribute('hit', cached is not None)
             
-            # PHASE 3: Content Generation (LangChain ReAct Agent)
-            orchestration_log.append("🤖 Phase 3: LangChain ReAct Agent generating content...")
+            if cached is not None:
+                post = cached['payload']
+                post.setdefault('orchestration_metadata', {})['cache'] = {
+                    'hit': True,
+                    'similarity': cached['similarity'],
+                    'matched_topic': cached['matched_topic']
+                }
+                memory.add('generated_content', topic=topic, framework='Topic Cache')
+                self.logger.info(f"♻️ Served cached post for '{cached['matched_topic']}' (similarity {cached['similarity']})")
+            else:
+                if deadline_seconds is None:
+                    deadline_seconds = float(get_secret('GENERATION_DEADLINE_SECONDS', 60))
+                root_span.set_attribute('deadline_s', deadline_seconds)
+                if candidates is None:
+                    candidates = int(get_secret('BEST_OF_N', 1))
+                with deadline(deadline_seconds):
+                    post = self._run_post_creation(topic, tone, length, target_audience, root_span, memory,
+                                                   enable_research=enable_research, candidates=candidates)
+                if self.topic_cache is not None and not post.get('error'):
+                    self.topic_cache.store(topic, post, partition)
+        
+        GENERATION_LATENCY.observe(time.perf_counter() - started, phase='total')
+        
+        # The root span has ended here, so the trace is complete
+        waterfall = build_waterfall(root_span)
+        metadata = post.get('orchestration_metadata')
+        if metadata is None:
+            post['trace_id'] = root_span.trace_id
+            return post
+        metadata['trace_id'] = root_span.trace_id
+        metadata['trace'] = waterfall
+        metadata['orchestration_log'] = [
+            f"{'   ' * row['depth']}{'❌' if row['status'] == 'error' else '✓'} "
+            f"{row['name']} ({row['duration_ms']:.0f} ms)"
+            for row in waterfall
+        ]
+        metadata['reasoning_steps'] = sum(1 for row in waterfall if row['name'] == 'react.step')
+        return post
+    
+    def _run_post_creation(self, topic: str, tone: str, length, target_audience: str,
+                           root_span, memory: AgentMemory, enable_research: bool = True,
+                           candidates: int = 1) -> Dict[str, Any]:
+        """Run the agent inside the orchestrator span and assemble the post"""
+        try:
+            research = None
+            agent_kwargs = {}
+            if enable_research:
+                with tracer.span('research.bundle') as research_span:
+                    # Candidates share one bundle rather than each running the research tools
+                    research = self._execute_research_phase(topic, target_audience, block=candidates > 1)
+                    research_span.set_attribute('cached', research is not None)
+                    if research is not None:
+                        research_span.set_attribute('stale', research['stale'])
+                        research_span.set_attribute('age_seconds', research['age_seconds'])
+                if research is not None and research['prompt_context']:
+                    agent_kwargs['research_context'] = research['prompt_context']
             
             try:
-                post = self.post_agent.generate_post_with_langchain(
-                    topic=topic,
-                    tone=tone,
-                    length=length,
-                    target_audience=target_audience
-                )
+                if candidates > 1:
+                    post = self.post_agent.generate_best_of_n(
+                        topic=topic,
+                        tone=tone,
+                        length=length,
+                        target_audience=target_audience,
+                        n=candidates,
+                        **agent_kwargs
+                    )
+                else:
+                    post = self.post_agent.generate_post_with_langchain(
+                        topic=topic,
+                        tone=tone,
+                        length=length,
+                        target_audience=target_audience,
+                        **agent_kwargs
+                    )
             except Exception as e:
                 self.logger.error(f"Agent generation failed: {e}")
                 raise Exception(f"Post generation failed: {str(e)}")
@@ -78,39 +262,46 @@ class LinkedInAgentOrchestrator:
             if not post or not isinstance(post, dict):
                 raise Exception("Invalid post data returned from agent")
             
-            # PHASE 4: Quality Validation
-            orchestration_log.append("✅ Phase 4: LangChain Agent completed workflow...")
-            
             # Get LangChain metadata from post
             agent_meta = post.get('agent_metadata', {})
             tools_available = agent_meta.get('tools_available', [])
             framework = agent_meta.get('framework', 'LangChain ReAct Agent')
-            
-            for tool in tools_available:
-                orchestration_log.append(f"   ⚡ Tool available: {tool}")
-            
-            orchestration_log.append(f"🎉 Workflow complete! Framework: {framework}")
+            root_span.set_attribute('framework', framework)
             
             # Add orchestration metadata for UI display
             post['orchestration_metadata'] = {
                 'framework': framework,
                 'tools_available': tools_available,
-                'reasoning_steps': 4,
-                'orchestration_log': orchestration_log,
+                'tools_used': agent_meta.get('tools_used', []),
                 'workflow_type': 'LangChain Multi-Agent System',
                 'timestamp': datetime.now().isoformat()
             }
+            # Best-of-N candidates were already scored when they were ranked
+            quality = post.pop('quality', None)
+            if quality is None:
+                with tracer.span('quality.score') as quality_span, GENERATION_LATENCY.time(phase='quality'):
+                    quality = self._validate_quality(post, length)
+                    quality_span.set_attribute('score', quality['score'])
+            post['orchestration_metadata']['quality'] = quality
+            if 'best_of_n' in agent_meta:
+                post['orchestration_metadata']['best_of_n'] = agent_meta['best_of_n']
+            if research is not None:
+                post['orchestration_metadata']['research'] = {
+                    'cached': True,
+                    'stale': research['stale'],
+                    'age_seconds': research['age_seconds']
+                }
             
             # Store in memory
-            self.memory['generated_content'].append({
-                'topic': topic,
-                'timestamp': datetime.now().isoformat(),
-                'framework': framework
-            })
+            memory.add('generated_content', topic=topic, framework=framework)
+            if agent_meta.get('tools_used'):
+                memory.add('tool_usage', topic=topic, tools=agent_meta['tools_used'])
             
             return post
             
         except Exception as e:
+            record_error('orchestrator', e)
+            root_span.record_exception(e)
             self.logger.error(f"Orchestration error: {e}")
             # Return fallback post structure
             fallback_post = {
@@ -127,6 +318,10 @@ class LinkedInAgentOrchestrator:
             }
             return fallback_post
     
+    def get_recent_generations(self, topic: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Recent generations from agent memory (and its spill store), newest first"""
+        return self.memory.recent_generations(topic=topic, limit=limit)
+    
     def send_email(self, recipient_email: str, post: Dict[str, Any]) -> tuple:
         """
         Send post via email
@@ -150,86 +345,33 @@ class LinkedInAgentOrchestrator:
             return success, message
             
         except Exception as e:
+            record_error('orchestrator', e)
             error_msg = f"Email error: {str(e)}"
             self.logger.error(error_msg)
             return False, error_msg
     
-    def _execute_research_phase(self, topic: str, audience: str) -> Dict[str, Any]:
-        """Execute research using multiple tools"""
-        
-        research_results = {
-            'web_search': None,
-            'trending_topics': None,
-            'statistics': None
-        }
-        
-    
-        try:
-            research_results['web_search'] = self.tools.search_web(topic)
-            self.logger.info(f"✓ Web search completed for: {topic}")
-        except Exception as e:
-            self.logger.warning(f"Web search failed: {e}")
-        
-        
-        try:
-            
-            industry = audience.split()[0] if audience else 'technology'
-            research_results['trending_topics'] = self.tools.get_trending_topics(industry)
-            self.logger.info(f"✓ Trending topics retrieved for: {industry}")
-        except Exception as e:
-            self.logger.warning(f"Trending topics failed: {e}")
-        
-        
-        try:
-            research_results['statistics'] = self.tools.fetch_statistics(topic)
-            self.logger.info(f"✓ Statistics fetched for: {topic}")
-        except Exception as e:
-            self.logger.warning(f"Statistics fetch failed: {e}")
-        
-        return research_results
-    
-    def _validate_quality(self, post: Dict, target_length: str) -> Dict[str, Any]:
-        """Validate post quality"""
-        
-        quality_metrics = {
-            'score': 0.0,
-            'checks': {}
-        }
-        
+    def _execute_research_phase(self, topic: str, audience: str, block: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Research bundle (web search, statistics, trending topics) from the
+        research cache. Slightly stale bundles are returned immediately and
+        refreshed in the background; on a cold miss the bundle is fetched in
+        the background (the agent's own tool calls for the topic wait for that
+        load) and only the cached parts are returned unless block=True.
+        """
+        industry = audience.split()[0] if audience else 'technology'
+        bundle = self.research_cache.get_bundle(topic, industry, block=block,
+                                                timeout=budget(10.0) if block else 10.0)
+        if bundle is None:
+            self.logger.info(f"🔎 No cached research for: {topic} ({industry}), fetching in background")
+        elif not bundle['topic_cached']:
+            self.logger.info(f"🔎 Trending topics cached for {industry}, fetching research for: {topic} in background")
+        else:
+            self.logger.info(f"✓ Research bundle for: {topic} ({industry}), {bundle['age_seconds']:.0f}s old")
+        return bundle
     
-        if post.get('title'):
-            quality_metrics['checks']['has_title'] = True
-            quality_metrics['score'] += 20
-        
-        
-        content = post.get('content', '')
-        if len(content) > 100:
-            quality_metrics['checks']['has_content'] = True
-            quality_metrics['score'] += 30
-        
-        
-        word_count = len(content.split())
-        length_targets = {"short": 150, "medium": 300, "long": 500}
-        target = length_targets.get(target_length, 300)
-        
-        if abs(word_count - target) < 100:
-            quality_metrics['checks']['appropriate_length'] = True
-            quality_metrics['score'] += 20
-        
-        
-        if post.get('hashtags') and len(post['hashtags']) >= 3:
-            quality_metrics['checks']['has_hashtags'] = True
-            quality_metrics['score'] += 15
-        
-        
-        if post.get('call_to_action'):
-            quality_metrics['checks']['has_cta'] = True
-            quality_metrics['score'] += 15
-        
-        quality_metrics['score'] = min(quality_metrics['score'], 100)
-        quality_metrics['passed'] = quality_metrics['score'] >= 70
-        
-        return quality_metrics
+    def _validate_quality(self, post: Dict, target_length) -> Dict[str, Any]:
+        """Quality score (0-100), checks and components; target_length is a paragraph count or short/medium/long"""
+        return get_scorer().score(post, target_length)
     
     def get_orchestrator_status(self) -> Dict[str, Any]:
         """Get status of the orchestrator and all agents"""
@@ -247,14 +389,18 @@ class LinkedInAgentOrchestrator:
                 },
                 'tools': {
                     'status': 'ready',
-                    'usage_summary': self.tools.get_tools_usage_summary()
+                    'usage_summary': self.tools.get_tools_usage_summary(),
+                    'host_health': self.tools.get_host_health()
                 }
             },
+            'topic_cache': self.topic_cache.stats() if self.topic_cache is not None else {'enabled': False},
+            'research_cache': self.research_cache.stats(),
             'memory': {
-                'conversations_count': len(self.memory['conversations']),
-                'content_generated_count': len(self.memory['generated_content']),
-                'tools_used_count': len(self.memory['tool_usage']),
-                'decisions_made_count': len(self.memory['agent_decisions'])
+                'conversations_count': self.memory.count('conversations'),
+                'content_generated_count': self.memory.count('generated_content'),
+                'tools_used_count': self.memory.count('tool_usage'),
+                'decisions_made_count': self.memory.count('agent_decisions'),
+                'stats': self.memory.stats()
             },
             'architecture': {
                 'type': 'multi-agent-orchestrated',
@@ -320,7 +466,7 @@ class LinkedInAgentOrchestrator:
                     'tool_definitions': 'TOOL_DEFINITIONS in agent_tools.py',
                     'function_calling': 'model = genai.GenerativeModel(tools=TOOL_DEFINITIONS)',
                     'agent_orchestration': 'orchestrate_post_creation() method',
-                    'memory_management': 'self.memory dictionary'
+                    'memory_management': 'self.memory (AgentMemory)'
                 }
             }
         }
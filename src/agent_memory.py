@@ -0,0 +1,259 @@
+"""
+Agent Memory - bounded orchestrator memory with eviction and persistence
+Per-category capacity limits with LRU/TTL eviction; evicted records can spill
+to an on-disk SQLite store so recent generations stay queryable by topic
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Iterable
+
+
+MEMORY_CATEGORIES = ('conversations', 'generated_content', 'tool_usage', 'agent_decisions')
+
+
+def normalize_topic(topic: str) -> str:
+    """Case/whitespace-insensitive key for topic lookups"""
+    return ' '.join((topic or '').lower().split())
+
+
+class MemoryRecord:
+    """Compact memory entry"""
+
+    __slots__ = ('record_id', 'category', 'topic', 'created_at', 'data')
+
+    def __init__(self, record_id: int, category: str, topic: str, created_at: float, data: Dict[str, Any]):
+        self.record_id = record_id
+        self.category = category
+        self.topic = topic
+        self.created_at = created_at
+        self.data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'topic': self.topic,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.created_at)),
+            **self.data
+        }
+
+
+class SQLiteSpillStore:
+    """On-disk store for records evicted from memory"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS memory_records ("
+                " category TEXT NOT NULL, topic_key TEXT NOT NULL, topic TEXT,"
+                " created_at REAL NOT NULL, data TEXT)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_memory_topic"
+                " ON memory_records (category, topic_key, created_at DESC)"
+            )
+            self._conn.commit()
+
+    def write(self, records: Iterable[MemoryRecord]):
+        rows = [(r.category, normalize_topic(r.topic), r.topic, r.created_at, json.dumps(r.data, default=str))
+                for r in records]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT INTO memory_records VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def query(self, category: str, topic: Optional[str], limit: int,
+              before: Optional[float] = None) -> List[MemoryRecord]:
+        sql = "SELECT category, topic, created_at, data FROM memory_records WHERE category = ?"
+        params: List[Any] = [category]
+        if topic is not None:
+            sql += " AND topic_key = ?"
+            params.append(normalize_topic(topic))
+        if before is not None:
+            sql += " AND created_at < ?"
+            params.append(before)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [MemoryRecord(-1, row[0], row[1], row[2], json.loads(row[3] or '{}')) for row in rows]
+
+    def count(self, category: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM memory_records WHERE category = ?", (category,)
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class AgentMemory:
+    """
+    Bounded, thread-safe agent memory.
+
+    Each category holds at most `capacity` records in LRU order (reads
+    refresh recency). Records older than `ttl_seconds` are expired on write
+    and on read. Evicted/expired records go to the spill store if one is
+    configured, otherwise they are dropped.
+    """
+
+    def __init__(self,
+                 capacity: int = 500,
+                 ttl_seconds: Optional[float] = 7 * 24 * 3600,
+                 spill_path: Optional[str] = None,
+                 capacities: Optional[Dict[str, int]] = None):
+        self.capacities = {category: capacity for category in MEMORY_CATEGORIES}
+        self.capacities.update(capacities or {})
+        self.ttl_seconds = ttl_seconds
+        self.spill = SQLiteSpillStore(spill_path) if spill_path else None
+
+        self._records: Dict[str, "OrderedDict[int, MemoryRecord]"] = {
+            category: OrderedDict() for category in self.capacities
+        }
+        # category -> topic key -> ordered record ids (oldest first)
+        self._topic_index: Dict[str, Dict[str, "OrderedDict[int, None]"]] = {
+            category: {} for category in self.capacities
+        }
+        self.sweep_interval = min(60.0, ttl_seconds / 100) if ttl_seconds else 0.0
+        self._last_sweep: Dict[str, float] = {}
+        self._next_id = 0
+        self._evicted = 0
+        self._lock = threading.Lock()
+        self.spill_batch_size = 64
+        self._spill_buffer: List[MemoryRecord] = []
+        self._spilled: Dict[str, int] = {}
+        self._spill_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def add(self, category: str, topic: str = '', **data) -> MemoryRecord:
+        """Store a record and evict whatever no longer fits"""
+        with self._lock:
+            if category not in self._records:
+                self._records[category] = OrderedDict()
+                self._topic_index[category] = {}
+                self.capacities.setdefault(category, max(self.capacities.values(), default=500))
+            self._next_id += 1
+            record = MemoryRecord(self._next_id, category, topic, time.time(), data)
+            self._records[category][record.record_id] = record
+            self._topic_index[category].setdefault(normalize_topic(topic), OrderedDict())[record.record_id] = None
+
+            evicted = self._expire_locked(category)
+            records = self._records[category]
+            while len(records) > self.capacities[category]:
+                _, oldest = records.popitem(last=False)
+                self._unindex_locked(oldest)
+                evicted.append(oldest)
+            self._evicted += len(evicted)
+
+        if evicted and self.spill is not None:
+            self._spill(evicted)
+        return record
+
+    def _spill(self, records: List[MemoryRecord], flush: bool = False):
+        """Buffer evicted records and write them to disk in batches"""
+        with self._spill_lock:
+            self._spill_buffer.extend(records)
+            if not self._spill_buffer or (not flush and len(self._spill_buffer) < self.spill_batch_size):
+                return
+            batch, self._spill_buffer = self._spill_buffer, []
+            try:
+                self.spill.write(batch)
+                for record in batch:
+                    self._spilled[record.category] = self._spilled.get(record.category, 0) + 1
+            except sqlite3.Error as e:
+                self.logger.warning(f"Memory spill failed: {e}")
+
+    def flush(self):
+        """Write any buffered evictions to the spill store"""
+        if self.spill is not None:
+            self._spill([], flush=True)
+
+    def recent(self, category: str, topic: Optional[str] = None, limit: int = 10,
+               include_spilled: bool = True) -> List[Dict[str, Any]]:
+        """
+        Most recent records of a category, optionally for one topic.
+        Served from memory via the topic index, topped up from the spill store.
+        """
+        with self._lock:
+            expired = self._expire_locked(category) if category in self._records else []
+            records = self._records.get(category, OrderedDict())
+            if topic is None:
+                candidates = list(records.values())
+            else:
+                ids = self._topic_index.get(category, {}).get(normalize_topic(topic), {})
+                candidates = [records[record_id] for record_id in ids if record_id in records]
+            if self.ttl_seconds:
+                cutoff = time.time() - self.ttl_seconds
+                candidates = [record for record in candidates if record.created_at >= cutoff]
+            # LRU order != creation order, so sort the (bounded) candidate list
+            candidates.sort(key=lambda r: r.created_at, reverse=True)
+            found = candidates[:limit]
+            for record in found:
+                records.move_to_end(record.record_id)
+
+        if self.spill is not None:
+            self._spill(expired, flush=include_spilled)
+            if include_spilled:
+                # LRU eviction can spill records newer than ones still in memory
+                found.extend(self.spill.query(category, topic, limit))
+                found.sort(key=lambda r: r.created_at, reverse=True)
+                found = found[:limit]
+        return [record.to_dict() for record in found]
+
+    def recent_generations(self, topic: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Recent generated posts, optionally filtered by topic"""
+        return self.recent('generated_content', topic=topic, limit=limit)
+
+    def count(self, category: str) -> int:
+        with self._lock:
+            return len(self._records.get(category, ()))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters only - no flush or disk query, so it is cheap enough for every UI rerun"""
+        with self._lock:
+            stats = {
+                'in_memory': {category: len(records) for category, records in self._records.items()},
+                'capacities': dict(self.capacities),
+                'ttl_seconds': self.ttl_seconds,
+                'evicted_total': self._evicted,
+            }
+        if self.spill is not None:
+            with self._spill_lock:
+                # Written to disk by this process (earlier runs' rows are not counted)
+                stats['spilled'] = {category: self._spilled.get(category, 0) for category in stats['in_memory']}
+                stats['spill_pending'] = len(self._spill_buffer)
+        return stats
+
+    def _expire_locked(self, category: str) -> List[MemoryRecord]:
+        if not self.ttl_seconds:
+            return []
+        # Full scans are amortised: at most one per category per sweep interval
+        now = time.time()
+        if now - self._last_sweep.get(category, 0.0) < self.sweep_interval:
+            return []
+        self._last_sweep[category] = now
+        cutoff = now - self.ttl_seconds
+        records = self._records[category]
+        expired = [record for record in records.values() if record.created_at < cutoff]
+        for record in expired:
+            del records[record.record_id]
+            self._unindex_locked(record)
+        return expired
+
+    def _unindex_locked(self, record: MemoryRecord):
+        index = self._topic_index[record.category]
+        key = normalize_topic(record.topic)
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(record.record_id, None)
+            if not ids:
+                del index[key]
@@ -3,34 +3,312 @@ Agent Tools - LangChain Tool Definitions
 Real agent framework tools for LangChain
 """
 
-import requests
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 import json
+import functools
+import threading
+import time
+from collections import deque
+from itertools import islice
+from contextlib import contextmanager
+from contextvars import ContextVar
+from urllib.parse import urlparse, quote
 
+try:
+    from src.config import get_secret
+    from src.metrics import GENERATION_LATENCY, TOOL_HTTP_LATENCY, record_error
+    from src.tracing import tracer
+    from src.search_backends import create_search_backends
+    from src.wiki_store import WikiSummaryStore, numeric_sentences
+    from src.deadlines import budget
+    from src.hedging import LatencyTracker, hedged_call
+    from src.host_health import HostHealthTracker
+    from src.sentiment import get_analyzer
+    from src.insights import extract_key_insights
+except ImportError:
+    from config import get_secret
+    from metrics import GENERATION_LATENCY, TOOL_HTTP_LATENCY, record_error
+    from tracing import tracer
+    from search_backends import create_search_backends
+    from wiki_store import WikiSummaryStore, numeric_sentences
+    from deadlines import budget
+    from hedging import LatencyTracker, hedged_call
+    from host_health import HostHealthTracker
+    from sentiment import get_analyzer
+    from insights import extract_key_insights
 
-from langchain_core.tools import Tool
-from pydantic import BaseModel, Field
+if TYPE_CHECKING:
+    from langchain_core.tools import Tool
 
 
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
-    BeautifulSoup = None
+def _timed_tool(func):
+    """Record the duration of a tool call under the 'tool' generation phase"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            with tracer.span(f'tool.{func.__name__}') as span:
+                result = func(*args, **kwargs)
+                if isinstance(result, dict):
+                    source = result.get('source') or result.get('data_source')
+                    if source:
+                        span.set_attribute('tool.source', source)
+                return result
+        finally:
+            GENERATION_LATENCY.observe(time.perf_counter() - start, phase='tool')
+    return wrapper
+
+
+# requests is imported on first use to keep module import cheap
+_http_local = threading.local()
+
+
+def _http_session():
+    """
+    Per-thread requests.Session so keep-alive connections are pooled and
+    reused without sharing a Session object across threads
+    """
+    session = getattr(_http_local, 'session', None)
+    if session is None:
+        import requests
+        
+        session = requests.Session()
+        _http_local.session = session
+    return session
+
+
+# Hedging: a request slower than the host's recent p95 gets a second attempt
+_host_latency = LatencyTracker()
+
+
+@functools.lru_cache(maxsize=None)
+def _hedge_settings() -> Dict[str, Any]:
+    """Hedging config, read on the first request rather than at import (get_secret imports streamlit)"""
+    return {
+        'enabled': str(get_secret('HTTP_HEDGING', 'true')).lower() not in ('0', 'false', 'no'),
+        'default_delay': float(get_secret('HEDGE_DEFAULT_DELAY_MS', 1000)) / 1000,
+        'min_delay': float(get_secret('HEDGE_MIN_DELAY_MS', 50)) / 1000
+    }
+
+
+# Host health: failing hosts cool down, failed URLs are negatively cached
+_host_health: Optional[HostHealthTracker] = None
+_host_health_lock = threading.Lock()
+
+
+def _get_host_health() -> HostHealthTracker:
+    """Process-wide host health tracker, configured on first use"""
+    global _host_health
+    if _host_health is None:
+        with _host_health_lock:
+            if _host_health is None:
+                _host_health = HostHealthTracker(
+                    failure_threshold=int(get_secret('HOST_FAILURE_THRESHOLD', 3)),
+                    base_cooldown=float(get_secret('HOST_COOLDOWN_SECONDS', 30)),
+                    max_cooldown=float(get_secret('HOST_MAX_COOLDOWN_SECONDS', 600)),
+                    negative_ttl=float(get_secret('NEGATIVE_CACHE_TTL_SECONDS', 60))
+                )
+    return _host_health
+
+
+def _retry_after(response) -> Optional[float]:
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _is_timeout(error: BaseException) -> bool:
+    import requests
+    return isinstance(error, (TimeoutError, requests.exceptions.Timeout))
+
+
+def _http_get(tool: str, url: str, timeout: float = 5.0, hedge: bool = True, **kwargs):
+    """
+    HTTP GET on the pooled session with per-host latency recorded for the calling tool.
+    Raises EndpointUnavailable without a request if the host is cooling down or
+    the URL failed recently. The timeout is capped by the request deadline
+    (DeadlineExceeded when it is used up), and idempotent GETs are hedged after
+    the host's p95 latency. A timeout under a deadline-capped budget is not
+    counted against the host - the request ran out of time, not the host.
+    """
+    host = urlparse(url).netloc
+    span = tracer.current_span()
+    if span is not None:
+        span.set_attribute('http.host', host)
+    host_health = _get_host_health()
+    host_health.check(host, url)
+    requested = timeout
+    timeout = budget(timeout, minimum=0.05)
+    capped = timeout < requested
+    
+    def attempt():
+        start = time.perf_counter()
+        try:
+            with TOOL_HTTP_LATENCY.time(tool=tool, host=host):
+                return _http_session().get(url, timeout=timeout, **kwargs)
+        finally:
+            _host_latency.observe(host, time.perf_counter() - start)
+    
+    try:
+        settings = _hedge_settings()
+        if hedge and settings['enabled']:
+            p95 = _host_latency.percentile(host)
+            delay = max(settings['min_delay'], p95) if p95 is not None else settings['default_delay']
+            response, hedge_won = hedged_call(attempt, delay, timeout, tool=tool, discard=lambda r: r.close())
+            if span is not None and hedge_won:
+                span.set_attribute('http.hedge_won', True)
+        else:
+            response = attempt()
+    except Exception as e:
+        if not (capped and _is_timeout(e)):
+            host_health.record_failure(host, type(e).__name__, url)
+        raise
+    
+    status = response.status_code
+    if status in (403, 429) or status >= 500:
+        # Rate limited, blocked or broken: count against the host
+        host_health.record_failure(host, f"HTTP {status}", url, retry_after=_retry_after(response))
+    else:
+        host_health.record_success(host)
+        if status >= 400:
+            host_health.record_miss(url)
+    if span is not None:
+        span.set_attribute('http.status_code', status)
+    return response
+
+
+class ToolUsageLog:
+    """
+    Fixed-capacity, thread-safe log of tool calls.
+    Keeps the most recent `capacity` entries in a ring buffer and maintains
+    all-time per-tool counters incrementally, so memory stays constant and
+    summaries do not rescan the log.
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._entries = deque(maxlen=capacity)
+        self._counts: Dict[str, int] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+    
+    def append(self, usage: Dict[str, Any]):
+        with self._lock:
+            self._entries.append(usage)
+            tool_name = usage['tool']
+            self._counts[tool_name] = self._counts.get(tool_name, 0) + 1
+            self._total += 1
+    
+    def recent(self, n: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(islice(reversed(self._entries), n))[::-1]
+    
+    def summary(self, recent: int = 10) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'total_calls': self._total,
+                'tools_breakdown': dict(self._counts),
+                'execution_log': list(islice(reversed(self._entries), recent))[::-1]
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ToolInvocationContext:
+    """
+    Per-invocation tool state (which tools ran, with what input).
+    Lives for one agent run so shared AgentTools instances stay stateless
+    from the caller's point of view.
+    """
+    
+    def __init__(self):
+        self.tools_used: List[Dict[str, Any]] = []
+    
+    def tool_names(self) -> List[str]:
+        return [usage['tool'] for usage in self.tools_used]
+
+
+_current_invocation: ContextVar[Optional[ToolInvocationContext]] = ContextVar('tool_invocation', default=None)
+
+
+@contextmanager
+def tool_invocation():
+    """
+    Open a per-invocation context; tool calls made inside it (including
+    from LangGraph worker threads, which copy the context) are recorded on it
+    """
+    context = ToolInvocationContext()
+    token = _current_invocation.set(context)
+    try:
+        yield context
+    finally:
+        _current_invocation.reset(token)
 
 
 class AgentTools:
     """Collection of tools that the AI agent can call"""
     
-    def __init__(self):
-        self.tools_used = []
+    def __init__(self, usage_log_capacity: Optional[int] = None):
+        if usage_log_capacity is None:
+            usage_log_capacity = int(get_secret('TOOL_USAGE_LOG_SIZE', 1000))
+        self.usage_log = ToolUsageLog(usage_log_capacity)
+        
+        # Endpoints are overridable so tools can run against local stubs
+        self.search_endpoint = get_secret('SEARCH_ENDPOINT', 'https://html.duckduckgo.com/html/')
+        self.github_api_endpoint = get_secret('GITHUB_API_ENDPOINT', 'https://api.github.com')
+        self.wikipedia_api_endpoint = get_secret('WIKIPEDIA_API_ENDPOINT', 'https://en.wikipedia.org/api/rest_v1')
+        self.search_result_limit = 3
+        self.search_backends = create_search_backends(
+            get_secret('SEARCH_BACKEND', 'duckduckgo'),
+            endpoint=self.search_endpoint,
+            http_get=_http_get,
+            index_path=get_secret('SEARCH_INDEX_PATH', 'search_index.db')
+        )
+        
+        # Offline mode (air-gapped): tools only use local data sources
+        self.offline = str(get_secret('OFFLINE_MODE', 'false')).lower() in ('1', 'true', 'yes')
+        if self.offline:
+            self.search_backends = [backend for backend in self.search_backends if not backend.requires_network]
+        self.wiki_store = None
+        wiki_store_path = get_secret('WIKIPEDIA_STORE_PATH')
+        if wiki_store_path:
+            try:
+                self.wiki_store = WikiSummaryStore(wiki_store_path)
+            except (OSError, ValueError) as e:
+                record_error('agent_tools', e)
+        # Set by the orchestrator: search_web/fetch_statistics reuse its in-flight topic loads
+        self.research_cache = None
+    
+    def _shared_research(self, topic: str, part: str) -> Optional[Dict[str, Any]]:
+        """The research cache's result for this topic, waiting for a load already in flight"""
+        if self.research_cache is None:
+            return None
+        return self.research_cache.shared_result(topic, part, timeout=budget(5.0))
+    
+    def get_host_health(self) -> Dict[str, Any]:
+        """Health, cooldowns and negative-cache size of the tool endpoints"""
+        return _get_host_health().status()
+    
+    @property
+    def tools_used(self) -> List[Dict[str, Any]]:
+        """Snapshot of the most recent tool calls (bounded by the log capacity)"""
+        return self.usage_log.recent(len(self.usage_log))
     
+    def _record_usage(self, usage: Dict[str, Any]):
+        """Record a tool call on the instance log and the current invocation"""
+        self.usage_log.append(usage)
+        context = _current_invocation.get()
+        if context is not None:
+            context.tools_used.append(usage)
+    
+    @_timed_tool
     def search_web(self, query: str) -> Dict[str, Any]:
         """
-        Search the web for information using DuckDuckGo (no API key needed)
-        Falls back to simulated results if search fails
+        Search using the configured backends (DuckDuckGo, local index) in order
+        Falls back to simulated results if every backend fails or finds nothing
         
         Args:
             query: Search query string
@@ -38,48 +316,30 @@ class AgentTools:
         Returns:
             Dict with search results
         """
-        self.tools_used.append({
+        self._record_usage({
             'tool': 'search_web',
             'query': query,
             'timestamp': datetime.now().isoformat()
         })
         
-        try:
+        shared = self._shared_research(query, 'web_search')
+        if shared is not None:
+            return shared
         
-            search_url = f"https://html.duckduckgo.com/html/?q={requests.utils.quote(query)}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(search_url, headers=headers, timeout=5)
-            
-            if response.status_code == 200 and BS4_AVAILABLE:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                results = []
-                
-
-                for result in soup.find_all('div', class_='result')[:3]:
-                    title_elem = result.find('a', class_='result__a')
-                    snippet_elem = result.find('a', class_='result__snippet')
-                    
-                    if title_elem:
-                        results.append({
-                            'title': title_elem.get_text(strip=True),
-                            'snippet': snippet_elem.get_text(strip=True) if snippet_elem else 'No snippet available',
-                            'url': title_elem.get('href', 'N/A')
-                        })
-                
-                if results:
-                    return {
-                        'success': True,
-                        'query': query,
-                        'results': results,
-                        'search_time': '0.42 seconds',
-                        'source': 'DuckDuckGo (Real Search)'
-                    }
-        except Exception as e:
-    
-            pass
+        for backend in self.search_backends:
+            try:
+                results = backend.search(query, self.search_result_limit)
+            except Exception as e:
+                record_error('agent_tools', e)
+                continue
+            if results:
+                return {
+                    'success': True,
+                    'query': query,
+                    'results': results,
+                    'search_time': '0.42 seconds',
+                    'source': backend.source
+                }
         
         
         return {
@@ -106,6 +366,7 @@ class AgentTools:
             'source': 'Simulated (Fallback)'
         }
     
+    @_timed_tool
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """
         Analyze sentiment of given text
@@ -116,39 +377,33 @@ class AgentTools:
         Returns:
             Sentiment analysis results
         """
-        self.tools_used.append({
+        self._record_usage({
             'tool': 'analyze_sentiment',
             'text_length': len(text),
             'timestamp': datetime.now().isoformat()
         })
         
+        return get_analyzer().analyze(text)
+    
+    @_timed_tool
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of many texts in one call
         
-        positive_words = ['great', 'excellent', 'amazing', 'wonderful', 'fantastic', 
-                         'innovative', 'success', 'growth', 'opportunity']
-        negative_words = ['bad', 'poor', 'terrible', 'failure', 'decline', 
-                         'problem', 'issue', 'crisis']
-        
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-        
-        if positive_count > negative_count:
-            sentiment = 'positive'
-            score = min(0.5 + (positive_count * 0.1), 1.0)
-        elif negative_count > positive_count:
-            sentiment = 'negative'
-            score = max(0.5 - (negative_count * 0.1), 0.0)
-        else:
-            sentiment = 'neutral'
-            score = 0.5
-        
-        return {
-            'sentiment': sentiment,
-            'score': score,
-            'positive_indicators': positive_count,
-            'negative_indicators': negative_count
-        }
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            Sentiment analysis results, in input order
+        """
+        self._record_usage({
+            'tool': 'analyze_sentiment',
+            'batch_size': len(texts),
+            'timestamp': datetime.now().isoformat()
+        })
+        return get_analyzer().analyze_batch(texts)
     
+    @_timed_tool
     def get_trending_topics(self, industry: str) -> Dict[str, Any]:
         """
         Get trending topics using real GitHub trending repos as proxy
@@ -160,7 +415,7 @@ class AgentTools:
         Returns:
             Trending topics data
         """
-        self.tools_used.append({
+        self._record_usage({
             'tool': 'get_trending_topics',
             'industry': industry,
             'timestamp': datetime.now().isoformat()
@@ -168,9 +423,9 @@ class AgentTools:
         
         try:
             
-            if 'tech' in industry.lower() or 'ai' in industry.lower():
-                github_url = "https://api.github.com/search/repositories?q=stars:>1000&sort=stars&order=desc&per_page=5"
-                response = requests.get(github_url, timeout=5)
+            if not self.offline and ('tech' in industry.lower() or 'ai' in industry.lower()):
+                github_url = f"{self.github_api_endpoint}/search/repositories?q=stars:>1000&sort=stars&order=desc&per_page=5"
+                response = _http_get('get_trending_topics', github_url, timeout=5)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -191,8 +446,8 @@ class AgentTools:
                             'confidence': 0.92,
                             'source': 'GitHub Trending (Real Data)'
                         }
-        except Exception:
-            pass
+        except Exception as e:
+            record_error('agent_tools', e)
         
         
         trending_data = {
@@ -215,10 +470,11 @@ class AgentTools:
             'source': 'Curated Industry Data (Fallback)'
         }
     
+    @_timed_tool
     def fetch_statistics(self, topic: str) -> Dict[str, Any]:
         """
-        Fetch relevant statistics using Wikipedia API (real data source)
-        Falls back to simulated data if API fails
+        Fetch relevant statistics from the local Wikipedia store if configured,
+        then the Wikipedia API (skipped in offline mode), then simulated data
         
         Args:
             topic: Topic to get statistics for
@@ -226,29 +482,35 @@ class AgentTools:
         Returns:
             Statistics data
         """
-        self.tools_used.append({
+        self._record_usage({
             'tool': 'fetch_statistics',
             'topic': topic,
             'timestamp': datetime.now().isoformat()
         })
         
+        shared = self._shared_research(topic, 'statistics')
+        if shared is not None:
+            return shared
+        
+        if self.wiki_store is not None:
+            record = self.wiki_store.lookup(topic)
+            if record and record['statistics']:
+                return {
+                    'topic': topic,
+                    'statistics': record['statistics'],
+                    'sources': ['Wikipedia', f"Local summary store ({record['title']})"],
+                    'last_updated': datetime.now().isoformat(),
+                    'data_source': 'Wikipedia Local Store (Offline)'
+                }
+        
         try:
             
-            wiki_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{requests.utils.quote(topic)}"
-            response = requests.get(wiki_url, timeout=5)
+            wiki_url = f"{self.wikipedia_api_endpoint}/page/summary/{quote(topic)}"
+            response = None if self.offline else _http_get('fetch_statistics', wiki_url, timeout=5)
             
-            if response.status_code == 200:
+            if response is not None and response.status_code == 200:
                 data = response.json()
-                extract = data.get('extract', '')
-                
-                
-                statistics = []
-                if extract:
-            
-                    sentences = extract.split('. ')
-                    for sentence in sentences[:4]:
-                        if any(char.isdigit() for char in sentence):
-                            statistics.append(sentence.strip())
+                statistics = numeric_sentences(data.get('extract', ''), limit=4)
                 
                 if statistics:
                     return {
@@ -259,8 +521,7 @@ class AgentTools:
                         'data_source': 'Wikipedia API (Real Data)'
                     }
         except Exception as e:
-    
-            pass
+            record_error('agent_tools', e)
         
 
         return {
@@ -277,6 +538,7 @@ class AgentTools:
             'data_source': 'Simulated (Fallback)'
         }
     
+    @_timed_tool
     def extract_key_insights(self, content: str) -> Dict[str, Any]:
         """
         Extract key insights from content
@@ -287,41 +549,17 @@ class AgentTools:
         Returns:
             Key insights
         """
-        self.tools_used.append({
+        self._record_usage({
             'tool': 'extract_key_insights',
             'content_length': len(content),
             'timestamp': datetime.now().isoformat()
         })
         
-
-        sentences = content.split('.')
-        insights = []
-        
-        keywords = ['important', 'key', 'critical', 'essential', 'significant', 
-                   'major', 'primary', 'crucial', 'vital']
-        
-        for sentence in sentences[:10]:  
-            if any(keyword in sentence.lower() for keyword in keywords):
-                insights.append(sentence.strip())
-        
-        return {
-            'insights': insights[:5],  
-            'total_analyzed': len(sentences),
-            'confidence': 0.75
-        }
+        return extract_key_insights(content)
     
     def get_tools_usage_summary(self) -> Dict[str, Any]:
         """Get summary of tools used by agent"""
-        tool_counts = {}
-        for usage in self.tools_used:
-            tool_name = usage['tool']
-            tool_counts[tool_name] = tool_counts.get(tool_name, 0) + 1
-        
-        return {
-            'total_calls': len(self.tools_used),
-            'tools_breakdown': tool_counts,
-            'execution_log': self.tools_used[-10:] 
-        }
+        return self.usage_log.summary(recent=10)
 
 
 TOOL_DEFINITIONS = [
@@ -399,12 +637,15 @@ TOOL_DEFINITIONS = [
 
 
 
-def create_langchain_tools() -> List[Tool]:
+def create_langchain_tools(tools_instance: Optional[AgentTools] = None) -> List["Tool"]:
     """
     Create LangChain tools from our agent tools
     This enables REAL agent framework usage
     """
-    tools_instance = AgentTools()
+    from langchain_core.tools import Tool
+    
+    if tools_instance is None:
+        tools_instance = AgentTools()
     
     return [
         Tool(
@@ -433,3 +674,31 @@ def create_langchain_tools() -> List[Tool]:
             description="Extract key insights from content. Input should be text content. Returns list of important insights."
         )
     ]
+
+
+_shared_tools_instance: Optional[AgentTools] = None
+_shared_tool_registry: Optional[tuple] = None
+_registry_lock = threading.Lock()
+
+
+def get_shared_tools_instance() -> AgentTools:
+    """Process-wide AgentTools instance backing the shared tool registry"""
+    global _shared_tools_instance
+    with _registry_lock:
+        if _shared_tools_instance is None:
+            _shared_tools_instance = AgentTools()
+        return _shared_tools_instance
+
+
+def get_tool_registry() -> tuple:
+    """
+    Immutable, process-wide tuple of LangChain tools. Built once and shared
+    by every agent; per-run state goes through tool_invocation() instead.
+    """
+    global _shared_tool_registry
+    if _shared_tool_registry is None:
+        tools_instance = get_shared_tools_instance()
+        with _registry_lock:
+            if _shared_tool_registry is None:
+                _shared_tool_registry = tuple(create_langchain_tools(tools_instance))
+    return _shared_tool_registry
@@ -0,0 +1,58 @@
+"""
+Deadlines - per-request time budgets that propagate to the tools
+The orchestrator opens a deadline for a generation; tools and HTTP calls
+ask for the remaining budget instead of using fixed timeouts. The deadline
+lives in a ContextVar, so it follows the request into LangGraph tool threads.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request's time budget is used up"""
+
+
+# Absolute time.monotonic() value, None when no deadline is set
+_deadline: ContextVar[Optional[float]] = ContextVar('deadline', default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """
+    Run a block with a time budget. Nested deadlines can only shorten the
+    budget; seconds=None keeps the enclosing one.
+    """
+    current = _deadline.get()
+    if seconds is None:
+        new = current
+    else:
+        new = time.monotonic() + seconds
+        if current is not None:
+            new = min(new, current)
+    token = _deadline.set(new)
+    try:
+        yield new
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current deadline, None if there is none"""
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+def budget(default: float, minimum: float = 0.0) -> float:
+    """
+    Timeout for the next operation: `default` capped by the remaining budget.
+    Raises DeadlineExceeded when less than `minimum` seconds are left.
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= minimum:
+        raise DeadlineExceeded(f"Deadline exceeded ({left:.3f}s left)")
+    return min(default, left)
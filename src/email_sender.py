@@ -13,6 +13,7 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import json
+import time
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,8 +21,10 @@ load_dotenv()
 
 try:
     from src.config import get_secret
+    from src.metrics import SMTP_SEND_LATENCY, record_error
 except ImportError:
     from config import get_secret
+    from metrics import SMTP_SEND_LATENCY, record_error
 
 class EmailSender:
     """
@@ -38,8 +41,9 @@ class EmailSender:
             raise ValueError("Email credentials not found. Please set EMAIL_SENDER and EMAIL_PASSWORD in .env file")
         
     
-        self.smtp_server = "smtp.gmail.com"
-        self.smtp_port = 587
+        self.smtp_server = get_secret('SMTP_SERVER', "smtp.gmail.com")
+        self.smtp_port = int(get_secret('SMTP_PORT', 587))
+        self.smtp_starttls = str(get_secret('SMTP_STARTTLS', 'true')).lower() not in ('0', 'false', 'no')
         
         
         logging.basicConfig(level=logging.INFO)
@@ -369,12 +373,15 @@ LinkedIn Agent
         Returns: (success: bool, message: str)
         """
         server = None
+        outcome = 'error'
+        started = time.perf_counter()
         try:
             self.logger.info(f"Connecting to SMTP server: {self.smtp_server}:{self.smtp_port}")
             server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=10)
             
-            self.logger.info("SMTP connection established, starting TLS...")
-            server.starttls()  # Enable security
+            if self.smtp_starttls:
+                self.logger.info("SMTP connection established, starting TLS...")
+                server.starttls()  # Enable security
             
             self.logger.info("Logging in with email credentials...")
             server.login(self.sender_email, self.sender_password)
@@ -384,25 +391,31 @@ LinkedIn Agent
             server.sendmail(self.sender_email, recipient, text)
             
             self.logger.info("Email sent successfully, closing connection...")
+            outcome = 'success'
             return True, "Email sent successfully"
             
         except smtplib.SMTPAuthenticationError as e:
+            record_error('email_sender', e)
             error_msg = "SMTP Authentication failed - Invalid EMAIL_PASSWORD or EMAIL_SENDER"
             self.logger.error(f"{error_msg}: {e}")
             return False, error_msg
         except smtplib.SMTPException as e:
+            record_error('email_sender', e)
             error_msg = f"SMTP error occurred: {str(e)}"
             self.logger.error(error_msg)
             return False, error_msg
         except TimeoutError as e:
+            record_error('email_sender', e)
             error_msg = "Connection timeout - SMTP server took too long to respond"
             self.logger.error(error_msg)
             return False, error_msg
         except Exception as e:
+            record_error('email_sender', e)
             error_msg = f"Failed to send email: {str(e)}"
             self.logger.error(error_msg)
             return False, error_msg
         finally:
+            SMTP_SEND_LATENCY.observe(time.perf_counter() - started, outcome=outcome)
             if server:
                 try:
                     server.quit()
@@ -521,7 +534,8 @@ LinkedIn Agent
         """
         try:
             server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
+            if self.smtp_starttls:
+                server.starttls()
             server.login(self.sender_email, self.sender_password)
             server.quit()
             
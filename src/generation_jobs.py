@@ -0,0 +1,180 @@
+"""
+Generation Jobs - post orchestrations that outlive a Streamlit script run
+Jobs run on one executor shared by all sessions and are keyed by client and
+request hash: submitting the same request again (a rerun, a double click, a
+reconnected websocket) returns the job already queued or running instead of
+starting another LLM run. A finished job keeps its result until the UI
+fetches it; unfetched results are dropped after GENERATION_JOB_TTL_SECONDS.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+try:
+    from src.config import get_secret
+    from src.metrics import GENERATION_JOBS, record_error
+except ImportError:
+    from config import get_secret
+    from metrics import GENERATION_JOBS, record_error
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = 'queued', 'running', 'succeeded', 'failed'
+
+
+def request_hash(params: Dict[str, Any]) -> str:
+    """Stable hash of the generation parameters (strings compared case- and whitespace-insensitively)"""
+    normalized = {key: ' '.join(value.lower().split()) if isinstance(value, str) else value
+                  for key, value in params.items()}
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+
+class GenerationJob:
+    """One submitted generation and, once finished, its result or error"""
+
+    __slots__ = ('job_id', 'client_id', 'request_hash', 'params', 'status', 'submitted_at',
+                 'started_at', 'finished_at', 'result', 'error')
+
+    def __init__(self, client_id: str, params: Dict[str, Any]):
+        self.job_id = uuid.uuid4().hex
+        self.client_id = client_id
+        self.request_hash = request_hash(params)
+        self.params = dict(params)
+        self.status = QUEUED
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started running (0 while queued)"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'params': dict(self.params),
+            'queued_seconds': round((self.started_at or time.time()) - self.submitted_at, 2),
+            'elapsed_seconds': round(self.elapsed, 2),
+            'error': self.error
+        }
+
+
+class GenerationJobManager:
+    """Runs generation jobs on a shared executor, deduplicated per client and request"""
+
+    def __init__(self, workers: int = 4, result_ttl_seconds: float = 3600.0):
+        self.result_ttl_seconds = result_ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='generation-job')
+        self._jobs: Dict[str, GenerationJob] = {}
+        self._by_request: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        self.stats = {'submitted': 0, 'deduplicated': 0, 'succeeded': 0, 'failed': 0, 'expired': 0}
+
+    def submit(self, client_id: str, params: Dict[str, Any], run: Callable[[], Dict[str, Any]]) -> GenerationJob:
+        """
+        Queue run() for this client and request, or return the unfetched job
+        already submitted for it (failed jobs are replaced, so a retry runs again)
+        """
+        key = (client_id, request_hash(params))
+        with self._lock:
+            self._expire()
+            existing = self._jobs.get(self._by_request.get(key, ''))
+            if existing is not None and existing.status != FAILED:
+                self.stats['deduplicated'] += 1
+                GENERATION_JOBS.inc(event='deduplicated')
+                return existing
+            job = GenerationJob(client_id, params)
+            self._jobs[job.job_id] = job
+            self._by_request[key] = job.job_id
+            self.stats['submitted'] += 1
+        GENERATION_JOBS.inc(event='submitted')
+        self._executor.submit(copy_context().run, self._run, job, run)
+        logging.getLogger(__name__).info(f"🧵 Job {job.job_id[:8]} queued for '{params.get('topic', '')}'")
+        return job
+
+    def _run(self, job: GenerationJob, run: Callable[[], Dict[str, Any]]):
+        job.started_at = time.time()
+        job.status = RUNNING
+        status = FAILED
+        try:
+            job.result = run()
+            status = SUCCEEDED
+        except Exception as e:
+            record_error('generation_job', e)
+            logging.getLogger(__name__).exception(f"❌ Job {job.job_id[:8]} failed")
+            job.error = str(e)
+        finally:
+            # finished_at first: pollers and _expire treat the job as done once status flips
+            job.finished_at = time.time()
+            with self._lock:
+                job.status = status
+                self.stats[status] += 1
+            GENERATION_JOBS.inc(event=status)
+
+    def get(self, job_id: Optional[str]) -> Optional[GenerationJob]:
+        """Job by id, or None if unknown, fetched or expired"""
+        return self._jobs.get(job_id or '')
+
+    def find(self, client_id: str, params: Dict[str, Any]) -> Optional[GenerationJob]:
+        """This client's unfetched job for the request, if any"""
+        return self._jobs.get(self._by_request.get((client_id, request_hash(params)), ''))
+
+    def jobs_for(self, client_id: str) -> List[GenerationJob]:
+        """This client's unfetched jobs, oldest first"""
+        with self._lock:
+            return sorted((job for job in self._jobs.values() if job.client_id == client_id),
+                          key=lambda job: job.submitted_at)
+
+    def fetch(self, job_id: str) -> Optional[GenerationJob]:
+        """Hand over a finished job and forget it; None while it is still queued or running"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.done:
+                return None
+            self._forget(job)
+        return job
+
+    def _forget(self, job: GenerationJob):
+        self._jobs.pop(job.job_id, None)
+        key = (job.client_id, job.request_hash)
+        if self._by_request.get(key) == job.job_id:
+            del self._by_request[key]
+
+    def _expire(self):
+        """Drop finished results nobody fetched within the TTL (caller holds the lock)"""
+        cutoff = time.time() - self.result_ttl_seconds
+        for job in [job for job in self._jobs.values() if job.done and job.finished_at < cutoff]:
+            self._forget(job)
+            self.stats['expired'] += 1
+
+
+_manager: Optional[GenerationJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> GenerationJobManager:
+    """Process-wide job manager shared by all Streamlit sessions"""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = GenerationJobManager(
+                    workers=int(get_secret('GENERATION_JOB_WORKERS', 4)),
+                    result_ttl_seconds=float(get_secret('GENERATION_JOB_TTL_SECONDS', 3600))
+                )
+    return _manager
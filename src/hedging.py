@@ -0,0 +1,110 @@
+"""
+Hedging - hedged requests for idempotent tool calls
+A call that has not answered within the host's recent p95 latency gets a
+second, identical attempt; whichever finishes first wins and the loser is
+cancelled (or, if already running, its result is discarded and closed).
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from contextvars import copy_context
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    from src.metrics import HEDGED_REQUESTS
+except ImportError:
+    from metrics import HEDGED_REQUESTS
+
+
+class LatencyTracker:
+    """Recent latencies per key (e.g. host) for percentile-based hedge delays"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, key: str, q: float = 0.95) -> Optional[float]:
+        """Nearest-rank percentile, None until min_samples have been seen"""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='hedged-request')
+    return _executor
+
+
+def hedged_call(call: Callable[[], Any],
+                hedge_delay: Optional[float],
+                timeout: float,
+                tool: str = '',
+                discard: Optional[Callable[[Any], None]] = None) -> Tuple[Any, bool]:
+    """
+    Run `call` and, if it has not finished after `hedge_delay` seconds, start
+    a second attempt. Returns (result, hedge_won). The first successful
+    result wins; the other attempt is cancelled if it has not started, and
+    its result is passed to `discard` (e.g. to close a response) when it
+    finishes. Raises the last error if every attempt fails, or TimeoutError
+    when nothing finishes within `timeout`.
+    """
+    executor = _get_executor()
+    end = time.monotonic() + timeout
+    primary = executor.submit(copy_context().run, call)
+    attempts = [primary]
+    pending = {primary}
+    error: Optional[BaseException] = None
+
+    if hedge_delay is not None and hedge_delay < timeout:
+        done, pending = wait(pending, timeout=hedge_delay)
+        if not done or primary.exception() is not None:
+            if done:
+                error = primary.exception()
+            hedge = executor.submit(copy_context().run, call)
+            HEDGED_REQUESTS.inc(tool=tool, outcome='fired')
+            attempts.append(hedge)
+            pending.add(hedge)
+
+    winner: Optional[Future] = next((f for f in attempts if f.done() and f.exception() is None), None)
+    pending = {f for f in attempts if not f.done()}
+    while pending and winner is None:
+        done, pending = wait(pending, timeout=max(0.0, end - time.monotonic()), return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            if future.exception() is None:
+                winner = future
+                break
+            error = future.exception()
+
+    for future in attempts:
+        if future is not winner and not future.cancel() and discard is not None:
+            future.add_done_callback(lambda f: f.exception() is None and discard(f.result()))
+
+    if winner is None:
+        raise error if error is not None else TimeoutError(f"{tool or 'request'} timed out")
+    hedge_won = winner is not primary
+    if len(attempts) > 1:
+        HEDGED_REQUESTS.inc(tool=tool, outcome='won' if hedge_won else 'lost')
+    return winner.result(), hedge_won
@@ -0,0 +1,164 @@
+"""
+Host Health - per-host circuit breaking and negative caching for tool endpoints
+Tracks error rate and consecutive failures per host; a failing host is put in
+a cooldown window (exponential, honouring Retry-After) during which tools skip
+the network and use cached or fallback data. Failed lookups are negatively
+cached for a short TTL so the same request is not retried immediately.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Optional, Any
+
+try:
+    from src.metrics import record_cache
+except ImportError:
+    from metrics import record_cache
+
+
+class EndpointUnavailable(Exception):
+    """Raised instead of sending a request to a host in cooldown or a negatively cached URL"""
+
+
+class _HostState:
+    __slots__ = ('outcomes', 'consecutive_failures', 'cooldown_until', 'trips',
+                 'requests', 'failures', 'last_error', 'last_failure_at')
+
+    def __init__(self, window: int):
+        self.outcomes = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.trips = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.last_failure_at: Optional[float] = None
+
+
+class HostHealthTracker:
+    """
+    Health state per host.
+
+    A host enters cooldown after `failure_threshold` consecutive failures, or
+    when the error rate over the last `window` requests exceeds
+    `error_rate_threshold` (once `min_requests` were seen). Cooldowns double
+    with each trip up to `max_cooldown` and reset after a success.
+    """
+
+    def __init__(self,
+                 failure_threshold: int = 3,
+                 error_rate_threshold: float = 0.5,
+                 min_requests: int = 10,
+                 window: int = 50,
+                 base_cooldown: float = 30.0,
+                 max_cooldown: float = 600.0,
+                 negative_ttl: float = 60.0,
+                 negative_max_entries: int = 1024):
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.negative_ttl = negative_ttl
+        self.negative_max_entries = negative_max_entries
+        self._hosts: Dict[str, _HostState] = {}
+        self._negative: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, host: str, url: Optional[str] = None):
+        """Raise EndpointUnavailable if the host is cooling down or the URL recently failed"""
+        now = time.time()
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is not None and state.cooldown_until > now:
+                raise EndpointUnavailable(f"{host} in cooldown for {state.cooldown_until - now:.0f}s "
+                                          f"({state.last_error})")
+            negative_hit = False
+            if url is not None and self.negative_ttl:
+                expires = self._negative.get(url)
+                if expires is not None:
+                    if expires > now:
+                        negative_hit = True
+                    else:
+                        del self._negative[url]
+        if url is not None and self.negative_ttl:
+            record_cache('negative', negative_hit)
+        if negative_hit:
+            raise EndpointUnavailable(f"{url} failed recently (negatively cached)")
+
+    def record_success(self, host: str):
+        with self._lock:
+            state = self._state_locked(host)
+            state.outcomes.append(True)
+            state.requests += 1
+            state.consecutive_failures = 0
+            state.trips = 0
+
+    def record_failure(self, host: str, reason: str, url: Optional[str] = None,
+                       retry_after: Optional[float] = None):
+        """Count a failure, negatively cache the URL and start a cooldown if needed"""
+        now = time.time()
+        with self._lock:
+            state = self._state_locked(host)
+            state.outcomes.append(False)
+            state.requests += 1
+            state.failures += 1
+            state.consecutive_failures += 1
+            state.last_error = reason
+            state.last_failure_at = now
+
+            recent = len(state.outcomes)
+            error_rate = state.outcomes.count(False) / recent
+            tripped = (state.consecutive_failures >= self.failure_threshold
+                       or (recent >= self.min_requests and error_rate > self.error_rate_threshold))
+            cooldown = 0.0
+            if tripped:
+                state.trips += 1
+                cooldown = self.base_cooldown * 2 ** (state.trips - 1)
+            if retry_after is not None:
+                # The server said when to come back
+                cooldown = max(cooldown, retry_after)
+            if cooldown:
+                state.cooldown_until = max(state.cooldown_until, now + min(self.max_cooldown, cooldown))
+
+            if url is not None and self.negative_ttl:
+                self._remember_locked(url, now)
+
+    def record_miss(self, url: str):
+        """Negatively cache a lookup that failed without the host being unhealthy (e.g. 404)"""
+        if not self.negative_ttl:
+            return
+        with self._lock:
+            self._remember_locked(url, time.time())
+
+    def status(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            hosts = {}
+            for host, state in self._hosts.items():
+                recent = len(state.outcomes)
+                hosts[host] = {
+                    'healthy': state.cooldown_until <= now,
+                    'cooldown_remaining_s': round(max(0.0, state.cooldown_until - now), 1),
+                    'error_rate': round(state.outcomes.count(False) / recent, 3) if recent else 0.0,
+                    'consecutive_failures': state.consecutive_failures,
+                    'requests': state.requests,
+                    'failures': state.failures,
+                    'last_error': state.last_error,
+                }
+            negative = sum(1 for expires in self._negative.values() if expires > now)
+        return {'hosts': hosts, 'negative_cache_entries': negative}
+
+    def _remember_locked(self, url: str, now: float):
+        self._negative[url] = now + self.negative_ttl
+        self._negative.move_to_end(url)
+        while len(self._negative) > self.negative_max_entries:
+            self._negative.popitem(last=False)
+
+    def _state_locked(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.window)
+        return state
@@ -0,0 +1,253 @@
+"""
+Insights - extractive key-insight ranking shared by AgentTools and batch analysis
+Sentences are ranked by TextRank over TF-IDF cosine similarity (NumPy) in one
+pass over the whole document. IDF combines a frozen background table, built
+once per process from the bundled post templates, with the document's own
+sentences: boilerplate common to LinkedIn posts is down-weighted, and a
+document always gets the same insights, whatever was analyzed before it and
+in whichever process.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Any
+
+# Statements with these words (or with numbers) are favoured as insights
+INSIGHT_KEYWORDS = frozenset({'important', 'key', 'critical', 'essential', 'significant',
+                              'major', 'primary', 'crucial', 'vital'})
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before
+being below between both but by can could did do does doing down during each few for from
+further had has have having he her here hers him his how i if in into is it its itself just
+me more most my no nor not now of off on once only or other our ours out over own same she
+should so some such than that the their theirs them then there these they this those through
+to too under until up very was we were what when where which while who whom why will with
+would you your yours
+""".split())
+
+# Sentences end at . ! ? followed by whitespace (so 2.5x stays intact) or at a line break
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+|\s*\n\s*')
+_TERM_RE = re.compile(r'[a-z][a-z0-9]+|\d+(?:\.\d+)?%?')
+_DIGIT_RE = re.compile(r'\d')
+_PLACEHOLDER_RE = re.compile(r'\{\w+\}')
+
+DEFAULT_BACKGROUND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'post_templates.json')
+
+
+def split_sentences(text: str, min_chars: int = 20) -> List[str]:
+    """Sentences of at least `min_chars` characters, in document order"""
+    sentences = []
+    for piece in _SENTENCE_BREAK_RE.split(text):
+        sentence = ' '.join(piece.split())
+        if len(sentence) >= min_chars:
+            sentences.append(sentence)
+    return sentences
+
+
+def _sentence_terms(sentence: str) -> List[str]:
+    """Lowercased terms of a sentence without stopwords"""
+    return [t for t in _TERM_RE.findall(sentence.lower()) if t not in STOPWORDS]
+
+
+class BackgroundIDF:
+    """
+    Document frequencies of a fixed corpus (each sentence counts as a
+    document). Frozen once built: extract() reads it but never updates it.
+    """
+
+    __slots__ = ('documents', 'frequency')
+
+    def __init__(self, texts: Iterable[str]):
+        frequency: Counter = Counter()
+        documents = 0
+        for text in texts:
+            for sentence in split_sentences(text):
+                terms = set(_sentence_terms(sentence))
+                if terms:
+                    frequency.update(terms)
+                    documents += 1
+        self.documents = documents
+        self.frequency: Dict[str, int] = dict(frequency)
+
+    @classmethod
+    def from_templates(cls, path: str = DEFAULT_BACKGROUND_PATH) -> "BackgroundIDF":
+        """Background from the post template sections, with {field} placeholders removed"""
+        with open(path, encoding='utf-8') as f:
+            sections = json.load(f)['sections']
+        return cls(_PLACEHOLDER_RE.sub(' ', text)
+                   for levels in sections.values() for texts in levels.values() for text in texts)
+
+
+class InsightExtractor:
+    """
+    TextRank sentence ranking; one instance can be shared across threads.
+
+    Sentences become L2-normalized TF-IDF vectors (each sentence counts as a
+    document for IDF, on top of the optional frozen `background` table);
+    TextRank runs on their cosine similarity graph. Documents longer than `textrank_max_sentences`
+    use centroid centrality instead, which stays linear in the document
+    size. Near-duplicate sentences are dropped from the top-k.
+    """
+
+    def __init__(self,
+                 damping: float = 0.85,
+                 min_similarity: float = 0.05,
+                 keyword_boost: float = 0.25,
+                 duplicate_similarity: float = 0.8,
+                 textrank_max_sentences: int = 2000,
+                 background: Optional[BackgroundIDF] = None):
+        self.damping = damping
+        self.min_similarity = min_similarity
+        self.keyword_boost = keyword_boost
+        self.duplicate_similarity = duplicate_similarity
+        self.textrank_max_sentences = textrank_max_sentences
+        self.background = background
+
+    def extract(self, content: str, top_k: int = 5) -> Dict[str, Any]:
+        """Top-k insights by rank, with scores (the ranks sum to 1 over all sentences)"""
+        sentences = split_sentences(content or '')
+        terms = [_sentence_terms(s) for s in sentences]
+        keep = [i for i, sentence_terms in enumerate(terms) if sentence_terms]
+        sentences = [sentences[i] for i in keep]
+        terms = [terms[i] for i in keep]
+        if not sentences:
+            return {'insights': [], 'ranked': [], 'total_analyzed': 0, 'confidence': 0.0, 'method': 'none'}
+
+        idf = self._idf(terms)
+        scores, overlap, method = self._rank(sentences, terms, idf)
+
+        import numpy as np
+
+        order = np.argsort(-scores, kind='stable')
+        selected: List[int] = []
+        for index in order:
+            if len(selected) >= top_k:
+                break
+            if selected and overlap(int(index), selected) >= self.duplicate_similarity:
+                continue
+            selected.append(int(index))
+
+        ranked = [{'sentence': sentences[i], 'score': round(float(scores[i]), 4), 'position': i}
+                  for i in selected]
+        return {
+            'insights': [item['sentence'] for item in ranked],
+            'ranked': ranked,
+            'total_analyzed': len(sentences),
+            # Share of the rank mass held by the returned insights
+            'confidence': round(min(1.0, float(scores[selected].sum())), 3),
+            'method': method,
+        }
+
+    def _idf(self, terms: List[List[str]]) -> Dict[str, float]:
+        """Smoothed IDF of each term over the background and the document's sentences"""
+        frequency: Counter = Counter()
+        for sentence_terms in terms:
+            frequency.update(set(sentence_terms))
+        documents = len(terms)
+        background = self.background
+        if background is not None:
+            documents += background.documents
+            for term in frequency:
+                frequency[term] += background.frequency.get(term, 0)
+        return {term: math.log((1 + documents) / (1 + count)) + 1.0 for term, count in frequency.items()}
+
+    def _rank(self, sentences: List[str], terms: List[List[str]], idf: Dict[str, float]):
+        """
+        Scores (summing to 1), an overlap(i, others) function giving the max
+        cosine similarity of sentence i to the others, and the method used.
+        Vectors stay sparse (row, column, weight) triplets.
+        """
+        import numpy as np
+
+        columns = {term: column for column, term in enumerate(idf)}
+        rows, cols, counts = [], [], []
+        for row, sentence_terms in enumerate(terms):
+            for term, count in Counter(sentence_terms).items():
+                rows.append(row)
+                cols.append(columns[term])
+                counts.append(count)
+
+        count = len(sentences)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        weights = np.fromiter(idf.values(), dtype=np.float64, count=len(idf))[cols] * counts
+        weights /= np.sqrt(np.bincount(rows, weights * weights, minlength=count))[rows]
+
+        if 1 < count <= self.textrank_max_sentences:
+            # Only terms shared by two or more sentences contribute to
+            # similarity between sentences, so the dense matrix keeps just those
+            shared = np.bincount(cols, minlength=len(columns))[cols] >= 2
+            compact = np.unique(cols[shared], return_inverse=True)[1].reshape(-1)
+            matrix = np.zeros((count, int(compact.max()) + 1 if compact.size else 1), dtype=np.float32)
+            matrix[rows[shared], compact] = weights[shared]
+            similarity = matrix @ matrix.T
+            scores, method = self._textrank(similarity), 'textrank'
+
+            def overlap(index: int, others: List[int]) -> float:
+                return float(similarity[index, others].max())
+        else:
+            centroid = np.bincount(cols, weights, minlength=len(columns))
+            scores = np.clip(np.bincount(rows, weights * centroid[cols], minlength=count), 0.0, None)
+            method = 'centrality' if count > 1 else 'single'
+            starts = np.searchsorted(rows, np.arange(count + 1))
+
+            def vector(index: int) -> Dict[int, float]:
+                span = slice(starts[index], starts[index + 1])
+                return dict(zip(cols[span].tolist(), weights[span].tolist()))
+
+            def overlap(index: int, others: List[int]) -> float:
+                candidate = vector(index)
+                return max(sum(weight * candidate.get(column, 0.0) for column, weight in vector(other).items())
+                           for other in others)
+
+        boost = np.array([1.0 + self.keyword_boost if (INSIGHT_KEYWORDS.intersection(sentence_terms)
+                                                        or _DIGIT_RE.search(sentence)) else 1.0
+                          for sentence, sentence_terms in zip(sentences, terms)])
+        scores = scores * boost
+        total = scores.sum()
+        scores = scores / total if total > 0 else np.full(count, 1.0 / count)
+        return scores, overlap, method
+
+    def _textrank(self, similarity, iterations: int = 100, tolerance: float = 1e-6):
+        import numpy as np
+
+        count = similarity.shape[0]
+        graph = np.where(similarity >= self.min_similarity, similarity, 0.0).astype(np.float64)
+        np.fill_diagonal(graph, 0.0)
+        out_weight = graph.sum(axis=1, keepdims=True)
+        # Isolated sentences link uniformly so the walk stays stochastic
+        transition = np.divide(graph, out_weight, out=np.full_like(graph, 1.0 / count), where=out_weight > 0)
+        transition_t = transition.T.copy()
+
+        rank = np.full(count, 1.0 / count)
+        teleport = (1.0 - self.damping) / count
+        for _ in range(iterations):
+            updated = teleport + self.damping * (transition_t @ rank)
+            if np.abs(updated - rank).sum() < tolerance:
+                return updated
+            rank = updated
+        return rank
+
+
+_default_extractor: Optional[InsightExtractor] = None
+_default_lock = threading.Lock()
+
+
+def get_extractor() -> InsightExtractor:
+    """Process-wide extractor, with the template background loaded on first use"""
+    global _default_extractor
+    if _default_extractor is None:
+        with _default_lock:
+            if _default_extractor is None:
+                _default_extractor = InsightExtractor(background=BackgroundIDF.from_templates())
+    return _default_extractor
+
+
+def extract_key_insights(content: str, top_k: int = 5) -> Dict[str, Any]:
+    """Top-k ranked insight sentences of `content` with scores"""
+    return get_extractor().extract(content, top_k=top_k)
@@ -4,46 +4,197 @@ Uses LangGraph (LangChain's agent framework) with Google Gemini
 """
 
 from langgraph.prebuilt import create_react_agent
-from langchain_google_genai import ChatGoogleGenerativeAI
-from typing import Dict, Any
+from langchain_core.callbacks import BaseCallbackHandler
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextvars import copy_context
 import logging
 import json
+import threading
 from datetime import datetime
 
 try:
     from src.config import get_secret
-    from src.agent_tools import create_langchain_tools
+    from src.agent_tools import get_tool_registry, tool_invocation
+    from src.metrics import GENERATION_LATENCY, record_error, record_cache
+    from src.tracing import tracer
+    from src.deadlines import remaining
+    from src.post_quality import get_scorer
 except ImportError:
     from config import get_secret
-    from agent_tools import create_langchain_tools
+    from agent_tools import get_tool_registry, tool_invocation
+    from metrics import GENERATION_LATENCY, record_error, record_cache
+    from tracing import tracer
+    from deadlines import remaining
+    from post_quality import get_scorer
 
 
-class LangChainPostAgent:
+DEFAULT_MODEL = "gemini-2.5-flash"
+DEFAULT_TEMPERATURE = 0.9
+
+
+class CompiledAgent(NamedTuple):
+    """Immutable resources shared by every agent with the same configuration"""
+    llm: Any
+    tools: Tuple[Any, ...]
+    graph: Any
+
+
+_compiled_agents: Dict[tuple, CompiledAgent] = {}
+_compiled_agents_lock = threading.Lock()
+
+
+def get_compiled_agent(model: str = DEFAULT_MODEL,
+                       temperature: float = DEFAULT_TEMPERATURE,
+                       tool_names: Optional[Tuple[str, ...]] = None,
+                       llm=None) -> CompiledAgent:
     """
-    Real LangGraph Agent Implementation (LangChain's Official Agent Framework)
-    Uses LangGraph ReAct agent - NOT custom code!
+    Return the process-wide compiled ReAct graph for (model, temperature,
+    tool set), compiling it on first use. An injected llm is keyed by
+    identity; the cache keeps it alive so the key stays valid.
     """
+    registry = get_tool_registry()
+    if tool_names is None:
+        tool_names = tuple(tool.name for tool in registry)
+    key = (model if llm is None else ('injected', id(llm)), temperature, tuple(sorted(tool_names)))
+    
+    compiled = _compiled_agents.get(key)
+    if compiled is not None:
+        record_cache('compiled_agent', True)
+        return compiled
     
-    def __init__(self):
-        self.api_key = get_secret('GOOGLE_API_KEY')
-        if not self.api_key:
-            raise ValueError("Google API Key not found")
+    with _compiled_agents_lock:
+        # Counted under the lock, so threads racing on a cold key record one miss
+        compiled = _compiled_agents.get(key)
+        record_cache('compiled_agent', compiled is not None)
+        if compiled is not None:
+            return compiled
         
+        if llm is None:
+            api_key = get_secret('GOOGLE_API_KEY')
+            if not api_key:
+                raise ValueError("Google API Key not found")
+            
+            # Only needed for the real model; fakes skip loading the Gemini client
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            
+            llm = ChatGoogleGenerativeAI(
+                model=model,
+                google_api_key=api_key,
+                temperature=temperature
+            )
+        
+        tools = tuple(tool for tool in registry if tool.name in tool_names)
+        graph = create_react_agent(model=llm, tools=list(tools))
+        compiled = CompiledAgent(llm=llm, tools=tools, graph=graph)
+        _compiled_agents[key] = compiled
+        return compiled
+
+
+_candidate_executor: Optional[ThreadPoolExecutor] = None
+_candidate_executor_lock = threading.Lock()
 
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            google_api_key=self.api_key,
-            temperature=0.9
+
+def _get_candidate_executor() -> ThreadPoolExecutor:
+    """Threads for best-of-N candidates, shared by all agents"""
+    global _candidate_executor
+    if _candidate_executor is None:
+        with _candidate_executor_lock:
+            if _candidate_executor is None:
+                workers = int(get_secret('BEST_OF_N_WORKERS', 16))
+                _candidate_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='post-candidate')
+    return _candidate_executor
+
+
+class CandidateCancelled(Exception):
+    """A best-of-N candidate was stopped because the selection no longer needs it"""
+
+
+class ReActStepTracer(BaseCallbackHandler):
+    """
+    LangChain callback handler that records one span per ReAct step
+    (each chat model call the agent makes) under a parent span. When a
+    cancel event is given and set, the next step or tool call raises
+    CandidateCancelled, which stops the graph.
+    """
+    
+    # Let CandidateCancelled propagate out of the graph instead of being logged
+    raise_error = True
+    
+    def __init__(self, parent_span, cancel: Optional[threading.Event] = None):
+        self.parent_span = parent_span
+        self.cancel = cancel
+        self.steps = 0
+        self._open = {}
+    
+    def _check_cancelled(self):
+        if self.cancel is not None and self.cancel.is_set():
+            raise CandidateCancelled(f"Cancelled after {self.steps} steps")
+    
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._check_cancelled()
+        self.steps += 1
+        self._open[run_id] = tracer.start_span(
+            'react.step',
+            parent=self.parent_span,
+            step=self.steps,
+            input_messages=len(messages[0]) if messages else 0
         )
+    
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        span = self._open.pop(run_id, None)
+        if span is None:
+            return
+        try:
+            message = response.generations[0][0].message
+            tool_calls = getattr(message, 'tool_calls', None) or []
+            span.set_attribute('tool_calls', ','.join(call['name'] for call in tool_calls) or 'final_answer')
+            usage = getattr(message, 'usage_metadata', None) or {}
+            if usage:
+                span.set_attribute('tokens.input', usage.get('input_tokens', 0))
+                span.set_attribute('tokens.output', usage.get('output_tokens', 0))
+        except (AttributeError, IndexError, KeyError, TypeError):
+            pass
+        span.end()
+    
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        span = self._open.pop(run_id, None)
+        if span is not None:
+            span.record_exception(error)
+            span.end()
+    
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        self._check_cancelled()
+
+
+class LangChainPostAgent:
+    """
+    Real LangGraph Agent Implementation (LangChain's Official Agent Framework)
+    Uses LangGraph ReAct agent - NOT custom code!
+    """
+    
+    def __init__(self, llm=None,
+                 model: str = DEFAULT_MODEL,
+                 temperature: float = DEFAULT_TEMPERATURE,
+                 tool_names: Optional[Tuple[str, ...]] = None):
+        """
+        Args:
+            llm: Optional chat model to use instead of Gemini (e.g. a fake
+                 model for offline benchmarks)
+            model: Gemini model name
+            temperature: Sampling temperature
+            tool_names: Subset of registered tools to expose (default: all)
         
+        The LLM client, tools and compiled graph are shared with every other
+        agent built with the same configuration.
+        """
+        self.model_name = model
+        self.temperature = temperature
         
-        self.tools = create_langchain_tools()
-        
-        
-        self.agent_executor = create_react_agent(
-            model=self.llm,
-            tools=self.tools
-        )
+        compiled = get_compiled_agent(model, temperature, tool_names, llm=llm)
+        self.llm = compiled.llm
+        self.tools = compiled.tools
+        self.agent_executor = compiled.graph
         
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -53,11 +204,16 @@ class LangChainPostAgent:
                                      topic: str,
                                      tone: str = "professional",
                                      length: int = 1,
-                                     target_audience: str = "professionals") -> Dict[str, Any]:
+                                     target_audience: str = "professionals",
+                                     research_context: Optional[str] = None,
+                                     cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         Generate blog using LangChain agent
         
-        This is REAL agent framework usage!
+        This is REAL agent framework usage! When research_context (a cached
+        research bundle) is given, the agent starts from it instead of calling
+        the research tools first. Setting `cancel` stops the agent at its next
+        step or tool call with CandidateCancelled (no fallback generation).
         """
         self.logger.info(f"🤖 LangChain Agent starting for: {topic}")
         
@@ -65,6 +221,19 @@ class LangChainPostAgent:
         paragraphs_to_words = {1: "150 words", 2: "250 words", 3: "350 words", 4: "450 words", 5: "550 words", 6: "650 words", 7: "750 words", 8: "850 words", 9: "950 words", 10: "1000+ words"}
         length_description = paragraphs_to_words.get(length, "300 words")
         
+        if research_context:
+            steps = f"""Research already gathered (may be a few minutes old):
+{research_context}
+
+Steps to follow:
+1. Use the research above; call search_web or fetch_statistics only if something important is missing
+2. Create an engaging post incorporating the research"""
+        else:
+            steps = f"""Steps to follow:
+1. Use search_web tool to research "{topic}"
+2. Use fetch_statistics tool to get data about "{topic}"  
+3. Use get_trending_topics tool for "{topic}" industry
+4. Create an engaging post incorporating the research"""
     
         task = f"""Create a professional LinkedIn post about "{topic}".
 
@@ -73,11 +242,7 @@ Requirements:
 - Length: {length_description} ({length} paragraph{'s' if length > 1 else ''})
 - Audience: {target_audience}
 
-Steps to follow:
-1. Use search_web tool to research "{topic}"
-2. Use fetch_statistics tool to get data about "{topic}"  
-3. Use get_trending_topics tool for "{topic}" industry
-4. Create an engaging post incorporating the research
+{steps}
 
 Format your final answer EXACTLY as:
 TITLE: [Your title here]
@@ -96,11 +261,24 @@ CALL_TO_ACTION:
             # Try agent first
             self.logger.info("🔄 Invoking LangGraph agent...")
             try:
-                result = self.agent_executor.invoke({"messages": [("user", task)]})
+                with tracer.span('agent.invoke', model=self.model_name) as invoke_span, \
+                        GENERATION_LATENCY.time(phase='llm'), \
+                        tool_invocation() as invocation:
+                    step_tracer = ReActStepTracer(invoke_span, cancel)
+                    result = self.agent_executor.invoke(
+                        {"messages": [("user", task)]},
+                        config={"callbacks": [step_tracer]}
+                    )
+                    invoke_span.set_attribute('react.steps', step_tracer.steps)
+                tools_used = invocation.tool_names()
+            except CandidateCancelled:
+                raise
             except Exception as agent_error:
+                record_error('langchain_agent', agent_error)
                 self.logger.warning(f"Agent invocation failed: {agent_error}")
                 self.logger.info("🔄 Falling back to direct LLM call...")
                 result = None
+                tools_used = []
             
             output_text = ""
             if result:
@@ -113,16 +291,20 @@ CALL_TO_ACTION:
             
         
             if not output_text or len(output_text) < 50:
+                if cancel is not None and cancel.is_set():
+                    raise CandidateCancelled("Cancelled before fallback generation")
                 self.logger.warning("⚠️ Agent output too short, using fallback generation")
                 output_text = self._generate_fallback(topic, tone, length, target_audience)
             
-            blog_data = self._parse_response(output_text)
+            with tracer.span('agent.parse', chars=len(output_text)), GENERATION_LATENCY.time(phase='parse'):
+                blog_data = self._parse_response(output_text)
             
         
             blog_data['agent_metadata'] = {
                 'framework': 'LangGraph ReAct Agent (LangChain)',
-                'model': 'gemini-2.5-flash',
+                'model': self.model_name,
                 'tools_available': [tool.name for tool in self.tools] if self.tools else [],
+                'tools_used': tools_used,
                 'agent_type': 'ReAct (Reasoning + Acting)',
                 'generated_at': datetime.now().isoformat()
             }
@@ -137,14 +319,17 @@ CALL_TO_ACTION:
             self.logger.info("✅ LangGraph Agent completed successfully")
             return blog_data
             
+        except CandidateCancelled:
+            raise
         except Exception as e:
+            record_error('langchain_agent', e)
             self.logger.error(f"❌ LangGraph Agent failed: {e}")
             self.logger.info("🔄 Generating fallback content...")
             fallback_text = self._generate_fallback(topic, tone, length, target_audience)
             blog_data = self._parse_response(fallback_text)
             blog_data['agent_metadata'] = {
                 'framework': 'LangGraph ReAct Agent (Fallback)',
-                'model': 'gemini-2.5-flash',
+                'model': self.model_name,
                 'tools_available': [tool.name for tool in self.tools] if self.tools else [],
                 'agent_type': 'Direct Generation (Fallback)',
                 'generated_at': datetime.now().isoformat(),
@@ -153,6 +338,72 @@ CALL_TO_ACTION:
             }
             return blog_data
     
+    def generate_best_of_n(self,
+                           topic: str,
+                           tone: str = "professional",
+                           length: int = 1,
+                           target_audience: str = "professionals",
+                           research_context: Optional[str] = None,
+                           n: int = 3) -> Dict[str, Any]:
+        """
+        Generate n candidates concurrently from the same research context and
+        return the one with the best local quality score. The other
+        candidates are returned under 'alternates', best first. Candidates
+        still running when the request deadline is reached are cancelled:
+        they stop at their next agent step or tool call, so they neither hold
+        a worker nor keep calling the LLM after the selection is made.
+        """
+        if n <= 1:
+            return self.generate_post_with_langchain(topic, tone, length, target_audience, research_context)
+        
+        executor = _get_candidate_executor()
+        cancel = threading.Event()
+        with tracer.span('agent.best_of_n', n=n) as span:
+            futures = [
+                executor.submit(copy_context().run, self.generate_post_with_langchain,
+                                topic, tone, length, target_audience, research_context, cancel=cancel)
+                for _ in range(n)
+            ]
+            done, pending = wait(futures, timeout=remaining())
+            if not done:
+                done, pending = wait(futures, return_when=FIRST_COMPLETED)
+            # Queued candidates never start; running ones stop at their next step
+            cancel.set()
+            for future in pending:
+                future.cancel()
+            span.set_attribute('cancelled', len(pending))
+            
+            candidates: List[Dict[str, Any]] = []
+            for future in done:
+                try:
+                    candidates.append(future.result())
+                except Exception as e:
+                    record_error('langchain_agent', e)
+                    self.logger.warning(f"Candidate generation failed: {e}")
+            if not candidates:
+                raise RuntimeError(f"All {n} candidates failed")
+            
+            # Fallback-generated candidates only win if nothing else finished
+            qualities = get_scorer().score_batch(candidates, length)
+            ranked = sorted(zip(candidates, qualities),
+                            key=lambda pair: ('error' not in pair[0]['agent_metadata'], pair[1]['score']),
+                            reverse=True)
+            for candidate, quality in ranked:
+                candidate['quality'] = quality
+            
+            best = ranked[0][0]
+            best['alternates'] = [candidate for candidate, _ in ranked[1:]]
+            best['agent_metadata']['best_of_n'] = {
+                'requested': n,
+                'completed': len(candidates),
+                'scores': [quality['score'] for _, quality in ranked],
+                'selected_score': ranked[0][1]['score']
+            }
+            span.set_attribute('completed', len(candidates))
+            span.set_attribute('selected_score', ranked[0][1]['score'])
+            self.logger.info(f"🏆 Best of {len(candidates)}/{n} candidates: score {ranked[0][1]['score']}")
+            return best
+    
     def _generate_fallback(self, topic: str, tone: str, length: int, target_audience: str) -> str:
         """Generate blog using direct LLM call if agent fails"""
         try:
@@ -179,10 +430,12 @@ CALL_TO_ACTION:
 [Your call to action here]"""
             
             self.logger.info("🔄 Using direct LLM call for generation...")
-            response = self.llm.invoke(prompt)
+            with tracer.span('agent.fallback', model=self.model_name), GENERATION_LATENCY.time(phase='llm'):
+                response = self.llm.invoke(prompt)
             return response.content if hasattr(response, 'content') else str(response)
             
         except Exception as e:
+            record_error('langchain_agent', e)
             self.logger.error(f"Fallback generation also failed: {e}")
     
             # Return hardcoded fallback post structure
@@ -0,0 +1,52 @@
+"""
+Lazy Imports - keep heavy dependencies off the startup path
+Modules such as LangGraph and the Gemini client are imported on first use;
+warm_imports() preloads them in a background thread after the UI is up
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Iterable, Optional
+
+
+# Heavy modules used by the agent path, in the order they are first needed
+AGENT_MODULES = (
+    'requests',
+    'numpy',
+    'langchain_core.tools',
+    'langchain_core.callbacks',
+    'langchain_google_genai',
+    'langgraph.prebuilt',
+)
+
+_warm_thread: Optional[threading.Thread] = None
+_warm_lock = threading.Lock()
+
+
+def _import_all(modules: Iterable[str]):
+    logger = logging.getLogger(__name__)
+    started = time.perf_counter()
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            # Missing optional dependencies surface later at the call site
+            logger.debug(f"Warm import of {name} failed: {e}")
+    logger.info(f"🔥 Warmed agent imports in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def warm_imports(modules: Iterable[str] = AGENT_MODULES) -> threading.Thread:
+    """
+    Import heavy modules in a daemon thread so the first generation does not
+    pay for them. Safe to call repeatedly; only the first call starts a thread.
+    """
+    global _warm_thread
+    with _warm_lock:
+        if _warm_thread is None:
+            _warm_thread = threading.Thread(
+                target=_import_all, args=(tuple(modules),), name="import-warmer", daemon=True
+            )
+            _warm_thread.start()
+        return _warm_thread
@@ -0,0 +1,257 @@
+"""
+Metrics - Prometheus-style instrumentation for the post generator
+Histograms and counters fed by the orchestrator, agent tools and email sender,
+exposed in Prometheus text format from a small sidecar HTTP server
+"""
+
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_labels(label_names: Tuple[str, ...], label_values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {value}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels"""
+
+    def __init__(self, name: str, description: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., sum, count]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 2)
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of a block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            series = self._series.get(key)
+            return int(series[-1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            for i, bound in enumerate(self.buckets):
+                labels = _format_labels(self.label_names, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {series[i]}")
+            labels = _format_labels(self.label_names, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+            plain = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{plain} {series[-2]}")
+            lines.append(f"{self.name}_count{plain} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds every metric of the process and renders the exposition text"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str, labels: Tuple[str, ...] = ()) -> Counter:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, description, labels)
+            return self._metrics[name]
+
+    def histogram(self, name: str, description: str, labels: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, description, labels, buckets)
+            return self._metrics[name]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+GENERATION_LATENCY = REGISTRY.histogram(
+    "linkedin_generation_phase_seconds",
+    "Post generation latency per phase (tool, llm, parse, quality, total)",
+    labels=("phase",)
+)
+TOOL_HTTP_LATENCY = REGISTRY.histogram(
+    "linkedin_tool_http_seconds",
+    "Agent tool HTTP request latency per host",
+    labels=("tool", "host")
+)
+SMTP_SEND_LATENCY = REGISTRY.histogram(
+    "linkedin_smtp_send_seconds",
+    "SMTP send latency including connect, TLS and login",
+    labels=("outcome",)
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "linkedin_cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss)",
+    labels=("cache", "result")
+)
+HEDGED_REQUESTS = REGISTRY.counter(
+    "linkedin_tool_hedged_requests_total",
+    "Hedged tool HTTP requests by tool and outcome (fired, won, lost)",
+    labels=("tool", "outcome")
+)
+UI_SCRIPT_RUN = REGISTRY.histogram(
+    "linkedin_ui_script_run_seconds",
+    "Streamlit script execution time per interaction, full app reruns vs fragment reruns",
+    labels=("scope", "name")
+)
+GENERATION_JOBS = REGISTRY.counter(
+    "linkedin_generation_jobs_total",
+    "Background generation jobs by event (submitted, deduplicated, succeeded, failed)",
+    labels=("event",)
+)
+ERRORS = REGISTRY.counter(
+    "linkedin_errors_total",
+    "Errors by component and exception class",
+    labels=("component", "error_class")
+)
+
+
+def record_cache(cache: str, hit: bool):
+    """Count a cache lookup; hit ratio = hit / (hit + miss)"""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_error(component: str, error: BaseException):
+    """Count an error by the component that saw it and its exception class"""
+    ERRORS.inc(component=component, error_class=type(error).__name__)
+
+
+def _make_handler(registry: MetricsRegistry):
+    """Build the request handler class (http.server is imported on demand)"""
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
+
+
+_server: Optional["ThreadingHTTPServer"] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int = 9108, host: str = "0.0.0.0",
+                         registry: MetricsRegistry = REGISTRY) -> "ThreadingHTTPServer":
+    """
+    Start the sidecar HTTP server serving /metrics in a daemon thread.
+    Idempotent: later calls return the already running server.
+    Pass port=0 to bind an ephemeral port (see server.server_address).
+    """
+    from http.server import ThreadingHTTPServer
+
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server
+
+        server = ThreadingHTTPServer((host, port), _make_handler(registry))
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+        thread.start()
+        _server = server
+        logging.getLogger(__name__).info(f"📈 Metrics endpoint listening on {host}:{server.server_address[1]}/metrics")
+        return server
+
+
+def stop_metrics_server():
+    """Shut down the sidecar server if it is running"""
+    global _server
+    with _server_lock:
+        if _server is not None:
+            _server.shutdown()
+            _server.server_close()
+            _server = None
@@ -0,0 +1,156 @@
+"""
+Post Quality - vectorized quality scoring for generated posts
+Each post is reduced to a few counts in one regex pass (words, sentences,
+syllables, hashtags, repeated phrases, sentiment); the component scores and
+the weighted total are then computed for the whole batch with NumPy.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Union, Any
+
+try:
+    from src.sentiment import get_analyzer
+except ImportError:
+    from sentiment import get_analyzer
+
+
+# Word targets per paragraph count, as requested from the post agent
+PARAGRAPH_WORD_TARGETS = {1: 150, 2: 250, 3: 350, 4: 450, 5: 550, 6: 650, 7: 750, 8: 850, 9: 950, 10: 1000}
+NAMED_WORD_TARGETS = {'short': 150, 'medium': 300, 'long': 500}
+
+COMPONENT_WEIGHTS = {
+    'readability': 0.20,
+    'length': 0.20,
+    'hashtags': 0.15,
+    'call_to_action': 0.15,
+    'repetition': 0.15,
+    'sentiment': 0.10,
+    'title': 0.05,
+}
+
+_WORD_RE = re.compile(r"[A-Za-z]+(?:'[a-z]+)?|\d+(?:[.,]\d+)*%?")
+_SENTENCE_END_RE = re.compile(r'[.!?]+(?:\s|$)|\n\s*\n')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+_SILENT_E_RE = re.compile(r'[^aeiouy\W]e\b')
+_HASHTAG_RE = re.compile(r'#\w+')
+_CTA_RE = re.compile(r"\?\s*$|\b(?:comment|share|thoughts|let me know|follow|join|connect|reach out|"
+                     r"dm me|sign up|learn more|repost|what do you think|agree)\b", re.IGNORECASE)
+
+
+def target_words(length: Union[int, str, None]) -> int:
+    """Word target for a paragraph count (1-10) or short/medium/long"""
+    if isinstance(length, str):
+        named = NAMED_WORD_TARGETS.get(length.strip().lower())
+        if named is not None:
+            return named
+        length = int(length) if length.strip().isdigit() else None
+    if isinstance(length, int) and length > 0:
+        return PARAGRAPH_WORD_TARGETS.get(length, PARAGRAPH_WORD_TARGETS[10])
+    return NAMED_WORD_TARGETS['medium']
+
+
+def post_features(post: Dict[str, Any]) -> List[float]:
+    """Raw counts for one post, in the column order used by PostQualityScorer"""
+    content = post.get('content') or ''
+    lowered = content.lower()
+    words = _WORD_RE.findall(lowered)
+    word_count = len(words)
+    sentences = max(1, len(_SENTENCE_END_RE.findall(content.strip() + ' ')))
+    syllables = max(word_count, len(_VOWEL_GROUP_RE.findall(lowered)) - len(_SILENT_E_RE.findall(lowered)))
+
+    hashtags = len(set(_HASHTAG_RE.findall(f"{post.get('hashtags') or ''} {content}".lower())))
+    call_to_action = post.get('call_to_action') or ''
+    has_cta = bool(call_to_action.strip()) or bool(_CTA_RE.search(content[-300:]))
+
+    trigrams = list(zip(words, words[1:], words[2:]))
+    repeated = len(trigrams) - len(set(trigrams))
+
+    compound = get_analyzer().analyze(content)['compound'] if content else 0.0
+    return [word_count, sentences, syllables, hashtags, float(has_cta), repeated,
+            max(1, len(trigrams)), compound, float(bool((post.get('title') or '').strip())), len(content)]
+
+
+class PostQualityScorer:
+    """
+    Quality score (0-100) per post from weighted components in [0, 1]:
+    readability (Flesch reading ease, best around 60-70), length against the
+    requested word target, hashtag count (3-5 is ideal), presence of a call
+    to action, repeated phrases (duplicate word trigrams), sentiment, and a
+    title.
+    """
+
+    def __init__(self, pass_score: float = 70.0, weights: Optional[Dict[str, float]] = None):
+        self.pass_score = pass_score
+        self.weights = dict(weights or COMPONENT_WEIGHTS)
+
+    def score_batch(self, posts: Sequence[Dict[str, Any]],
+                    lengths: Union[Sequence[Union[int, str, None]], int, str, None] = None) -> List[Dict[str, Any]]:
+        """Score many posts at once; `lengths` is one requested length or one per post"""
+        import numpy as np
+
+        if not posts:
+            return []
+        if lengths is None or isinstance(lengths, (int, str)):
+            lengths = [lengths] * len(posts)
+        features = np.array([post_features(post) for post in posts], dtype=np.float64)
+        (words, sentences, syllables, hashtags, has_cta, repeated,
+         trigrams, compound, has_title, chars) = features.T
+        targets = np.array([target_words(length) for length in lengths], dtype=np.float64)
+
+        safe_words = np.maximum(words, 1.0)
+        flesch = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / safe_words)
+        length_ratio = words / targets
+        repetition = repeated / trigrams
+
+        components = {
+            'readability': np.clip(1.0 - np.abs(flesch - 65.0) / 65.0, 0.0, 1.0),
+            'length': np.clip(1.0 - np.abs(np.log(np.maximum(length_ratio, 1e-3))) / np.log(2.0), 0.0, 1.0),
+            'hashtags': np.select([hashtags == 0, hashtags < 3, hashtags <= 5, hashtags <= 8], [0.0, 0.5, 1.0, 0.7], 0.3),
+            'call_to_action': has_cta,
+            'repetition': np.clip(1.0 - 4.0 * repetition, 0.0, 1.0),
+            'sentiment': np.clip((compound + 1.0) / 1.5, 0.0, 1.0),
+            'title': has_title,
+        }
+        total_weight = sum(self.weights.values())
+        scores = sum(self.weights[name] * value for name, value in components.items()) * (100.0 / total_weight)
+
+        results = []
+        for i in range(len(posts)):
+            score = round(float(scores[i]), 1)
+            results.append({
+                'score': score,
+                'passed': score >= self.pass_score,
+                'checks': {
+                    'has_title': bool(has_title[i]),
+                    'has_content': bool(chars[i] > 100),
+                    'appropriate_length': bool(0.67 <= length_ratio[i] <= 1.5),
+                    'has_hashtags': bool(3 <= hashtags[i] <= 5),
+                    'has_cta': bool(has_cta[i]),
+                    'readable': bool(30.0 <= flesch[i] <= 90.0),
+                    'low_repetition': bool(repetition[i] <= 0.05),
+                },
+                'components': {name: round(float(value[i]), 3) for name, value in components.items()},
+                'metrics': {
+                    'words': int(words[i]),
+                    'target_words': int(targets[i]),
+                    'flesch_reading_ease': round(float(flesch[i]), 1),
+                    'hashtags': int(hashtags[i]),
+                    'repeated_trigram_ratio': round(float(repetition[i]), 3),
+                    'sentiment_compound': round(float(compound[i]), 3),
+                },
+            })
+        return results
+
+    def score(self, post: Dict[str, Any], length: Union[int, str, None] = None) -> Dict[str, Any]:
+        return self.score_batch([post], [length])[0]
+
+
+_default_scorer: Optional[PostQualityScorer] = None
+
+
+def get_scorer() -> PostQualityScorer:
+    """Process-wide scorer with the default weights"""
+    global _default_scorer
+    if _default_scorer is None:
+        _default_scorer = PostQualityScorer()
+    return _default_scorer
@@ -0,0 +1,255 @@
+"""
+Post Templates - precompiled template registry for offline post generation
+Paragraph templates are loaded once from a JSON data file (default:
+post_templates.json next to this module) and compiled into literal segments
+and field names, so generating a post only fills in the fragments actually
+chosen. Used by linkedin_post_generator.py and for bulk A/B content seeding.
+
+Every post is drawn from its own random.Random, seeded from a content hash
+of the request (topic, level, tone, paragraphs, hashtags, seed): the same
+request always yields the same post, can be served from a cache, and
+concurrent sessions never share RNG state.
+
+Data file format:
+    {"sections": {"opening": {"beginner": ["... {topic} ...", ...], ...},
+                  "insight": {...}, "reflection": {...}, "closing": {...}},
+     "hashtags": ["#{topic_tag}", "#LinkedIn", ...]}
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+from collections import OrderedDict
+from itertools import combinations, product
+from string import Formatter
+from typing import Dict, Iterable, List, Optional, Tuple, Union, Any
+
+try:
+    from src.config import get_secret
+except ImportError:
+    from config import get_secret
+
+
+DEFAULT_TEMPLATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'post_templates.json')
+SECTIONS = ('opening', 'insight', 'reflection', 'closing')
+FIELDS = frozenset({'topic', 'topic_tag'})
+
+
+def content_hash(topic: str, expertise_level: str, tone: str, num_paragraphs: int,
+                 hashtags: int, seed: Union[int, str]) -> str:
+    """Stable hash identifying a generation request"""
+    payload = json.dumps([topic, expertise_level.lower(), tone.lower(), num_paragraphs, hashtags, seed],
+                         ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def new_seed() -> int:
+    """Fresh 32-bit seed from the OS, without touching the global random state"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+class CompiledTemplate:
+    """A template split into literal segments around its {field} placeholders"""
+
+    __slots__ = ('id', 'segments', 'fields')
+
+    def __init__(self, template_id: str, text: str):
+        segments, fields = [], []
+        literal = ''
+        for prefix, field, spec, conversion in Formatter().parse(text):
+            literal += prefix
+            if field is None:
+                continue
+            if field not in FIELDS or spec or conversion:
+                raise ValueError(f"Template {template_id}: unsupported placeholder {{{field}}} "
+                                 f"(allowed: {', '.join(sorted(FIELDS))})")
+            segments.append(literal)
+            fields.append(field)
+            literal = ''
+        segments.append(literal)
+        self.id = template_id
+        self.segments = tuple(segments)
+        self.fields = tuple(fields)
+
+    def render(self, values: Dict[str, str]) -> str:
+        if not self.fields:
+            return self.segments[0]
+        parts = [self.segments[0]]
+        for field, segment in zip(self.fields, self.segments[1:]):
+            parts.append(values[field])
+            parts.append(segment)
+        return ''.join(parts)
+
+
+class TemplateRegistry:
+    """Compiled templates per section and expertise level, plus the hashtag pool"""
+
+    def __init__(self, data: Dict[str, Any], cache_size: int = 1024):
+        sections = data.get('sections', {})
+        missing = [name for name in SECTIONS if name not in sections]
+        if missing:
+            raise ValueError(f"Template data is missing sections: {', '.join(missing)}")
+        self.sections: Dict[str, Dict[str, Tuple[CompiledTemplate, ...]]] = {
+            name: {
+                level: tuple(CompiledTemplate(f"{name}.{level}.{i}", text) for i, text in enumerate(texts))
+                for level, texts in sections[name].items()
+            }
+            for name in SECTIONS
+        }
+        self.levels = tuple(self.sections['opening'])
+        self.hashtags = tuple(CompiledTemplate(f"hashtag.{i}", tag) for i, tag in enumerate(data.get('hashtags', ())))
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[str, List[str]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: str, cache_size: int = 1024) -> "TemplateRegistry":
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f), cache_size=cache_size)
+
+    def compose(self, topic: str, expertise_level: str = 'intermediate', num_paragraphs: int = 3,
+                hashtags: int = 5, rng: Optional[random.Random] = None) -> Tuple[str, List[str]]:
+        """Post text and the ids of the fragments it was built from"""
+        rng = rng or random.Random()
+        level = self._level(expertise_level)
+        sections = self.sections
+        chosen = [rng.choice(sections['opening'][level])]
+
+        insights = sections['insight'][level]
+        num_insights = min(num_paragraphs - 1, len(insights))
+        if num_insights > 0:
+            chosen.extend(rng.sample(insights, num_insights))
+        reflection = rng.choice(sections['reflection'][level]) if num_paragraphs > 2 else None
+        closing = rng.choice(sections['closing'][level])
+
+        values = {'topic': topic, 'topic_tag': topic.replace(' ', '')}
+        parts = [template.render(values) for template in chosen]
+        if reflection is not None:
+            chosen.append(reflection)
+            parts.append("\n" + reflection.render(values))
+        chosen.append(closing)
+        parts.append("\n" + closing.render(values))
+        post = "\n\n".join(parts) + self._hashtag_line(values, hashtags, rng)
+        return post, [template.id for template in chosen]
+
+    def generate(self, topic: str, expertise_level: str = 'intermediate', num_paragraphs: int = 3,
+                 hashtags: int = 5, rng: Optional[random.Random] = None) -> str:
+        return self.compose(topic, expertise_level, num_paragraphs, hashtags, rng)[0]
+
+    def render(self, topic: str, expertise_level: str = 'intermediate', tone: str = 'professional',
+               num_paragraphs: int = 3, hashtags: int = 5, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Deterministic post for a request: the same arguments and seed always
+        give the same post (served from the cache after the first time).
+        Without a seed a fresh one is drawn and returned for reproduction.
+        """
+        if seed is None:
+            seed = new_seed()
+        key = content_hash(topic, expertise_level, tone, num_paragraphs, hashtags, seed)
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+        cached = hit is not None
+        if not cached:
+            hit = self.compose(topic, expertise_level, num_paragraphs, hashtags, random.Random(key))
+            with self._cache_lock:
+                self._cache[key] = hit
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        post, fragments = hit
+        return {'post': post, 'fragments': list(fragments), 'seed': seed, 'content_hash': key, 'cached': cached}
+
+    def count_combinations(self, expertise_level: str = 'intermediate', num_paragraphs: int = 3) -> int:
+        """Number of distinct posts generate_many can produce (ignoring hashtags)"""
+        return sum(1 for _ in self._combinations(self._level(expertise_level), num_paragraphs))
+
+    def generate_many(self, topic: str, expertise_level: str = 'intermediate', tone: str = 'professional',
+                      num_paragraphs: int = 3, hashtags: int = 5, limit: Optional[int] = None,
+                      seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Up to `limit` posts with pairwise distinct fragment combinations
+        (insights are compared as a set, so reorderings do not count). With a
+        seed the combinations come in a reproducible shuffled order,
+        otherwise in enumeration order; hashtags are drawn per post from its
+        content hash.
+        """
+        level = self._level(expertise_level)
+        combos = list(self._combinations(level, num_paragraphs))
+        if seed is not None:
+            random.Random(seed).shuffle(combos)
+        if limit is not None:
+            combos = combos[:limit]
+
+        values = {'topic': topic, 'topic_tag': topic.replace(' ', '')}
+        posts = []
+        for opening, insights, reflection, closing in combos:
+            chosen = [opening, *insights]
+            parts = [template.render(values) for template in chosen]
+            if reflection is not None:
+                chosen.append(reflection)
+                parts.append("\n" + reflection.render(values))
+            chosen.append(closing)
+            parts.append("\n" + closing.render(values))
+            fragments = [template.id for template in chosen]
+            key = content_hash(topic, level, tone, num_paragraphs, hashtags, '+'.join(fragments))
+            post = "\n\n".join(parts) + self._hashtag_line(values, hashtags, random.Random(key))
+            posts.append({'post': post, 'fragments': fragments, 'content_hash': key})
+        return posts
+
+    def _combinations(self, level: str, num_paragraphs: int):
+        sections = self.sections
+        insights = sections['insight'][level]
+        num_insights = max(0, min(num_paragraphs - 1, len(insights)))
+        reflections = sections['reflection'][level] if num_paragraphs > 2 else (None,)
+        return product(sections['opening'][level], combinations(insights, num_insights),
+                       reflections, sections['closing'][level])
+
+    def _level(self, expertise_level: str) -> str:
+        level = expertise_level.lower()
+        if level not in self.levels:
+            raise ValueError(f"Unknown expertise level '{expertise_level}' (expected one of {', '.join(self.levels)})")
+        return level
+
+    def _hashtag_line(self, values: Dict[str, str], hashtags: int, rng: random.Random) -> str:
+        if hashtags <= 0 or not self.hashtags:
+            return ''
+        tags = rng.sample(self.hashtags, min(hashtags, len(self.hashtags)))
+        return "\n\n" + " ".join(tag.render(values) for tag in tags)
+
+    def generate_batch(self, topics: Iterable[str], variants: int = 1,
+                       expertise_levels: Optional[Iterable[str]] = None, num_paragraphs: int = 3,
+                       hashtags: int = 5, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        `variants` posts per topic and expertise level (default: all levels),
+        each with the fragment ids it used so A/B results can be attributed.
+        A seed makes the batch reproducible.
+        """
+        rng = random.Random(seed)
+        levels = tuple(expertise_levels) if expertise_levels is not None else self.levels
+        compose = self.compose
+        posts = []
+        for topic in topics:
+            for level in levels:
+                for variant in range(variants):
+                    post, fragments = compose(topic, level, num_paragraphs, hashtags, rng)
+                    posts.append({'topic': topic, 'expertise_level': level, 'variant': variant,
+                                  'post': post, 'fragments': fragments})
+        return posts
+
+
+_registry: Optional[TemplateRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Process-wide registry loaded from POST_TEMPLATES_PATH (or the bundled data file)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TemplateRegistry.from_file(get_secret('POST_TEMPLATES_PATH') or DEFAULT_TEMPLATES_PATH,
+                                                       cache_size=int(get_secret('POST_TEMPLATE_CACHE_SIZE', 1024)))
+    return _registry
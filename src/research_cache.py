@@ -0,0 +1,316 @@
+"""
+Research Cache - stale-while-revalidate cache for research bundles
+Web search and statistics are cached per topic, trending topics per industry
+(thousands of requests share one industry). Readers get whatever is cached at
+once, fresh or slightly stale, while missing and stale entries are refreshed
+by background workers; hot entries are also refreshed on a schedule.
+Results built from the tools' simulated fallbacks (network down) only live
+for a short fallback TTL, so placeholder data is not served as research.
+The agent's own search/statistics tool calls go through shared_result(), so
+a topic being loaded in the background is not fetched a second time.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+try:
+    from src.metrics import record_cache, record_error
+    from src.tracing import tracer
+except ImportError:
+    from metrics import record_cache, record_error
+    from tracing import tracer
+
+
+# Set in the refresh workers, whose tool calls must not wait on their own load
+_in_refresh: ContextVar[bool] = ContextVar('research_refresh', default=False)
+
+
+def _normalize_key(value: str) -> str:
+    return ' '.join((value or '').lower().split())
+
+
+class _Slot:
+    """One cached research part plus its prompt-ready text"""
+
+    __slots__ = ('value', 'context', 'fetched_at', 'last_access', 'refreshing', 'ready', 'fallback')
+
+    def __init__(self):
+        self.value: Optional[Dict[str, Any]] = None
+        self.context = ''
+        self.fetched_at = 0.0
+        self.fallback = False
+        self.last_access = time.time()
+        self.refreshing = False
+        self.ready = threading.Event()
+
+
+def is_fallback(research: Dict[str, Any]) -> bool:
+    """Whether any tool result in a research part is simulated fallback data"""
+    for result in research.values():
+        if isinstance(result, dict):
+            source = result.get('source') or result.get('data_source') or ''
+            if '(Fallback)' in source:
+                return True
+    return False
+
+
+def format_topic_research(research: Dict[str, Any]) -> str:
+    """Compact prompt text for web search results and statistics"""
+    lines = []
+    results = (research.get('web_search') or {}).get('results') or []
+    if results:
+        lines.append("Web research:")
+        lines.extend(f"- {item.get('title', '')}: {item.get('snippet', '')}" for item in results)
+    statistics = (research.get('statistics') or {}).get('statistics') or []
+    if statistics:
+        lines.append("Statistics:")
+        lines.extend(f"- {stat}" for stat in statistics)
+    return "\n".join(lines)
+
+
+def format_trending(research: Dict[str, Any]) -> str:
+    """Compact prompt text for an industry's trending topics"""
+    trending = research.get('trending_topics') or {}
+    topics = trending.get('trending_topics') or []
+    if not topics:
+        return ''
+    return "\n".join([f"Trending in {trending.get('industry', 'the industry')}:"] + [f"- {t}" for t in topics])
+
+
+class ResearchBundleCache:
+    """
+    Research bundles keyed by (topic, industry) with stale-while-revalidate.
+
+    Entries younger than `ttl_seconds` are fresh. Older entries are still
+    served for up to `max_stale_seconds` while a background refresh runs.
+    Missing entries are fetched in the background too; callers either go on
+    without research or wait (`block=True`). At most one refresh per entry is
+    in flight, and refreshes are dropped when the queue is full. Entries
+    built from fallback data are fresh for `fallback_ttl_seconds` and are
+    not served stale beyond that again.
+    """
+
+    def __init__(self, tools,
+                 ttl_seconds: float = 900,
+                 max_stale_seconds: float = 6 * 3600,
+                 max_entries: int = 500,
+                 workers: int = 2,
+                 queue_size: int = 256,
+                 refresh_interval: Optional[float] = None,
+                 fallback_ttl_seconds: float = 60):
+        self.tools = tools
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.fallback_ttl_seconds = fallback_ttl_seconds
+        self.max_entries = max_entries
+        self.workers = workers
+        self.refresh_interval = refresh_interval
+
+        self._tables: Dict[str, "OrderedDict[str, _Slot]"] = {'topic': OrderedDict(), 'industry': OrderedDict()}
+        self._loaders: Dict[str, Callable[[str], Dict[str, Any]]] = {
+            'topic': self._load_topic,
+            'industry': self._load_industry,
+        }
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._stats = {'fresh': 0, 'stale': 0, 'miss': 0, 'refreshes': 0, 'refresh_errors': 0, 'dropped': 0}
+        self.logger = logging.getLogger(__name__)
+
+    def get_bundle(self, topic: str, industry: str, block: bool = False,
+                   timeout: float = 10.0) -> Optional[Dict[str, Any]]:
+        """
+        Cached research for a topic and industry, or None if neither part is
+        usable yet. With block=True missing parts are loaded concurrently
+        before returning (up to `timeout` seconds in total). A new topic in an
+        already cached industry still gets the industry's trending topics.
+        """
+        topic_slot, topic_usable = self._lookup('topic', topic)
+        industry_slot, industry_usable = self._lookup('industry', industry)
+        if block:
+            # Both loads are queued already, so they run side by side
+            wait_until = time.time() + timeout
+            for slot, usable in ((topic_slot, topic_usable), (industry_slot, industry_usable)):
+                if not usable:
+                    slot.ready.wait(max(0.0, wait_until - time.time()))
+        slots = [slot for slot in (topic_slot, industry_slot) if self._usable(slot)]
+        if not slots:
+            return None
+
+        now = time.time()
+        topic_cached = topic_slot in slots
+        bundle = dict(topic_slot.value) if topic_cached else {'web_search': None, 'statistics': None}
+        parts = [topic_slot.context] if topic_cached else []
+        if industry_slot in slots:
+            bundle['trending_topics'] = industry_slot.value.get('trending_topics')
+            parts.append(industry_slot.context)
+        else:
+            bundle['trending_topics'] = None
+        bundle.update({
+            'topic': topic,
+            'industry': industry,
+            'topic_cached': topic_cached,
+            'age_seconds': round(now - min(slot.fetched_at for slot in slots), 1),
+            'stale': any(now - slot.fetched_at > self._lifetime(slot)[0] for slot in slots),
+            'fallback': any(slot.fallback for slot in slots),
+            'prompt_context': "\n\n".join(part for part in parts if part)
+        })
+        return bundle
+
+    def shared_result(self, topic: str, part: str, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
+        """
+        A topic's cached or in-flight web_search/statistics result for the
+        agent's own tool calls, so they reuse a background load instead of
+        fetching the same topic again. None (the tool fetches) when nothing is
+        cached or loading, or when the result is fallback data.
+        """
+        if _in_refresh.get():
+            # The background load itself calls the tools
+            return None
+        with self._lock:
+            slot = self._tables['topic'].get(_normalize_key(topic))
+            loading = slot is not None and slot.refreshing and not self._usable(slot)
+        if slot is None:
+            return None
+        if loading:
+            slot.ready.wait(timeout)
+        shared = self._usable(slot) and not slot.fallback and slot.value.get(part) is not None
+        record_cache('research_shared', shared)
+        return dict(slot.value[part]) if shared else None
+
+    def prefetch(self, topic: str, industry: str):
+        """Start loading a bundle without waiting for it"""
+        self._lookup('topic', topic)
+        self._lookup('industry', industry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = {kind: len(table) for kind, table in self._tables.items()}
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+    def close(self):
+        """Stop the background workers and the refresh scheduler"""
+        self._stop.set()
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                pass
+
+    def _lifetime(self, slot: _Slot):
+        """(ttl, max_stale) of an entry; fallback data gets the short TTL for both"""
+        if slot.fallback:
+            return self.fallback_ttl_seconds, self.fallback_ttl_seconds
+        return self.ttl_seconds, self.max_stale_seconds
+
+    def _usable(self, slot: _Slot) -> bool:
+        return slot.value is not None and time.time() - slot.fetched_at <= sum(self._lifetime(slot))
+
+    def _lookup(self, kind: str, raw_key: str) -> Tuple[_Slot, bool]:
+        """The entry for a key and whether it is usable now; schedules a load if it is stale or missing"""
+        key = _normalize_key(raw_key)
+        now = time.time()
+        with self._lock:
+            table = self._tables[kind]
+            slot = table.get(key)
+            if slot is None:
+                slot = _Slot()
+                table[key] = slot
+                while len(table) > self.max_entries:
+                    table.popitem(last=False)
+            table.move_to_end(key)
+            slot.last_access = now
+            age = now - slot.fetched_at
+            ttl, max_stale = self._lifetime(slot)
+            usable = slot.value is not None and age <= ttl + max_stale
+            if usable and age <= ttl:
+                result = 'fresh'
+            else:
+                result = 'stale' if usable else 'miss'
+                if not usable:
+                    slot.ready.clear()
+                self._schedule_locked(kind, key, raw_key, slot)
+            self._stats[result] += 1
+        record_cache(f'research_{kind}', result == 'fresh')
+        return slot, usable
+
+    def _schedule_locked(self, kind: str, key: str, raw_key: str, slot: _Slot):
+        if slot.refreshing:
+            return
+        try:
+            self._queue.put_nowait((kind, key, raw_key, slot))
+        except queue.Full:
+            self._stats['dropped'] += 1
+            return
+        slot.refreshing = True
+        self._ensure_workers_locked()
+
+    def _ensure_workers_locked(self):
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"research-refresh-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if self.refresh_interval:
+            thread = threading.Thread(target=self._scheduler, name="research-scheduler", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self):
+        _in_refresh.set(True)
+        while not self._stop.is_set():
+            job = self._queue.get()
+            if job is None:
+                return
+            kind, key, raw_key, slot = job
+            try:
+                with tracer.span('research.refresh', kind=kind, key=key):
+                    value = self._loaders[kind](raw_key)
+                context = format_topic_research(value) if kind == 'topic' else format_trending(value)
+                fallback = is_fallback(value)
+                if fallback:
+                    self.logger.info(f"Research for {kind} '{key}' is fallback data, caching it for "
+                                     f"{self.fallback_ttl_seconds:.0f}s only")
+                with self._lock:
+                    slot.value, slot.context, slot.fetched_at = value, context, time.time()
+                    slot.fallback = fallback
+                    self._stats['refreshes'] += 1
+            except Exception as e:
+                record_error('research_cache', e)
+                self.logger.warning(f"Research refresh failed for {kind} '{key}': {e}")
+                with self._lock:
+                    self._stats['refresh_errors'] += 1
+            finally:
+                with self._lock:
+                    slot.refreshing = False
+                slot.ready.set()
+
+    def _scheduler(self):
+        """Refresh entries that are still being read before they go stale"""
+        while not self._stop.wait(self.refresh_interval):
+            now = time.time()
+            with self._lock:
+                for kind, table in self._tables.items():
+                    for key, slot in list(table.items()):
+                        recently_read = now - slot.last_access <= self.max_stale_seconds
+                        expiring = now - slot.fetched_at >= self._lifetime(slot)[0] - self.refresh_interval
+                        if slot.value is not None and recently_read and expiring:
+                            self._schedule_locked(kind, key, key, slot)
+
+    def _load_topic(self, topic: str) -> Dict[str, Any]:
+        return {
+            'web_search': self.tools.search_web(topic),
+            'statistics': self.tools.fetch_statistics(topic),
+        }
+
+    def _load_industry(self, industry: str) -> Dict[str, Any]:
+        return {'trending_topics': self.tools.get_trending_topics(industry)}
@@ -0,0 +1,99 @@
+"""
+Search Backends - pluggable web search for AgentTools.search_web
+Backends are selected with SEARCH_BACKEND (comma-separated, tried in order),
+e.g. "local,duckduckgo" answers from the local index and only goes to the
+network when the index has nothing on the topic
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Any
+from urllib.parse import quote
+
+try:
+    from src.search_parser import extract_duckduckgo_results
+except ImportError:
+    from search_parser import extract_duckduckgo_results
+
+
+class SearchBackend(ABC):
+    """A source of search results; search() returns [] when it has nothing"""
+
+    name = 'base'
+    source = ''
+    requires_network = True
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        ...
+
+
+class DuckDuckGoBackend(SearchBackend):
+    """DuckDuckGo HTML endpoint, streamed and parsed until `limit` results"""
+
+    name = 'duckduckgo'
+    source = 'DuckDuckGo (Real Search)'
+
+    def __init__(self, endpoint: str, http_get: Callable[..., Any]):
+        self.endpoint = endpoint
+        self.http_get = http_get
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+    def search(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        response = self.http_get('search_web', f"{self.endpoint}?q={quote(query)}",
+                                 headers=self.headers, timeout=5, stream=True)
+        try:
+            if response.status_code != 200:
+                return []
+            return extract_duckduckgo_results(
+                response.iter_content(chunk_size=8192),
+                limit=limit,
+                encoding=response.encoding or 'utf-8'
+            )
+        finally:
+            response.close()
+
+
+class LocalIndexBackend(SearchBackend):
+    """BM25 search over the on-disk index of our own documents (no network)"""
+
+    name = 'local'
+    source = 'Local Index (BM25)'
+    requires_network = False
+
+    def __init__(self, index_path: str):
+        try:
+            from src.search_index import LocalSearchIndex
+        except ImportError:
+            from search_index import LocalSearchIndex
+        self.index = LocalSearchIndex(index_path)
+
+    def search(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        return self.index.search(query, limit)
+
+
+def create_search_backends(spec: str, endpoint: str, http_get: Callable[..., Any],
+                           index_path: Optional[str] = None) -> List[SearchBackend]:
+    """
+    Build the backends named in `spec` ("duckduckgo", "local" or a comma list).
+    Backends that cannot be created (e.g. missing index file) are skipped.
+    """
+    logger = logging.getLogger(__name__)
+    factories: Dict[str, Callable[[], SearchBackend]] = {
+        'duckduckgo': lambda: DuckDuckGoBackend(endpoint, http_get),
+        'local': lambda: LocalIndexBackend(index_path or 'search_index.db'),
+    }
+    backends = []
+    for name in (part.strip().lower() for part in (spec or 'duckduckgo').split(',')):
+        if not name:
+            continue
+        if name not in factories:
+            logger.warning(f"Unknown search backend '{name}', expected one of {sorted(factories)}")
+            continue
+        try:
+            backends.append(factories[name]())
+        except Exception as e:
+            logger.warning(f"Search backend '{name}' unavailable: {e}")
+    return backends
@@ -0,0 +1,203 @@
+"""
+Search Index - on-disk BM25 inverted index over a local document corpus
+Documents (blog archive, previous posts, notes) are tokenized once at build
+time into a SQLite postings table; queries read only the postings of their
+terms, so searches take milliseconds and never touch the network.
+
+Build an index:
+    python -m src.search_index build docs/blog exported_posts.json --index search_index.db
+Query it:
+    python -m src.search_index query "AI in healthcare" --index search_index.db
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+try:
+    from src.topic_cache import normalize_topic as tokenize
+except ImportError:
+    from topic_cache import normalize_topic as tokenize
+
+
+TEXT_EXTENSIONS = ('.md', '.txt')
+JSON_EXTENSIONS = ('.json', '.jsonl')
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _document_from_record(record: Dict[str, Any], fallback_url: str) -> Optional[Dict[str, str]]:
+    """Map a post/article record (title/content/body/text/hashtags/url) to a document"""
+    body = record.get('content') or record.get('body') or record.get('text') or ''
+    if record.get('hashtags'):
+        body = f"{body}\n{record['hashtags']}"
+    if not body.strip():
+        return None
+    return {
+        'title': str(record.get('title') or body.strip().split('\n', 1)[0][:80]),
+        'url': str(record.get('url') or fallback_url),
+        'body': body
+    }
+
+
+def iter_corpus(paths: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """
+    Yield documents from files and directories: .md/.txt files (first line is
+    the title) and .json/.jsonl files holding one record or a list of records
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(root, name)
+                for root, _, names in os.walk(path)
+                for name in names
+                if name.endswith(TEXT_EXTENSIONS + JSON_EXTENSIONS)
+            )
+        else:
+            files = [path]
+        for file_path in files:
+            url = f"file://{os.path.abspath(file_path)}"
+            with open(file_path, encoding='utf-8', errors='replace') as f:
+                if file_path.endswith('.jsonl'):
+                    records = [json.loads(line) for line in f if line.strip()]
+                elif file_path.endswith('.json'):
+                    data = json.load(f)
+                    records = data if isinstance(data, list) else [data]
+                else:
+                    text = f.read()
+                    title, _, body = text.strip().partition('\n')
+                    records = [{'title': title.lstrip('# ').strip(), 'content': body or title}]
+            for i, record in enumerate(records):
+                if isinstance(record, dict):
+                    document = _document_from_record(record, url if len(records) == 1 else f"{url}#{i}")
+                    if document:
+                        yield document
+
+
+def build_index(documents: Iterable[Dict[str, str]], index_path: str) -> int:
+    """Write a fresh index for the documents; returns the number indexed"""
+    tmp_path = f"{index_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(
+        "CREATE TABLE docs (doc_id INTEGER PRIMARY KEY, title TEXT, url TEXT, body TEXT, length INTEGER);"
+        "CREATE TABLE postings (term TEXT, doc_id INTEGER, tf INTEGER, PRIMARY KEY (term, doc_id)) WITHOUT ROWID;"
+        "CREATE TABLE terms (term TEXT PRIMARY KEY, df INTEGER) WITHOUT ROWID;"
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value REAL);"
+    )
+    doc_freq: Counter = Counter()
+    total_length = 0
+    count = 0
+    for doc_id, document in enumerate(documents, start=1):
+        tokens = tokenize(f"{document['title']} {document['body']}")
+        term_freq = Counter(tokens)
+        conn.execute("INSERT INTO docs VALUES (?, ?, ?, ?, ?)",
+                     (doc_id, document['title'], document['url'], document['body'], len(tokens)))
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?)",
+                         [(term, doc_id, tf) for term, tf in term_freq.items()])
+        doc_freq.update(term_freq.keys())
+        total_length += len(tokens)
+        count += 1
+    conn.executemany("INSERT INTO terms VALUES (?, ?)", doc_freq.items())
+    conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                     [('documents', count), ('avg_length', total_length / count if count else 0.0)])
+    conn.commit()
+    conn.close()
+    os.replace(tmp_path, index_path)
+    return count
+
+
+class LocalSearchIndex:
+    """Read-only BM25 search over an index built by build_index"""
+
+    def __init__(self, index_path: str, k1: float = 1.2, b: float = 0.75):
+        if not os.path.exists(index_path):
+            raise FileNotFoundError(f"Search index not found: {index_path}")
+        self.index_path = index_path
+        self.k1 = k1
+        self.b = b
+        self._conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        self.documents = int(meta.get('documents', 0))
+        self.avg_length = meta.get('avg_length', 0.0) or 1.0
+
+    def search(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """Top documents by BM25 with the best-matching sentence as snippet"""
+        terms = sorted(set(tokenize(query)))
+        if not terms or not self.documents:
+            return []
+        placeholders = ','.join('?' * len(terms))
+        with self._lock:
+            doc_freq = dict(self._conn.execute(
+                f"SELECT term, df FROM terms WHERE term IN ({placeholders})", terms).fetchall())
+            postings = self._conn.execute(
+                f"SELECT p.term, p.doc_id, p.tf, d.length FROM postings p JOIN docs d USING (doc_id)"
+                f" WHERE p.term IN ({placeholders})", terms).fetchall()
+
+        idf = {term: math.log(1 + (self.documents - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+        scores: Dict[int, float] = {}
+        for term, doc_id, tf, length in postings:
+            norm = tf + self.k1 * (1 - self.b + self.b * length / self.avg_length)
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf[term] * tf * (self.k1 + 1) / norm
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        if not top:
+            return []
+
+        with self._lock:
+            rows = {row[0]: row[1:] for row in self._conn.execute(
+                f"SELECT doc_id, title, url, body FROM docs WHERE doc_id IN ({','.join('?' * len(top))})",
+                [doc_id for doc_id, _ in top]).fetchall()}
+        results = []
+        for doc_id, score in top:
+            title, url, body = rows[doc_id]
+            results.append({
+                'title': title,
+                'snippet': self._snippet(body, set(terms)),
+                'url': url,
+                'score': round(score, 4)
+            })
+        return results
+
+    @staticmethod
+    def _snippet(body: str, terms: set, max_chars: int = 240) -> str:
+        sentences = [s.strip() for s in _SENTENCE_RE.split(' '.join(body.split())) if s.strip()]
+        if not sentences:
+            return 'No snippet available'
+        best = max(sentences, key=lambda s: len(terms.intersection(tokenize(s))))
+        return best if len(best) <= max_chars else best[:max_chars - 3].rstrip() + '...'
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the local BM25 search index")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build = subparsers.add_parser('build', help='index files/directories of .md, .txt, .json and .jsonl')
+    build.add_argument('paths', nargs='+')
+    build.add_argument('--index', default='search_index.db')
+    query = subparsers.add_parser('query', help='run a search against an index')
+    query.add_argument('query')
+    query.add_argument('--index', default='search_index.db')
+    query.add_argument('--limit', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        count = build_index(iter_corpus(args.paths), args.index)
+        print(f"✅ Indexed {count} documents into {args.index}")
+    else:
+        for result in LocalSearchIndex(args.index).search(args.query, args.limit):
+            print(f"{result['score']:>8}  {result['title']}\n          {result['snippet']}\n          {result['url']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Search Parser - streaming extraction of DuckDuckGo HTML results
+A targeted html.parser subclass that reads the response in chunks, decodes
+them incrementally and stops as soon as enough results have been seen, so
+the full page is never decoded or turned into a tree
+"""
+
+import codecs
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional, Union
+
+
+class _StopParsing(Exception):
+    """Raised from a handler once enough results have been collected"""
+
+
+def _has_class(attrs, name: str) -> bool:
+    for key, value in attrs:
+        if key == 'class' and value and name in value.split():
+            return True
+    return False
+
+
+def _clean(parts: List[str]) -> str:
+    return ' '.join(''.join(parts).split())
+
+
+class DuckDuckGoResultParser(HTMLParser):
+    """
+    Collects up to `limit` results from DuckDuckGo's HTML endpoint:
+    <div class="result"> blocks with an a.result__a title/link and an
+    a.result__snippet snippet.
+    """
+
+    def __init__(self, limit: int = 3):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.results: List[Dict[str, str]] = []
+        self._div_depth = 0
+        self._result_depth: Optional[int] = None
+        self._current: Optional[Dict[str, List[str]]] = None
+        self._capture: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'div':
+            self._div_depth += 1
+            if self._result_depth is None and _has_class(attrs, 'result'):
+                self._result_depth = self._div_depth
+                self._current = {'title': [], 'snippet': [], 'url': None}
+        elif tag == 'a' and self._current is not None:
+            if _has_class(attrs, 'result__a'):
+                self._capture = 'title'
+                self._current['url'] = dict(attrs).get('href') or 'N/A'
+            elif _has_class(attrs, 'result__snippet'):
+                self._capture = 'snippet'
+
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            self._capture = None
+        elif tag == 'div':
+            if self._result_depth == self._div_depth:
+                self._finish_result()
+            self._div_depth -= 1
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._current[self._capture].append(data)
+
+    def _finish_result(self):
+        current, self._current, self._result_depth = self._current, None, None
+        title = _clean(current['title'])
+        if title:
+            self.results.append({
+                'title': title,
+                'snippet': _clean(current['snippet']) or 'No snippet available',
+                'url': current['url'] or 'N/A'
+            })
+            if len(self.results) >= self.limit:
+                raise _StopParsing()
+
+
+def extract_duckduckgo_results(chunks: Iterable[Union[bytes, str]], limit: int = 3,
+                               encoding: str = 'utf-8') -> List[Dict[str, str]]:
+    """
+    Parse results from an iterable of body chunks (e.g. response.iter_content),
+    stopping after `limit` results; bytes are decoded incrementally
+    """
+    parser = DuckDuckGoResultParser(limit)
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    try:
+        for chunk in chunks:
+            parser.feed(decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+    except _StopParsing:
+        pass
+    return parser.results
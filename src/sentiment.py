@@ -0,0 +1,132 @@
+"""
+Sentiment - tokenizing lexicon sentiment engine
+One pass over the tokens with a hashed (dict) lexicon of weighted words,
+negation and intensifier handling, and a batch API. Runs in time linear in
+the text length, counts every occurrence, and only matches whole words
+("unsuccessful" is not "success").
+"""
+
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Any
+
+
+POSITIVE_WORDS = {
+    'great': 1.5, 'excellent': 2.0, 'amazing': 2.0, 'wonderful': 2.0, 'fantastic': 2.0,
+    'outstanding': 2.0, 'innovative': 1.5, 'innovation': 1.0, 'success': 1.5, 'successful': 1.5,
+    'successes': 1.5, 'growth': 1.0, 'grow': 1.0, 'growing': 1.0, 'opportunity': 1.0,
+    'opportunities': 1.0, 'good': 1.0, 'better': 1.0, 'best': 1.5, 'improve': 1.0,
+    'improved': 1.0, 'improvement': 1.0, 'benefit': 1.0, 'benefits': 1.0, 'efficient': 1.0,
+    'exciting': 1.5, 'promising': 1.0, 'win': 1.0, 'wins': 1.0, 'gain': 1.0, 'gains': 1.0,
+    'strong': 1.0, 'thrive': 1.5, 'thriving': 1.5, 'valuable': 1.0, 'love': 1.5, 'proud': 1.0,
+}
+
+NEGATIVE_WORDS = {
+    'bad': 1.5, 'poor': 1.5, 'terrible': 2.0, 'awful': 2.0, 'failure': 2.0, 'failures': 2.0,
+    'fail': 1.5, 'failed': 1.5, 'failing': 1.5, 'decline': 1.0, 'declining': 1.0, 'declines': 1.0,
+    'problem': 1.0, 'problems': 1.0, 'issue': 0.5, 'issues': 0.5, 'crisis': 2.0, 'risk': 0.5,
+    'risks': 0.5, 'loss': 1.5, 'losses': 1.5, 'worse': 1.5, 'worst': 2.0, 'difficult': 1.0,
+    'struggle': 1.0, 'struggling': 1.0, 'threat': 1.0, 'weak': 1.0, 'unsuccessful': 1.5,
+    'expensive': 0.5, 'slow': 0.5, 'hate': 2.0, 'disappointing': 1.5, 'layoffs': 1.5,
+}
+
+NEGATORS = frozenset({'not', 'no', 'never', 'none', 'nobody', 'nothing', 'neither', 'nor',
+                      'without', 'hardly', 'barely', 'cannot', 'cant', 'dont', 'doesnt',
+                      'didnt', 'isnt', 'wasnt', 'arent', 'werent', 'wont', 'shouldnt'})
+
+INTENSIFIERS = {
+    'very': 1.5, 'extremely': 1.8, 'highly': 1.5, 'really': 1.3, 'incredibly': 1.8,
+    'truly': 1.3, 'so': 1.2, 'most': 1.3, 'slightly': 0.6, 'somewhat': 0.7,
+}
+
+# Words and clause punctuation (which ends a negation scope); "n't" is
+# expanded to " not" before tokenizing
+_TOKEN_RE = re.compile(r"[a-z]+|[.!?;:,]")
+_CLAUSE_BREAKS = frozenset('.!?;:,')
+NEGATION_SCOPE = 3
+NEGATION_WEIGHT = 0.75
+
+
+class SentimentAnalyzer:
+    """
+    Lexicon-based sentiment with negation and intensifiers.
+
+    A negator flips (and damps by NEGATION_WEIGHT) the polarity of sentiment
+    words in the next NEGATION_SCOPE tokens of the same clause; an
+    intensifier scales the next sentiment word. The compound score is the
+    normalized net weight in [-1, 1] (as in VADER); `score` maps it to [0, 1].
+    """
+
+    def __init__(self,
+                 positive: Optional[Dict[str, float]] = None,
+                 negative: Optional[Dict[str, float]] = None,
+                 alpha: float = 15.0,
+                 threshold: float = 0.05):
+        self.lexicon: Dict[str, float] = {word: weight for word, weight in (positive or POSITIVE_WORDS).items()}
+        self.lexicon.update({word: -weight for word, weight in (negative or NEGATIVE_WORDS).items()})
+        self.alpha = alpha
+        self.threshold = threshold
+
+    def analyze(self, text: str) -> Dict[str, Any]:
+        lexicon = self.lexicon
+        positive = negative = 0.0
+        positive_hits = negative_hits = 0
+        negation_left = 0
+        boost = 1.0
+        tokens = _TOKEN_RE.findall(text.lower().replace("n't", " not").replace("n\u2019t", " not")) if text else []
+
+        for token in tokens:
+            weight = lexicon.get(token)
+            if weight is not None:
+                weight *= boost
+                boost = 1.0
+                if negation_left:
+                    weight *= -NEGATION_WEIGHT
+                if weight > 0:
+                    positive += weight
+                    positive_hits += 1
+                else:
+                    negative -= weight
+                    negative_hits += 1
+            elif token in NEGATORS:
+                negation_left = NEGATION_SCOPE + 1
+            elif token in _CLAUSE_BREAKS:
+                negation_left = 0
+                boost = 1.0
+            elif token in INTENSIFIERS:
+                boost = INTENSIFIERS[token]
+            if negation_left:
+                negation_left -= 1
+
+        net = positive - negative
+        compound = net / math.sqrt(net * net + self.alpha) if net else 0.0
+        if compound > self.threshold:
+            sentiment = 'positive'
+        elif compound < -self.threshold:
+            sentiment = 'negative'
+        else:
+            sentiment = 'neutral'
+        return {
+            'sentiment': sentiment,
+            'score': round((compound + 1) / 2, 4),
+            'compound': round(compound, 4),
+            'positive_indicators': positive_hits,
+            'negative_indicators': negative_hits,
+            'tokens': len(tokens),
+        }
+
+    def analyze_batch(self, texts: Iterable[str]) -> List[Dict[str, Any]]:
+        """Score many texts in one call"""
+        analyze = self.analyze
+        return [analyze(text) for text in texts]
+
+
+_default_analyzer: Optional[SentimentAnalyzer] = None
+
+
+def get_analyzer() -> SentimentAnalyzer:
+    """Process-wide analyzer with the default lexicon"""
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = SentimentAnalyzer()
+    return _default_analyzer
@@ -0,0 +1,210 @@
+"""
+Topic Cache - similarity cache for near-duplicate topics
+Topics are normalized and embedded locally (hashing-trick TF-IDF over words
+and character trigrams, no network). An inverted index over hashed features
+finds candidates, and a cached entry is served when cosine similarity passes
+the configured threshold.
+"""
+
+import copy
+import math
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    from src.metrics import record_cache
+except ImportError:
+    from metrics import record_cache
+
+
+STOPWORDS = frozenset({
+    'a', 'an', 'the', 'in', 'for', 'of', 'on', 'and', 'to', 'with', 'about',
+    'at', 'by', 'from', 'into', 'is', 'are', 'vs', 'versus', 'how', 'why', 'what'
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_topic(topic: str) -> List[str]:
+    """Lowercase, drop punctuation and stopwords, strip simple plurals"""
+    tokens = []
+    for token in _TOKEN_RE.findall((topic or '').lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def numeric_tokens(topic: str) -> Tuple[str, ...]:
+    """Numbers in a topic (years, counts) in order; topics only match if these agree"""
+    return tuple(token for token in normalize_topic(topic) if token.isdigit())
+
+
+def topic_features(topic: str, dimensions: int = 1 << 18) -> Dict[int, float]:
+    """
+    Hashed term frequencies of word unigrams and per-word character trigrams.
+    Every word carries the same mass (1 for the word, 1 spread over its
+    trigrams), so long words do not drown out short ones. Word order does not
+    matter, and trigrams tolerate small spelling changes.
+    """
+    features: Dict[int, float] = {}
+    for token in normalize_topic(topic):
+        padded = f"#{token}#"
+        trigrams = [padded[i:i + 3] for i in range(len(padded) - 2)]
+        weighted = [(f"w:{token}", 1.0)] + [(f"c:{gram}", 1.0 / len(trigrams)) for gram in trigrams]
+        for gram, weight in weighted:
+            index = zlib.crc32(gram.encode('utf-8')) % dimensions
+            features[index] = features.get(index, 0.0) + weight
+    return features
+
+
+class _Entry:
+    __slots__ = ('entry_id', 'topic', 'partition', 'features', 'numbers', 'payload', 'created_at', 'hits')
+
+    def __init__(self, entry_id, topic, partition, features, payload):
+        self.entry_id = entry_id
+        self.topic = topic
+        self.partition = partition
+        self.features = features
+        self.numbers = numeric_tokens(topic)
+        self.payload = payload
+        self.created_at = time.time()
+        self.hits = 0
+
+
+class TopicSimilarityCache:
+    """
+    Bounded LRU cache keyed by topic similarity.
+
+    Entries live in partitions (e.g. tone/length/audience) so that a post is
+    only reused for an equivalent request. IDF weights come from the topics
+    currently in the cache, so very common words ("ai") count for less than
+    distinctive ones ("healthcare"). Numbers must match exactly: "AI trends
+    2024" never serves "AI trends 2025".
+    """
+
+    def __init__(self, threshold: float = 0.85, max_entries: int = 1000,
+                 ttl_seconds: Optional[float] = 24 * 3600, name: str = 'topic_cache'):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._postings: Dict[Tuple[Any, int], set] = {}
+        self._doc_freq: Dict[int, int] = {}
+        self._next_id = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, topic: str, partition: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        Return {'payload', 'similarity', 'matched_topic'} for the most similar
+        cached topic at or above the threshold, else None
+        """
+        features = topic_features(topic)
+        numbers = numeric_tokens(topic)
+        with self._lock:
+            best, best_score = None, 0.0
+            if features:
+                candidates = set()
+                for feature in features:
+                    candidates.update(self._postings.get((partition, feature), ()))
+                query_vec = self._weigh(features)
+                query_norm = math.sqrt(sum(w * w for w in query_vec.values()))
+                now = time.time()
+                for entry_id in candidates:
+                    entry = self._entries[entry_id]
+                    if entry.numbers != numbers:
+                        continue
+                    if self.ttl_seconds and now - entry.created_at > self.ttl_seconds:
+                        continue
+                    score = self._cosine(query_vec, query_norm, self._weigh(entry.features))
+                    if score > best_score:
+                        best, best_score = entry, score
+
+            hit = best is not None and best_score >= self.threshold
+            if hit:
+                self._hits += 1
+                best.hits += 1
+                self._entries.move_to_end(best.entry_id)
+                result = {
+                    'payload': copy.deepcopy(best.payload),
+                    'similarity': round(best_score, 4),
+                    'matched_topic': best.topic
+                }
+            else:
+                self._misses += 1
+                result = None
+        record_cache(self.name, hit)
+        return result
+
+    def store(self, topic: str, payload: Any, partition: Any = None):
+        """Cache a payload for a topic, evicting the least recently used entry if full"""
+        features = topic_features(topic)
+        if not features:
+            return
+        with self._lock:
+            self._next_id += 1
+            entry = _Entry(self._next_id, topic, partition, features, copy.deepcopy(payload))
+            self._entries[entry.entry_id] = entry
+            for feature in features:
+                self._postings.setdefault((partition, feature), set()).add(entry.entry_id)
+                self._doc_freq[feature] = self._doc_freq.get(feature, 0) + 1
+            while len(self._entries) > self.max_entries:
+                _, oldest = self._entries.popitem(last=False)
+                self._remove_locked(oldest)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+            self._doc_freq.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'threshold': self.threshold,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0
+            }
+
+    def _weigh(self, features: Dict[int, float]) -> Dict[int, float]:
+        total_docs = len(self._entries) + 1
+        return {
+            feature: tf * (math.log((1 + total_docs) / (1 + self._doc_freq.get(feature, 0))) + 1.0)
+            for feature, tf in features.items()
+        }
+
+    @staticmethod
+    def _cosine(query_vec: Dict[int, float], query_norm: float, entry_vec: Dict[int, float]) -> float:
+        entry_norm = math.sqrt(sum(w * w for w in entry_vec.values()))
+        if not query_norm or not entry_norm:
+            return 0.0
+        dot = sum(weight * entry_vec.get(feature, 0.0) for feature, weight in query_vec.items())
+        return dot / (query_norm * entry_norm)
+
+    def _remove_locked(self, entry: _Entry):
+        for feature in entry.features:
+            key = (entry.partition, feature)
+            postings = self._postings.get(key)
+            if postings is not None:
+                postings.discard(entry.entry_id)
+                if not postings:
+                    del self._postings[key]
+            remaining = self._doc_freq.get(feature, 0) - 1
+            if remaining > 0:
+                self._doc_freq[feature] = remaining
+            else:
+                self._doc_freq.pop(feature, None)
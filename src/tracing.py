@@ -0,0 +1,199 @@
+"""
+Tracing - OpenTelemetry-style spans for the orchestration pipeline
+Spans carry timings and attributes, nest through a context variable and can be
+exported as OTLP/JSON lines to a local file
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Any
+
+try:
+    from src.config import get_secret
+except ImportError:
+    from config import get_secret
+
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """A timed unit of work inside a trace"""
+
+    def __init__(self, name: str, parent: Optional["Span"] = None,
+                 attributes: Optional[Dict[str, Any]] = None, tracer: Optional["Tracer"] = None):
+        self.name = name
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = "ok"
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self._tracer = tracer
+        # All spans of a trace share one list owned by the root span
+        self._trace: List["Span"] = parent._trace if parent else []
+        self._trace.append(self)
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent is None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException):
+        self.status = "error"
+        self.attributes["exception.type"] = type(error).__name__
+        self.attributes["exception.message"] = str(error)[:500]
+
+    def end(self):
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.is_root and self._tracer is not None:
+            self._tracer._on_trace_end(self)
+
+    def trace_spans(self) -> List["Span"]:
+        """All spans recorded so far in this span's trace, in start order"""
+        return sorted(self._trace, key=lambda s: s.start_ns)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or time.time_ns()),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2 if self.status == "error" else 1}
+        }
+        if self.parent:
+            span["parentSpanId"] = self.parent.span_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class JsonFileExporter:
+    """Appends each finished trace to a file as one OTLP/JSON line"""
+
+    def __init__(self, path: str, service_name: str = "linkedin-post-agent"):
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "linkedin.agent"},
+                    "spans": [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+        line = json.dumps(payload)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class Tracer:
+    """Creates spans and hands finished traces to the configured exporters"""
+
+    def __init__(self, exporters: Optional[List[Any]] = None,
+                 configure: Optional[Callable[["Tracer"], None]] = None):
+        self.exporters = list(exporters or [])
+        self.logger = logging.getLogger(__name__)
+        # Runs once before the first export, so config is not read at import
+        self._configure = configure
+        self._configure_lock = threading.Lock()
+
+    def add_exporter(self, exporter):
+        self.exporters.append(exporter)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes) -> Span:
+        """Start a span without making it current; call span.end() when done"""
+        if parent is None:
+            parent = _current_span.get()
+        return Span(name, parent=parent, attributes=attributes, tracer=self)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Run a block inside a child of the current span"""
+        span = self.start_span(name, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def _on_trace_end(self, root: Span):
+        if self._configure is not None:
+            with self._configure_lock:
+                configure, self._configure = self._configure, None
+                if configure is not None:
+                    configure(self)
+        spans = root.trace_spans()
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                self.logger.warning(f"Trace export failed: {e}")
+
+
+def build_waterfall(root: Span) -> List[Dict[str, Any]]:
+    """
+    Flatten a trace into rows for a waterfall chart: depth, offset and
+    duration in milliseconds relative to the root span
+    """
+    depths = {root.span_id: 0}
+    rows = []
+    for span in root.trace_spans():
+        depth = depths.get(span.parent.span_id, 0) + 1 if span.parent else 0
+        depths[span.span_id] = depth
+        rows.append({
+            'name': span.name,
+            'depth': depth,
+            'offset_ms': round((span.start_ns - root.start_ns) / 1e6, 2),
+            'duration_ms': round(span.duration_ms, 2),
+            'status': span.status,
+            'attributes': {k: v for k, v in span.attributes.items()}
+        })
+    return rows
+
+
+def _configure_default_tracer(tracer: Tracer):
+    """Add the TRACE_EXPORT_PATH exporter (get_secret imports streamlit, so not at import)"""
+    path = get_secret('TRACE_EXPORT_PATH')
+    if path:
+        tracer.add_exporter(JsonFileExporter(path))
+
+
+tracer = Tracer(configure=_configure_default_tracer)
@@ -0,0 +1,75 @@
+"""
+UI Assets - minified stylesheets for the Streamlit apps
+The apps' CSS lives in assets/*.css. Each stylesheet is read and minified
+once per process and the resulting <style> markup is reused by every rerun
+of every session.
+
+Streamlit drops elements that a rerun does not emit again, so the markup is
+sent on every rerun; minification keeps it small. (A static <link> is not an
+option: Streamlit's static file handler serves .css as text/plain with
+nosniff, which browsers refuse as a stylesheet.)
+"""
+
+import os
+import re
+import threading
+from typing import Dict, NamedTuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT_DIR, 'assets')
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_STRING_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'\s*([{};,>~])\s*')
+
+
+class Stylesheet(NamedTuple):
+    name: str
+    css: str
+    source_bytes: int
+
+    @property
+    def markup(self) -> str:
+        return f"<style>{self.css}</style>"
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace, leaving string literals (e.g. url('...')) untouched"""
+    strings = []
+
+    def stash(match):
+        strings.append(match.group())
+        return f"\0{len(strings) - 1}\0"
+
+    css = _STRING_RE.sub(stash, _COMMENT_RE.sub('', css))
+    css = _WHITESPACE_RE.sub(' ', css)
+    css = _PUNCTUATION_RE.sub(r'\1', css)
+    # "a: b" -> "a:b" only inside declarations, so selectors like "a :hover" keep their meaning
+    css = re.sub(r'\{([^{}]*)\}', lambda m: '{' + re.sub(r'\s*:\s*', ':', m.group(1)) + '}', css)
+    css = css.replace(';}', '}').strip()
+    return re.sub(r'\0(\d+)\0', lambda m: strings[int(m.group(1))], css)
+
+
+_stylesheets: Dict[str, Stylesheet] = {}
+_lock = threading.Lock()
+
+
+def load_stylesheet(name: str) -> Stylesheet:
+    """assets/<name>.css, minified on first use"""
+    sheet = _stylesheets.get(name)
+    if sheet is None:
+        with _lock:
+            sheet = _stylesheets.get(name)
+            if sheet is None:
+                with open(os.path.join(ASSETS_DIR, f"{name}.css"), encoding='utf-8') as f:
+                    source = f.read()
+                sheet = _stylesheets[name] = Stylesheet(name, minify_css(source), len(source.encode('utf-8')))
+    return sheet
+
+
+def inject_css(name: str):
+    """Add assets/<name>.css to the current Streamlit page"""
+    import streamlit as st
+
+    st.markdown(load_stylesheet(name).markup, unsafe_allow_html=True)
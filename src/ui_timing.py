@@ -0,0 +1,85 @@
+"""
+UI Timing - script execution time per Streamlit interaction
+Full app reruns and fragment reruns are timed separately, observed in the
+UI_SCRIPT_RUN histogram and kept per session, so the cost of each kind of
+interaction (a button in a fragment vs one that reruns the whole app) can
+be compared in the app itself or on the metrics endpoint.
+"""
+
+import functools
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Callable, Dict, List, Any
+
+try:
+    from src.metrics import UI_SCRIPT_RUN
+except ImportError:
+    from metrics import UI_SCRIPT_RUN
+
+HISTORY_KEY = '_script_run_timings'
+HISTORY_SIZE = 50
+
+# Set while a full app run is being timed; fragments rendered as part of it
+# are covered by that run and are not recorded on their own
+_app_run: ContextVar[bool] = ContextVar('app_run', default=False)
+
+
+def _record(scope: str, name: str, seconds: float):
+    import streamlit as st
+
+    UI_SCRIPT_RUN.observe(seconds, scope=scope, name=name)
+    try:
+        history = st.session_state.get(HISTORY_KEY)
+        if history is None:
+            history = st.session_state[HISTORY_KEY] = deque(maxlen=HISTORY_SIZE)
+        history.append({'scope': scope, 'name': name, 'ms': round(seconds * 1000, 1),
+                        'at': datetime.now().strftime('%H:%M:%S')})
+    except Exception:
+        # No session (e.g. bare-mode script execution)
+        pass
+    logging.getLogger(__name__).debug(f"⏱️ {scope} run {name}: {seconds * 1000:.1f} ms")
+
+
+@contextmanager
+def timed_app_run(name: str = 'app'):
+    """Time one full script run (including runs ended by st.rerun or st.stop)"""
+    token = _app_run.set(True)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _app_run.reset(token)
+        _record('app', name, time.perf_counter() - started)
+
+
+def timed_fragment(name: str) -> Callable:
+    """
+    st.fragment that records its own execution time whenever it reruns on
+    its own (a widget inside it was used)
+    """
+    def decorator(func: Callable) -> Callable:
+        import streamlit as st
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _app_run.get():
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record('fragment', name, time.perf_counter() - started)
+
+        return st.fragment(wrapper)
+    return decorator
+
+
+def recent_runs() -> List[Dict[str, Any]]:
+    """This session's recorded runs, newest first"""
+    import streamlit as st
+
+    return list(reversed(st.session_state.get(HISTORY_KEY, ())))
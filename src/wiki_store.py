@@ -0,0 +1,217 @@
+"""
+Wiki Store - offline, memory-mapped Wikipedia summary store
+Built once from a dump (JSONL of {"title", "extract", "redirects"} or the
+enwiki abstract XML), it keeps each summary together with its precomputed
+numeric-fact sentences and an open-addressing hash table keyed by normalized
+title, so fetch_statistics can answer in microseconds without any network.
+
+Build a store:
+    python -m src.wiki_store build enwiki-latest-abstract.xml.gz --output wiki_store.bin
+    python -m src.wiki_store build summaries.jsonl --output wiki_store.bin
+Look up a title:
+    python -m src.wiki_store lookup "Artificial intelligence" --store wiki_store.bin
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+MAGIC = b'WIKISTR2'
+# magic, record count, slot count, table offset
+_HEADER = struct.Struct('<8sQQQ')
+# key hash, record offset (or alias offset with _ALIAS_FLAG set)
+_SLOT = struct.Struct('<QQ')
+_LENGTHS = struct.Struct('<HHIH')
+# key_len u16, target record offset u64
+_ALIAS = struct.Struct('<HQ')
+_ALIAS_FLAG = 1 << 63
+
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'(])')
+_DIGIT_RE = re.compile(r'\d')
+
+
+def normalize_title(title: str) -> str:
+    """Case-, underscore- and whitespace-insensitive title key"""
+    return ' '.join((title or '').replace('_', ' ').casefold().split())
+
+
+def _key_hash(key: str) -> int:
+    # 0 marks an empty slot
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+
+
+def numeric_sentences(text: str, limit: int = 5) -> List[str]:
+    """Sentences of a summary that contain a number (dates, sizes, counts)"""
+    facts = []
+    for sentence in _SENTENCE_RE.split(' '.join((text or '').split())):
+        if _DIGIT_RE.search(sentence):
+            facts.append(sentence.strip())
+            if len(facts) >= limit:
+                break
+    return facts
+
+
+def _open(path: str):
+    return gzip.open(path, 'rt', encoding='utf-8') if path.endswith('.gz') else open(path, encoding='utf-8')
+
+
+def iter_dump(path: str) -> Iterator[Tuple[str, str, List[str]]]:
+    """Yield (title, extract, redirects) from a JSONL or abstract-XML dump"""
+    stem = path[:-3] if path.endswith('.gz') else path
+    if stem.endswith('.xml'):
+        import xml.etree.ElementTree as ET
+
+        with _open(path) as f:
+            for _, elem in ET.iterparse(f, events=('end',)):
+                if elem.tag == 'doc':
+                    title = (elem.findtext('title') or '')
+                    if title.startswith('Wikipedia: '):
+                        title = title[len('Wikipedia: '):]
+                    yield title, elem.findtext('abstract') or '', []
+                    elem.clear()
+    else:
+        with _open(path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record.get('title', ''), record.get('extract', ''), record.get('redirects') or []
+
+
+def build_store(entries: Iterable[Tuple[str, str, List[str]]], output_path: str, load_factor: float = 0.5) -> int:
+    """
+    Write the store file. Records are laid out as
+    [title_len u16][key_len u16][extract_len u32][fact_count u16] title key extract (fact_len u16, fact)*
+    each followed by its redirects as [key_len u16][target offset u64] key,
+    then the hash table; returns the number of records.
+    """
+    tmp_path = f"{output_path}.tmp"
+    keys: Dict[str, int] = {}
+    count = 0
+    with open(tmp_path, 'wb') as out:
+        out.write(b'\0' * _HEADER.size)
+        for title, extract, redirects in entries:
+            key = normalize_title(title)
+            if not key or not extract or key in keys:
+                continue
+            offset = out.tell()
+            title_b, key_b, extract_b = title.encode('utf-8'), key.encode('utf-8'), extract.encode('utf-8')
+            facts = [fact.encode('utf-8')[:0xFFFF] for fact in numeric_sentences(extract)]
+            out.write(_LENGTHS.pack(len(title_b), len(key_b), len(extract_b), len(facts)))
+            out.write(title_b + key_b + extract_b)
+            for fact in facts:
+                out.write(struct.pack('<H', len(fact)) + fact)
+            keys[key] = offset
+            for alias in redirects:
+                alias = normalize_title(alias)
+                if alias and alias not in keys:
+                    # Aliases keep their own key, so lookups can verify a hash match
+                    keys[alias] = out.tell() | _ALIAS_FLAG
+                    alias_b = alias.encode('utf-8')
+                    out.write(_ALIAS.pack(len(alias_b), offset) + alias_b)
+            count += 1
+
+        slot_count = 1
+        while slot_count * load_factor < max(len(keys), 1):
+            slot_count <<= 1
+        table = bytearray(slot_count * _SLOT.size)
+        for key, offset in keys.items():
+            key_hash = _key_hash(key)
+            slot = key_hash & (slot_count - 1)
+            while _SLOT.unpack_from(table, slot * _SLOT.size)[0]:
+                slot = (slot + 1) & (slot_count - 1)
+            _SLOT.pack_into(table, slot * _SLOT.size, key_hash, offset)
+        table_offset = out.tell()
+        out.write(table)
+        out.seek(0)
+        out.write(_HEADER.pack(MAGIC, count, slot_count, table_offset))
+    os.replace(tmp_path, output_path)
+    return count
+
+
+class WikiSummaryStore:
+    """Read-only, memory-mapped view of a store built by build_store"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.records, self._slots, self._table_offset = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a wiki summary store: {path}")
+
+    def lookup(self, title: str) -> Optional[Dict[str, Any]]:
+        """Summary and numeric facts for a title (or redirect), None if absent"""
+        key = normalize_title(title)
+        key_hash = _key_hash(key)
+        mask = self._slots - 1
+        slot = key_hash & mask
+        for _ in range(self._slots):
+            stored_hash, offset = _SLOT.unpack_from(self._mm, self._table_offset + slot * _SLOT.size)
+            if not stored_hash:
+                return None
+            if stored_hash == key_hash:
+                # Distinct keys can share a 64-bit hash: compare the stored key before trusting it
+                if offset & _ALIAS_FLAG:
+                    key_len, target = _ALIAS.unpack_from(self._mm, offset & ~_ALIAS_FLAG)
+                    start = (offset & ~_ALIAS_FLAG) + _ALIAS.size
+                    if self._mm[start:start + key_len] == key.encode('utf-8'):
+                        return self._read(target)
+                elif self._record_key(offset) == key:
+                    return self._read(offset)
+            slot = (slot + 1) & mask
+        return None
+
+    def _record_key(self, offset: int) -> str:
+        title_len, key_len, _, _ = _LENGTHS.unpack_from(self._mm, offset)
+        start = offset + _LENGTHS.size + title_len
+        return self._mm[start:start + key_len].decode('utf-8')
+
+    def _read(self, offset: int) -> Dict[str, Any]:
+        mm = self._mm
+        title_len, key_len, extract_len, fact_count = _LENGTHS.unpack_from(mm, offset)
+        pos = offset + _LENGTHS.size
+        title = mm[pos:pos + title_len].decode('utf-8')
+        pos += title_len
+        key = mm[pos:pos + key_len].decode('utf-8')
+        pos += key_len
+        extract = mm[pos:pos + extract_len].decode('utf-8')
+        pos += extract_len
+        facts = []
+        for _ in range(fact_count):
+            (fact_len,) = struct.unpack_from('<H', mm, pos)
+            facts.append(mm[pos + 2:pos + 2 + fact_len].decode('utf-8', errors='replace'))
+            pos += 2 + fact_len
+        return {'title': title, 'key': key, 'extract': extract, 'statistics': facts}
+
+    def close(self):
+        self._mm.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the offline Wikipedia summary store")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build = subparsers.add_parser('build', help='build from .jsonl or abstract .xml dumps (optionally .gz)')
+    build.add_argument('dumps', nargs='+')
+    build.add_argument('--output', default='wiki_store.bin')
+    lookup = subparsers.add_parser('lookup', help='look up a title')
+    lookup.add_argument('title')
+    lookup.add_argument('--store', default='wiki_store.bin')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        entries = (entry for dump in args.dumps for entry in iter_dump(dump))
+        count = build_store(entries, args.output)
+        print(f"✅ Stored {count} summaries in {args.output}")
+    else:
+        record = WikiSummaryStore(args.store).lookup(args.title)
+        print(json.dumps(record, indent=2, ensure_ascii=False) if record else "Not found")
+
+
+if __name__ == '__main__':
+    main()
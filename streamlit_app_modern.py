@@ -3,20 +3,22 @@ import sys
 import os
 from datetime import datetime
 import json
-import time
-import plotly.express as px
-import plotly.graph_objects as go
+import html
 from typing import List, Dict, Any
 import re
+import uuid
 
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 
 try:
     from src.advanced_agent_orchestrator import LinkedInAgentOrchestrator
-    from src.langchain_post_agent import LangChainPostAgent
-    from src.email_sender import EmailSender
-    from src.agent_tools import AgentTools
+    from src.config import get_secret
+    from src.lazy_imports import warm_imports
+    from src.metrics import start_metrics_server
+    from src.ui_assets import inject_css
+    from src.ui_timing import timed_app_run, timed_fragment, recent_runs
+    from src.generation_jobs import get_job_manager
 except ImportError as e:
     st.error(f"🚨 Agent Module Error: {e}")
     st.stop()
@@ -31,1183 +33,8 @@ st.set_page_config(
 
 
 def load_agent_css():
-    st.markdown("""
-    <style>
-    /* Import futuristic fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@300;400;600;700&family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styles with LinkedIn-inspired Dark Background */
-    .stApp {
-        background: linear-gradient(135deg, #000000 0%, #0a1520 25%, #0d1f2d 50%, #0a1520 75%, #000000 100%);
-        background-size: 400% 400%;
-        animation: gradientShift 15s ease infinite;
-        font-family: 'Space Grotesk', sans-serif;
-        color: #ffffff;
-        position: relative;
-        overflow-x: hidden;
-    }
-    
-    /* Animated particles background */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            radial-gradient(2px 2px at 20% 30%, rgba(10, 102, 194, 0.4), transparent),
-            radial-gradient(2px 2px at 60% 70%, rgba(56, 152, 236, 0.3), transparent),
-            radial-gradient(1px 1px at 50% 50%, rgba(255, 255, 255, 0.15), transparent),
-            radial-gradient(1px 1px at 80% 10%, rgba(10, 102, 194, 0.35), transparent);
-        background-size: 200px 200px, 300px 300px, 150px 150px, 250px 250px;
-        background-position: 0 0, 40px 60px, 130px 270px, 70px 100px;
-        animation: particleFloat 20s linear infinite;
-        pointer-events: none;
-        z-index: 0;
-    }
-    
-    @keyframes gradientShift {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    @keyframes particleFloat {
-        from { transform: translateY(0px); }
-        to { transform: translateY(-1000px); }
-    }
-    
-    /* Ensure content is above background */
-    .stApp > * {
-        position: relative;
-        z-index: 1;
-    }
-    
-    /* Enhanced Text Rendering for All Elements */
-    * {
-        text-rendering: optimizeLegibility !important;
-        -webkit-font-smoothing: antialiased !important;
-        -moz-osx-font-smoothing: grayscale !important;
-        font-feature-settings: "kern" 1, "liga" 1 !important;
-    }
-    
-    /* Improved Typography Base */
-    body, div, p, span {
-        word-spacing: 1px !important;
-        letter-spacing: 0.5px !important;
-        line-height: 1.8 !important;
-    }
-    
-    /* Glassmorphism Header Container with 3D effect */
-    .agent-header {
-        background: rgba(5, 10, 20, 0.8);
-        backdrop-filter: blur(20px) saturate(180%);
-        -webkit-backdrop-filter: blur(20px) saturate(180%);
-        border: 2px solid rgba(10, 102, 194, 0.4);
-        border-radius: 20px;
-        padding: 1rem 1.5rem;
-        margin-bottom: 1.5rem;
-        text-align: center;
-        box-shadow: 
-            0 5px 20px 0 rgba(10, 102, 194, 0.2),
-            inset 0 0 30px rgba(10, 102, 194, 0.05);
-        animation: headerPulse 4s ease-in-out infinite;
-        transform-style: preserve-3d;
-        perspective: 1000px;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .agent-header::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: linear-gradient(
-            45deg,
-            transparent,
-            rgba(10, 102, 194, 0.15),
-            transparent
-        );
-        animation: shimmer 3s infinite;
-    }
-    
-    @keyframes headerPulse {
-        0%, 100% { 
-            border-color: rgba(10, 102, 194, 0.5);
-            box-shadow: 
-                0 8px 32px 0 rgba(10, 102, 194, 0.3),
-                inset 0 0 40px rgba(10, 102, 194, 0.08),
-                0 0 80px rgba(10, 102, 194, 0.15);
-        }
-        50% { 
-            border-color: rgba(56, 152, 236, 0.7);
-            box-shadow: 
-                0 8px 40px 0 rgba(10, 102, 194, 0.5),
-                inset 0 0 60px rgba(10, 102, 194, 0.15),
-                0 0 120px rgba(56, 152, 236, 0.3);
-        }
-    }
-    
-    @keyframes shimmer {
-        0% { transform: translateX(-100%) translateY(-100%) rotate(45deg); }
-        100% { transform: translateX(100%) translateY(100%) rotate(45deg); }
-    }
-    
-    .agent-title {
-        font-family: 'Orbitron', monospace;
-        font-size: 2rem;
-        font-weight: 900;
-        background: linear-gradient(135deg, #0A66C2, #3898EC, #0A66C2);
-        background-size: 200% 200%;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        animation: gradientText 3s ease infinite;
-        margin: 0;
-        letter-spacing: 6px;
-        text-transform: uppercase;
-        filter: drop-shadow(0 0 20px rgba(10, 102, 194, 0.7));
-        position: relative;
-        z-index: 2;
-    }
-    
-    @keyframes gradientText {
-        0%, 100% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-    }
-    
-    .agent-subtitle {
-        font-size: 1.1rem;
-        background: linear-gradient(90deg, #3898EC, #ffffff, #3898EC);
-        background-size: 200% 200%;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        animation: gradientText 5s ease infinite;
-        margin-top: 0.8rem;
-        font-weight: 500;
-        letter-spacing: 2px;
-        text-transform: uppercase;
-        position: relative;
-        z-index: 2;
-    }
-    
-    .agent-status {
-        font-size: 1.1rem;
-        color: #00ff88;
-        margin-top: 1rem;
-        font-weight: 700;
-        letter-spacing: 2px;
-        position: relative;
-        z-index: 2;
-        animation: statusBlink 2s ease-in-out infinite;
-    }
-    
-    @keyframes statusBlink {
-        0%, 100% { opacity: 1; text-shadow: 0 0 10px rgba(0, 255, 136, 0.8); }
-        50% { opacity: 0.7; text-shadow: 0 0 20px rgba(0, 255, 136, 1); }
-    }
-    
-    /* Enhanced Status Dashboard with 3D Cards */
-    .status-dashboard {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
-        gap: 1rem;
-        margin: 1.5rem 0;
-    }
-    
-    .status-card {
-        background: rgba(5, 10, 20, 0.7);
-        backdrop-filter: blur(15px) saturate(180%);
-        -webkit-backdrop-filter: blur(15px) saturate(180%);
-        border: 1px solid rgba(10, 102, 194, 0.3);
-        border-radius: 15px;
-        padding: 1rem 0.8rem;
-        text-align: center;
-        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        transform: translateY(0);
-        box-shadow: 
-            0 4px 15px 0 rgba(10, 102, 194, 0.15),
-            inset 0 0 15px rgba(10, 102, 194, 0.03);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .status-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(
-            90deg,
-            transparent,
-            rgba(10, 102, 194, 0.3),
-            transparent
-        );
-        transition: left 0.5s;
-    }
-    
-    .status-card:hover {
-        border-color: #0A66C2;
-        box-shadow: 
-            0 8px 25px rgba(10, 102, 194, 0.3),
-            inset 0 0 25px rgba(10, 102, 194, 0.1),
-            0 0 40px rgba(56, 152, 236, 0.2);
-        transform: translateY(-5px) scale(1.02);
-    }
-    
-    .status-card:hover::before {
-        left: 100%;
-    }
-    
-    .status-icon {
-        font-size: 2rem;
-        margin-bottom: 0.6rem;
-        display: block;
-        animation: iconFloat 3s ease-in-out infinite;
-        filter: drop-shadow(0 0 8px rgba(10, 102, 194, 0.5));
-    }
-    
-    @keyframes iconFloat {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-10px); }
-    }
-    
-    .status-title {
-        color: #3898EC;
-        font-weight: 700;
-        font-size: 0.75rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 0.3rem;
-    }
-    
-    .status-value {
-        color: #ffffff;
-        font-size: 1.1rem;
-        font-weight: 700;
-        margin-top: 0.3rem;
-        text-shadow: 0 0 8px rgba(255, 255, 255, 0.4);
-    }
-    
-    /* Enhanced Control Panels with Glassmorphism */
-    .control-panel {
-        background: rgba(5, 10, 20, 0.7);
-        backdrop-filter: blur(20px) saturate(180%);
-        -webkit-backdrop-filter: blur(20px) saturate(180%);
-        border: 1px solid rgba(10, 102, 194, 0.3);
-        border-radius: 18px;
-        padding: 1.5rem;
-        margin: 1.5rem 0;
-        box-shadow: 
-            0 5px 20px 0 rgba(10, 102, 194, 0.15),
-            inset 0 0 20px rgba(10, 102, 194, 0.05);
-        position: relative;
-        overflow: hidden;
-        transition: all 0.3s ease;
-    }
-    
-    .control-panel:hover {
-        border-color: rgba(10, 102, 194, 0.7);
-        box-shadow: 
-            0 12px 48px 0 rgba(10, 102, 194, 0.35),
-            inset 0 0 50px rgba(10, 102, 194, 0.12);
-    }
-    
-    .control-panel::before {
-        content: '';
-        position: absolute;
-        top: -2px;
-        left: -2px;
-        right: -2px;
-        bottom: -2px;
-        background: linear-gradient(45deg, #0A66C2, #3898EC, #0A66C2, #3898EC);
-        background-size: 400% 400%;
-        border-radius: 25px;
-        opacity: 0;
-        z-index: -1;
-        animation: borderGlow 3s ease infinite;
-        transition: opacity 0.3s;
-    }
-    
-    .control-panel:hover::before {
-        opacity: 0.5;
-    }
-    
-    @keyframes borderGlow {
-        0%, 100% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-    }
-    
-    .panel-title {
-        font-family: 'Orbitron', monospace;
-        font-size: 1.3rem;
-        background: linear-gradient(135deg, #0A66C2, #3898EC);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        margin-bottom: 1.2rem;
-        text-align: center;
-        font-weight: 700;
-        letter-spacing: 3px;
-        text-transform: uppercase;
-        filter: drop-shadow(0 0 15px rgba(10, 102, 194, 0.5));
-    }
-    
-    /* Futuristic Buttons with LinkedIn Theme */
-    .stButton > button {
-        background: linear-gradient(135deg, #0A66C2 0%, #3898EC 50%, #0A66C2 100%);
-        background-size: 200% 200%;
-        color: #ffffff;
-        border: none;
-        border-radius: 25px;
-        padding: 0.8rem 2rem;
-        font-weight: 700;
-        font-size: 0.95rem;
-        letter-spacing: 2px;
-        text-transform: uppercase;
-        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        box-shadow: 
-            0 4px 15px rgba(10, 102, 194, 0.4),
-            inset 0 0 15px rgba(255, 255, 255, 0.08);
-        font-family: 'Orbitron', monospace;
-        position: relative;
-        overflow: hidden;
-        cursor: pointer;
-    }
-    
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        border-radius: 50%;
-        background: rgba(255, 255, 255, 0.5);
-        transform: translate(-50%, -50%);
-        transition: width 0.6s, height 0.6s;
-    }
-    
-    .stButton > button:hover::before {
-        width: 300px;
-        height: 300px;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-5px) scale(1.05);
-        box-shadow: 
-            0 15px 40px rgba(10, 102, 194, 0.7),
-            inset 0 0 30px rgba(255, 255, 255, 0.2),
-            0 0 60px rgba(56, 152, 236, 0.5);
-        background-position: 100% 0;
-        animation: neonPulse 1.5s ease-in-out infinite;
-    }
-    
-    @keyframes neonPulse {
-        0%, 100% { filter: brightness(1); }
-        50% { filter: brightness(1.2); }
-    }
-    
-    .stButton > button:active {
-        transform: translateY(-2px) scale(1.02);
-    }
-    
-    /* Enhanced Input Fields with Glow Effect */
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div > select {
-        background: rgba(0, 0, 0, 0.7);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(10, 102, 194, 0.3);
-        border-radius: 15px;
-        color: #ffffff;
-        font-size: 1rem;
-        padding: 0.9rem;
-        font-family: 'Space Grotesk', sans-serif;
-        font-weight: 500;
-        transition: all 0.3s ease;
-        box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.5);
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus,
-    .stSelectbox > div > div > select:focus {
-        border-color: #0A66C2;
-        box-shadow: 
-            0 0 20px rgba(10, 102, 194, 0.6),
-            inset 0 0 15px rgba(10, 102, 194, 0.15);
-        background: rgba(0, 0, 0, 0.6);
-        transform: translateY(-2px);
-    }
-    
-    /* Placeholder styling */
-    .stTextInput > div > div > input::placeholder,
-    .stTextArea > div > div > textarea::placeholder {
-        color: rgba(56, 152, 236, 0.5);
-        font-style: italic;
-    }
-    
-    /* Enhanced Labels */
-    .stTextInput > label,
-    .stTextArea > label,
-    .stSelectbox > label {
-        color: #3898EC !important;
-        font-weight: 700 !important;
-        font-size: 1.05rem !important;
-        text-transform: uppercase;
-        letter-spacing: 2px;
-        text-shadow: 0 0 10px rgba(10, 102, 194, 0.5);
-        margin-bottom: 0.8rem !important;
-    }
-    
-    /* Hide Sidebar Completely */
-    .css-1d391kg, [data-testid="stSidebar"] {
-        display: none !important;
-    }
-    
-    /* Remove sidebar toggle button */
-    button[kind="header"] {
-        display: none !important;
-    }
-    
-    /* NEON SIDEBAR STYLES */
-    .neon-sidebar {
-        position: fixed;
-        left: 0;
-        top: 0;
-        width: 300px;
-        height: 100vh;
-        background: rgba(0, 10, 30, 0.95);
-        backdrop-filter: blur(20px);
-        border-right: 2px solid rgba(0, 255, 136, 0.4);
-        padding: 2rem 1.5rem;
-        overflow-y: auto;
-        z-index: 999;
-        box-shadow: 10px 0 50px rgba(0, 255, 136, 0.15);
-        display: none;
-    }
-    
-    .neon-sidebar.visible {
-        display: block;
-    }
-    
-    .sidebar-toggle {
-        position: fixed;
-        left: 20px;
-        top: 20px;
-        width: 50px;
-        height: 50px;
-        background: rgba(0, 255, 136, 0.2);
-        border: 2px solid #00ff88;
-        border-radius: 12px;
-        cursor: pointer;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.5rem;
-        z-index: 1001;
-        transition: all 0.3s ease;
-    }
-    
-    .sidebar-toggle:hover {
-        background: rgba(0, 255, 136, 0.4);
-        box-shadow: 0 0 20px rgba(0, 255, 136, 0.6);
-    }
-    
-    .sidebar-section {
-        margin-bottom: 2rem;
-        padding: 1.2rem;
-        background: rgba(0, 255, 136, 0.05);
-        border: 2px solid rgba(0, 255, 136, 0.2);
-        border-radius: 12px;
-        transition: all 0.3s ease;
-    }
-    
-    .sidebar-section:hover {
-        background: rgba(0, 255, 136, 0.1);
-        border-color: rgba(0, 255, 136, 0.5);
-        box-shadow: 0 0 20px rgba(0, 255, 136, 0.2);
-    }
-    
-    .sidebar-title {
-        font-size: 0.95rem;
-        font-weight: 700;
-        color: #00ff88;
-        text-transform: uppercase;
-        letter-spacing: 2px;
-        margin-bottom: 0.8rem;
-        text-shadow: 0 0 10px rgba(0, 255, 136, 0.5);
-    }
-    
-    .sidebar-stat {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        padding: 0.6rem 0;
-        color: #ffffff;
-        font-size: 0.9rem;
-        border-bottom: 1px solid rgba(0, 255, 136, 0.1);
-    }
-    
-    .sidebar-stat:last-child {
-        border-bottom: none;
-    }
-    
-    .stat-value {
-        font-weight: 700;
-        color: #00ff88;
-        font-size: 1.1rem;
-    }
-    
-    .sidebar-button {
-        width: 100%;
-        padding: 0.8rem;
-        margin: 0.5rem 0;
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.1), rgba(0, 255, 136, 0.05));
-        border: 2px solid rgba(0, 255, 136, 0.4);
-        border-radius: 10px;
-        color: #00ff88;
-        font-weight: 700;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-    
-    .sidebar-button:hover {
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.3), rgba(0, 255, 136, 0.15));
-        box-shadow: 0 0 20px rgba(0, 255, 136, 0.5);
-        transform: translateY(-2px);
-    }
-    
-    .sidebar-button:active {
-        transform: translateY(0);
-    }
-    
-    /* Expand main content to full width */
-    .main .block-container {
-        max-width: 100% !important;
-        padding-left: 2rem !important;
-        padding-right: 2rem !important;
-    }
-    
-    /* Enhanced Success/Error/Warning/Info Messages */
-    .stSuccess {
-        background: rgba(0, 255, 136, 0.1) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 2px solid #00ff88 !important;
-        border-radius: 18px !important;
-        color: #00ff88 !important;
-        padding: 1.2rem !important;
-        box-shadow: 0 5px 20px rgba(0, 255, 136, 0.2) !important;
-        animation: messageSlideIn 0.5s ease-out;
-    }
-    
-    .stError {
-        background: rgba(255, 0, 100, 0.1) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 2px solid #ff0064 !important;
-        border-radius: 18px !important;
-        color: #ff0064 !important;
-        padding: 1.2rem !important;
-        box-shadow: 0 5px 20px rgba(255, 0, 100, 0.2) !important;
-        animation: messageSlideIn 0.5s ease-out;
-    }
-    
-    .stWarning {
-        background: rgba(255, 200, 0, 0.1) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 2px solid #ffc800 !important;
-        border-radius: 18px !important;
-        color: #ffc800 !important;
-        padding: 1.2rem !important;
-        box-shadow: 0 5px 20px rgba(255, 200, 0, 0.2) !important;
-        animation: messageSlideIn 0.5s ease-out;
-    }
-    
-    .stInfo {
-        background: rgba(0, 150, 255, 0.1) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 2px solid #0096ff !important;
-        border-radius: 18px !important;
-        color: #0096ff !important;
-        padding: 1.2rem !important;
-        box-shadow: 0 5px 20px rgba(0, 150, 255, 0.2) !important;
-        animation: messageSlideIn 0.5s ease-out;
-    }
-    
-    @keyframes messageSlideIn {
-        from {
-            opacity: 0;
-            transform: translateY(-20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    /* Enhanced Progress Bars with Animated Gradient */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #00ffff, #0096ff, #00ffff) !important;
-        background-size: 200% 200% !important;
-        animation: progressGlow 2s ease infinite !important;
-        box-shadow: 0 0 15px rgba(0, 255, 255, 0.6) !important;
-    }
-    
-    @keyframes progressGlow {
-        0%, 100% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-    }
-    
-    /* Enhanced Metrics with Glassmorphism */
-    [data-testid="metric-container"] {
-        background: rgba(255, 255, 255, 0.05) !important;
-        backdrop-filter: blur(15px) saturate(180%) !important;
-        -webkit-backdrop-filter: blur(15px) saturate(180%) !important;
-        border: 2px solid rgba(0, 255, 255, 0.3) !important;
-        padding: 1.5rem !important;
-        border-radius: 18px !important;
-        box-shadow: 
-            0 8px 32px 0 rgba(0, 255, 255, 0.1),
-            inset 0 0 20px rgba(0, 255, 255, 0.03) !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    [data-testid="metric-container"]:hover {
-        border-color: rgba(0, 255, 255, 0.6) !important;
-        box-shadow: 
-            0 12px 48px 0 rgba(0, 255, 255, 0.2),
-            inset 0 0 30px rgba(0, 255, 255, 0.05) !important;
-        transform: translateY(-5px) !important;
-    }
-    
-    /* Enhanced Code Blocks */
-    .stCode {
-        background: rgba(0, 0, 0, 0.6) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 2px solid rgba(0, 255, 255, 0.3) !important;
-        border-radius: 15px !important;
-        box-shadow: inset 0 0 20px rgba(0, 255, 255, 0.1) !important;
-    }
-    
-    /* Hide Streamlit Branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    .stDeployButton {display: none;}
-    header {visibility: hidden;}
-    
-    /* Enhanced Loading Animation */
-    .loading-animation {
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        padding: 3rem;
-    }
-    
-    .loading-spinner {
-        border: 5px solid rgba(0, 255, 255, 0.1);
-        border-top: 5px solid #00ffff;
-        border-radius: 50%;
-        width: 80px;
-        height: 80px;
-        animation: spin 1s linear infinite;
-        box-shadow: 0 0 30px rgba(0, 255, 255, 0.5);
-    }
-    
-    @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-    }
-    
-    /* Terminal-like output with Neon Green Glow */
-    .terminal-output {
-        background: rgba(0, 0, 0, 0.8);
-        backdrop-filter: blur(10px);
-        color: #00ff00;
-        font-family: 'Courier New', monospace;
-        padding: 1.5rem;
-        border-radius: 15px;
-        border: 2px solid #00ff00;
-        margin: 1.5rem 0;
-        font-size: 1rem;
-        line-height: 1.6;
-        box-shadow: 
-            0 5px 25px rgba(0, 255, 0, 0.2),
-            inset 0 0 20px rgba(0, 255, 0, 0.1);
-        animation: terminalFlicker 0.1s infinite alternate;
-    }
-    
-    @keyframes terminalFlicker {
-        0% { opacity: 0.98; }
-        100% { opacity: 1; }
-    }
-    
-    /* Enhanced Blog Content Text */
-    .post-content-text {
-        color: #ffffff !important;
-        font-family: 'Space Grotesk', sans-serif !important;
-        font-weight: 400 !important;
-        font-size: 1.15rem !important;
-        line-height: 1.9 !important;
-        text-align: justify !important;
-        padding: 2rem !important;
-        background: rgba(255, 255, 255, 0.03) !important;
-        backdrop-filter: blur(10px) !important;
-        border-radius: 15px !important;
-        white-space: pre-wrap !important;
-        word-wrap: break-word !important;
-        overflow-wrap: break-word !important;
-        text-rendering: optimizeLegibility !important;
-        -webkit-font-smoothing: antialiased !important;
-        -moz-osx-font-smoothing: grayscale !important;
-        box-shadow: inset 0 0 20px rgba(0, 255, 255, 0.05) !important;
-    }
-    
-    /* Enhanced Blog Title Styling */
-    .post-title {
-        background: linear-gradient(135deg, #00ffff, #0096ff) !important;
-        -webkit-background-clip: text !important;
-        -webkit-text-fill-color: transparent !important;
-        background-clip: text !important;
-        font-family: 'Orbitron', monospace !important;
-        font-weight: 700 !important;
-        text-align: center !important;
-        margin: 0 !important;
-        filter: drop-shadow(0 0 15px rgba(0, 255, 255, 0.6)) !important;
-    }
-    
-    /* Enhanced Content Container */
-    .content-container {
-        background: rgba(255, 255, 255, 0.05) !important;
-        backdrop-filter: blur(15px) saturate(180%) !important;
-        -webkit-backdrop-filter: blur(15px) saturate(180%) !important;
-        border: 2px solid rgba(0, 255, 255, 0.3) !important;
-        border-radius: 20px !important;
-        padding: 2.5rem !important;
-        margin: 2rem 0 !important;
-        box-shadow: 
-            0 8px 32px 0 rgba(0, 255, 255, 0.15),
-            inset 0 0 30px rgba(0, 255, 255, 0.05) !important;
-    }
-    
-    /* Enhanced Section Headers */
-    .section-header {
-        background: linear-gradient(90deg, #00ffff, #0096ff) !important;
-        -webkit-background-clip: text !important;
-        -webkit-text-fill-color: transparent !important;
-        background-clip: text !important;
-        font-family: 'Orbitron', monospace !important;
-        font-weight: 600 !important;
-        margin-bottom: 1.5rem !important;
-        text-transform: uppercase !important;
-        letter-spacing: 3px !important;
-        filter: drop-shadow(0 0 10px rgba(0, 255, 255, 0.5)) !important;
-    }
-    
-    /* Enhanced Hashtag and CTA Styling */
-    .meta-content {
-        color: #ffffff !important;
-        font-family: 'Space Grotesk', sans-serif !important;
-        font-weight: 500 !important;
-        line-height: 1.7 !important;
-        padding: 1.2rem !important;
-        border-radius: 12px !important;
-        overflow-y: auto !important;
-        max-height: 140px !important;
-    }
-    
-    /* Enhanced Expander styling */
-    .streamlit-expanderHeader {
-        background: rgba(255, 255, 255, 0.05) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 2px solid rgba(0, 255, 255, 0.3) !important;
-        border-radius: 15px !important;
-        color: #00ffff !important;
-        font-weight: 700 !important;
-        padding: 1rem !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .streamlit-expanderHeader:hover {
-        border-color: rgba(0, 255, 255, 0.6) !important;
-        box-shadow: 0 5px 20px rgba(0, 255, 255, 0.2) !important;
-        background: rgba(255, 255, 255, 0.08) !important;
-    }
-    
-    .streamlit-expanderContent {
-        background: rgba(0, 0, 0, 0.3) !important;
-        backdrop-filter: blur(10px) !important;
-        border: 2px solid rgba(0, 255, 255, 0.2) !important;
-        border-radius: 0 0 15px 15px !important;
-        padding: 2rem !important;
-        box-shadow: inset 0 0 20px rgba(0, 255, 255, 0.05) !important;
-    }
-    
-    /* Enhanced Markdown text improvements */
-    .stMarkdown {
-        font-family: 'Space Grotesk', sans-serif !important;
-    }
-    
-    .stMarkdown p {
-        color: #ffffff !important;
-        line-height: 1.8 !important;
-        margin-bottom: 1.2rem !important;
-    }
-    
-    .stMarkdown strong {
-        background: linear-gradient(90deg, #00ffff, #0096ff) !important;
-        -webkit-background-clip: text !important;
-        -webkit-text-fill-color: transparent !important;
-        background-clip: text !important;
-        font-weight: 700 !important;
-    }
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 1rem;
-        background: rgba(255, 255, 255, 0.03);
-        padding: 0.5rem;
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: rgba(255, 255, 255, 0.05);
-        border: 2px solid rgba(0, 255, 255, 0.2);
-        border-radius: 12px;
-        color: #00ffff;
-        font-weight: 600;
-        padding: 0.8rem 1.5rem;
-        transition: all 0.3s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(0, 255, 255, 0.1);
-        border-color: rgba(0, 255, 255, 0.5);
-        box-shadow: 0 5px 15px rgba(0, 255, 255, 0.2);
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, rgba(0, 255, 255, 0.2), rgba(0, 150, 255, 0.2)) !important;
-        border-color: #00ffff !important;
-        box-shadow: 0 5px 20px rgba(0, 255, 255, 0.3) !important;
-    }
-    
-    /* Scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 12px;
-        height: 12px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: rgba(0, 0, 0, 0.3);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #0A66C2, #3898EC);
-        border-radius: 10px;
-        box-shadow: 0 0 10px rgba(10, 102, 194, 0.5);
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #3898EC, #0A66C2);
-        box-shadow: 0 0 15px rgba(10, 102, 194, 0.8);
-    }
-    
-    /* Checkbox styling */
-    .stCheckbox {
-        color: #00ffff !important;
-    }
-    
-    .stCheckbox > label {
-        color: #00ffff !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Download button special styling */
-    .stDownloadButton > button {
-        background: linear-gradient(135deg, #8000ff 0%, #4000ff 100%) !important;
-        box-shadow: 0 5px 20px rgba(128, 0, 255, 0.4) !important;
-    }
-    
-    .stDownloadButton > button:hover {
-        background: linear-gradient(135deg, #4000ff 0%, #8000ff 100%) !important;
-        box-shadow: 0 10px 30px rgba(128, 0, 255, 0.6) !important;
-    }
-    
-    /* Sidebar button styling */
-    [data-testid="stSidebar"] .stButton > button {
-        width: 100%;
-        background: linear-gradient(135deg, #0A66C2, #3898EC);
-        color: #ffffff;
-        border: 1px solid rgba(10, 102, 194, 0.5);
-        border-radius: 12px;
-        padding: 0.6rem 1rem;
-        font-size: 0.85rem;
-        font-weight: 600;
-        letter-spacing: 1px;
-        margin-bottom: 0.5rem;
-        box-shadow: 0 3px 10px rgba(10, 102, 194, 0.3);
-        transition: all 0.3s ease;
-    }
-    
-    [data-testid="stSidebar"] .stButton > button:hover {
-        background: linear-gradient(135deg, #3898EC, #0A66C2);
-        box-shadow: 0 5px 15px rgba(10, 102, 194, 0.5);
-        transform: translateY(-2px);
-    }
-    
-    /* Footer fixed at bottom */
-    .main .block-container {
-        padding-bottom: 80px;
-    }
-    
-    /* Footer container styling - fixed at bottom */
-    .footer-container {
-        position: fixed;
-        bottom: 0;
-        left: 0;
-        right: 0;
-        width: 100%;
-        background: rgba(2, 5, 10, 0.95);
-        backdrop-filter: blur(20px);
-        border-top: 1px solid rgba(10, 102, 194, 0.3);
-        z-index: 999;
-        padding: 0.8rem 0;
-        box-shadow: 0 -5px 20px rgba(0, 0, 0, 0.5);
-    }
-
-    /* ========== POPUP SLIDE-IN SIDEBAR CSS ========== */
-    
-    /* Sidebar Overlay */
-    .sidebar-overlay {
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: rgba(0, 0, 0, 0.5);
-        backdrop-filter: blur(4px);
-        z-index: 1900;
-        opacity: 0;
-        visibility: hidden;
-        transition: all 0.3s ease;
-    }
-    
-    .sidebar-overlay.active {
-        opacity: 1;
-        visibility: visible;
-    }
-    
-    /* Main Sidebar Panel */
-    .popup-sidebar {
-        position: fixed;
-        left: 0;
-        top: 0;
-        height: 100vh;
-        width: 320px;
-        background: linear-gradient(135deg, rgba(10, 20, 40, 0.95) 0%, rgba(13, 31, 45, 0.95) 100%);
-        backdrop-filter: blur(8px);
-        border-right: 2px solid #00ff88;
-        z-index: 2000;
-        transform: translateX(-100%);
-        transition: transform 0.4s cubic-bezier(0.34, 1.56, 0.64, 1);
-        box-shadow: inset -5px 0 20px rgba(0, 255, 136, 0.1);
-        overflow-y: auto;
-        padding: 0;
-    }
-    
-    .popup-sidebar.active {
-        transform: translateX(0);
-    }
-    
-    /* Sidebar Header */
-    .sidebar-header {
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.1) 0%, rgba(56, 152, 236, 0.1) 100%);
-        border-bottom: 1px solid rgba(0, 255, 136, 0.3);
-        padding: 1.5rem 1rem;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        position: sticky;
-        top: 0;
-        z-index: 2001;
-    }
-    
-    .sidebar-title {
-        color: #00ff88;
-        font-size: 1.2rem;
-        font-weight: bold;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        text-shadow: 0 0 10px rgba(0, 255, 136, 0.5);
-    }
-    
-    .sidebar-close-btn {
-        background: none;
-        border: none;
-        color: #00ff88;
-        font-size: 1.5rem;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        padding: 0;
-        width: 40px;
-        height: 40px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
-    
-    .sidebar-close-btn:hover {
-        color: #ffffff;
-        text-shadow: 0 0 10px rgba(0, 255, 136, 0.8);
-        transform: scale(1.1);
-    }
-    
-    /* Sidebar Content Container */
-    .sidebar-content {
-        padding: 1.5rem 1rem;
-    }
-    
-    /* Status Section */
-    .sidebar-section {
-        margin-bottom: 1.5rem;
-        background: rgba(0, 255, 136, 0.05);
-        border-left: 3px solid #00ff88;
-        padding: 1rem;
-        border-radius: 8px;
-        transition: all 0.3s ease;
-    }
-    
-    .sidebar-section:hover {
-        background: rgba(0, 255, 136, 0.1);
-        box-shadow: 0 0 15px rgba(0, 255, 136, 0.2);
-    }
-    
-    .sidebar-section-title {
-        color: #00ff88;
-        font-size: 0.9rem;
-        font-weight: bold;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 1rem;
-        text-shadow: 0 0 8px rgba(0, 255, 136, 0.4);
-    }
-    
-    /* Stat Item */
-    .sidebar-stat {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        padding: 0.8rem 0;
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        color: #b0b8c1;
-        font-size: 0.9rem;
-    }
-    
-    .sidebar-stat:last-child {
-        border-bottom: none;
-    }
-    
-    .sidebar-stat-label {
-        color: #b0b8c1;
-    }
-    
-    .sidebar-stat-value {
-        color: #00ff88;
-        font-weight: bold;
-        font-size: 1.1rem;
-        text-shadow: 0 0 8px rgba(0, 255, 136, 0.3);
-    }
-    
-    /* Sidebar Buttons */
-    .sidebar-buttons {
-        margin-top: 1.5rem;
-        display: flex;
-        flex-direction: column;
-        gap: 0.8rem;
-    }
-    
-    .sidebar-btn {
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.15) 0%, rgba(56, 152, 236, 0.15) 100%);
-        border: 1px solid #00ff88;
-        color: #00ff88;
-        padding: 0.8rem 1rem;
-        border-radius: 6px;
-        cursor: pointer;
-        font-weight: 600;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        transition: all 0.3s ease;
-        text-shadow: 0 0 5px rgba(0, 255, 136, 0.3);
-    }
-    
-    .sidebar-btn:hover {
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.25) 0%, rgba(56, 152, 236, 0.25) 100%);
-        border-color: #3898EC;
-        color: #ffffff;
-        box-shadow: 0 0 15px rgba(0, 255, 136, 0.4);
-        transform: translateY(-2px);
-    }
-    
-    .sidebar-btn:active {
-        transform: translateY(0);
-        box-shadow: 0 0 10px rgba(0, 255, 136, 0.2);
-    }
-    
-    /* Status Indicator */
-    .status-indicator {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        border-radius: 50%;
-        background: #00ff88;
-        box-shadow: 0 0 10px rgba(0, 255, 136, 0.8);
-        margin-right: 0.5rem;
-        animation: statusPulse 2s ease-in-out infinite;
-    }
-    
-    @keyframes statusPulse {
-        0%, 100% { box-shadow: 0 0 10px rgba(0, 255, 136, 0.8); }
-        50% { box-shadow: 0 0 20px rgba(0, 255, 136, 1); }
-    }
-    
-    /* Number Counter Animation */
-    .stat-counter {
-        display: inline-block;
-        font-weight: bold;
-        color: #00ff88;
-    }
-    
-    /* Hamburger Menu Button Style */
-    .hamburger-menu-btn {
-        background: none;
-        border: none;
-        color: #00ff88;
-        font-size: 1.8rem;
-        cursor: pointer;
-        padding: 0;
-        transition: all 0.3s ease;
-    }
-    
-    .hamburger-menu-btn:hover {
-        color: #ffffff;
-        text-shadow: 0 0 10px rgba(0, 255, 136, 0.8);
-        transform: scale(1.1);
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    """Stylesheet from assets/agent.css (minified once per process)"""
+    inject_css('agent')
 
 
 def initialize_session_state():
@@ -1233,6 +60,8 @@ def initialize_session_state():
         st.session_state.generation_length = 1
     if 'generation_audience' not in st.session_state:
         st.session_state.generation_audience = 'professionals'
+    if 'generation_fresh' not in st.session_state:
+        st.session_state.generation_fresh = False
     if 'sidebar_open' not in st.session_state:
         st.session_state.sidebar_open = False
     if 'agent_status' not in st.session_state:
@@ -1284,9 +113,26 @@ def render_status_dashboard():
         </div>
         """, unsafe_allow_html=True)
 
+# Metrics sidecar (enabled when METRICS_PORT is configured)
+@st.cache_resource
+def initialize_metrics_server():
+    port = get_secret('METRICS_PORT')
+    if not port:
+        return None
+    try:
+        return start_metrics_server(int(port))
+    except Exception:
+        return None
+
+# Preload LangGraph/Gemini in the background once the first page has rendered
+@st.cache_resource
+def start_import_warmer():
+    return warm_imports()
+
 # Initialize Agent
 @st.cache_resource
 def initialize_agent():
+    initialize_metrics_server()
     try:
         # Initialize advanced multi-agent orchestrator
         orchestrator = LinkedInAgentOrchestrator()
@@ -1294,6 +140,15 @@ def initialize_agent():
     except Exception as e:
         return None, False, f"Agent initialization failed: {str(e)}"
 
+# Per-session view over the shared orchestrator (own memory, no cross-talk)
+def get_agent_session():
+    orchestrator, success, message = initialize_agent()
+    if not success:
+        return None, False, message
+    if 'agent_session' not in st.session_state:
+        st.session_state.agent_session = orchestrator.create_session()
+    return st.session_state.agent_session, True, message
+
 # Email validation function
 def validate_email(email):
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
@@ -1322,6 +177,8 @@ def render_post_generator():
     
     with col2:
         st.markdown("### 🎛️ GENERATION CONTROLS")
+        fresh = st.checkbox("🔄 FRESH VERSION", value=st.session_state.generation_fresh,
+                            help="Skip posts cached for this or a near-identical topic")
         
         if st.button("🚀 GENERATE BLOG"):
             if topic:
@@ -1330,223 +187,245 @@ def render_post_generator():
                 st.session_state.generation_tone = tone
                 st.session_state.generation_length = length
                 st.session_state.generation_audience = audience
-                st.session_state.current_page = 'generating'
-                st.rerun()
+                st.session_state.generation_fresh = fresh
+                if submit_generation() is not None:
+                    st.rerun()
             else:
                 st.error("⚠️ Please enter a post topic")
-
-def generate_single_post():
-    """Generate post with stored parameters using advanced agentic orchestrator"""
-    try:
-        # Get parameters from session state
-        topic = st.session_state.generation_topic
-        tone = st.session_state.generation_tone
-        length = st.session_state.generation_length
-        audience = st.session_state.generation_audience
-        
-        orchestrator, success, message = initialize_agent()
-        if not success:
-            st.error(f"🚨 {message}")
-            return
-        
-        # Create progress bar
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Step 1: Initialize
-        progress_bar.progress(10)
-        status_text.text("🔧 Initializing multi-agent system...")
-        time.sleep(0.5)
-        
-        # Step 2: Planning
-        progress_bar.progress(25)
-        status_text.text("🧩 Agent planning workflow and selecting tools...")
-        time.sleep(0.5)
-        
-        # Step 3: Research (agent will call tools automatically)
-        progress_bar.progress(40)
-        status_text.text("🔍 Agent using tools for research (function calling)...")
-        time.sleep(0.5)
-        
-        # Step 4: Generate with agent orchestration
-        progress_bar.progress(60)
-        status_text.text("🤖 Agent generating content with multi-step reasoning...")
         
+        # Jobs keep running when the user leaves the generating page
+        running = get_job_manager().jobs_for(get_client_id())
+        if running:
+            job = running[-1]
+            st.info(f"⏳ '{job.params['topic']}' is {job.status} in the background")
+            if st.button("👀 VIEW GENERATION"):
+                open_generation_job(job)
+                st.rerun()
+
+def generation_params() -> Dict[str, Any]:
+    """Generation parameters stored by the generator form"""
+    return {
+        'topic': st.session_state.generation_topic,
+        'tone': st.session_state.generation_tone,
+        'length': st.session_state.generation_length,
+        'audience': st.session_state.generation_audience,
+        # Part of the request hash, so a regenerate is never merged with a cached request
+        'fresh': bool(st.session_state.generation_fresh)
+    }
+
+# Browser-side client id kept in the URL, so a reconnected websocket (which gets
+# a fresh session_state) still finds the jobs it submitted
+def get_client_id():
+    client_id = st.query_params.get('client')
+    if not client_id:
+        client_id = uuid.uuid4().hex
+        st.query_params['client'] = client_id
+    return client_id
+
+def open_generation_job(job):
+    """Show a submitted job on the generating page"""
+    st.session_state.generation_topic = job.params['topic']
+    st.session_state.generation_tone = job.params['tone']
+    st.session_state.generation_length = job.params['length']
+    st.session_state.generation_audience = job.params['audience']
+    st.session_state.generation_fresh = job.params.get('fresh', False)
+    st.session_state.generation_job_id = job.job_id
+    st.session_state.generation_error = None
+    st.session_state.current_page = 'generating'
+    st.query_params['job'] = job.job_id
+
+def resume_generation_job():
+    """After a reconnect, go back to the job named in the URL if it has not been fetched"""
+    job_id = st.query_params.get('job')
+    if job_id and st.session_state.get('generation_job_id') != job_id:
+        job = get_job_manager().get(job_id)
+        if job is not None and job.client_id == get_client_id():
+            open_generation_job(job)
+        else:
+            del st.query_params['job']
+
+def submit_generation():
+    """
+    Queue the stored parameters as a background job. Resubmitting the same
+    request returns the job already running, so reruns never start a second LLM run.
+    """
+    orchestrator, success, message = get_agent_session()
+    if not success:
+        st.error(f"🚨 {message}")
+        return None
+    params = generation_params()
+    
+    def run():
         # Use advanced agentic orchestration
-        post = orchestrator.orchestrate_post_creation(
-            topic=topic,
-            tone=tone,
-            length=length,
-            target_audience=audience,
+        return orchestrator.orchestrate_post_creation(
+            topic=params['topic'],
+            tone=params['tone'],
+            length=params['length'],
+            target_audience=params['audience'],
             enable_research=True,  # Enable agent to use research tools
-            enable_statistics=True  # Enable statistics gathering
+            enable_statistics=True,  # Enable statistics gathering
+            use_cache=not params['fresh']  # A fresh version bypasses the topic cache
         )
-        
-        # Step 5: Quality Check
-        progress_bar.progress(85)
-        status_text.text("✓ Agent validating quality...")
-        time.sleep(0.3)
-        
-        # Step 6: Complete
-        progress_bar.progress(100)
-        status_text.text("✅ Agentic workflow complete!")
-        time.sleep(0.5)
-        
-        # Update session state
-        st.session_state.total_generated += 1
-        st.session_state.post_history.append({
-            'title': post.get('title'),
-            'topic': topic,
-            'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'agentic': True  # Mark as generated with agent
-        })
-        
-        # Store the generated post and navigate to results
-        st.session_state.generated_post = post
-        st.session_state.current_page = 'results'
-        st.rerun()
-        
-    except Exception as e:
-        st.error(f"🚨 Agent execution failed: {str(e)}")
-        import traceback
-        st.error(traceback.format_exc())
-        time.sleep(2)
-        st.session_state.current_page = 'home'
-        st.rerun()
+    
+    job = get_job_manager().submit(get_client_id(), params, run)
+    open_generation_job(job)
+    # One-shot: the next generation uses the topic cache again unless asked otherwise
+    st.session_state.generation_fresh = False
+    return job
 
-def render_post_display(post):
-    # First, show the LangChain framework proof (REAL ADK FRAMEWORK!)
-    if 'orchestration_metadata' in post:
-        st.markdown("""
-        <div class="control-panel">
-            <div class="panel-title">🤖 LANGCHAIN FRAMEWORK - REAL AGENT SDK IMPLEMENTATION</div>
+# Plain fragment: timer ticks are not interactions, so they stay out of the script run timings
+@st.fragment(run_every=1.0)
+def render_generation_status():
+    """Poll the background job once a second; only this fragment reruns while waiting"""
+    manager = get_job_manager()
+    job = manager.get(st.session_state.get('generation_job_id'))
+    if job is None:
+        if st.session_state.get('generation_error'):
+            st.error(f"🚨 Agent execution failed: {st.session_state.generation_error}")
+        else:
+            # Fetched by another tab of this client, or expired
+            st.warning("⚠️ No generation in progress - start one from the home page")
+        return
+    
+    if not job.done:
+        budget_seconds = float(get_secret('GENERATION_DEADLINE_SECONDS', 60))
+        if job.status == 'queued':
+            st.progress(5)
+            st.text("⏳ Waiting for a free agent worker...")
+        else:
+            st.progress(min(95, 10 + int(job.elapsed / budget_seconds * 85)))
+            st.text(f"🤖 Agent researching and generating with multi-step reasoning... {job.elapsed:.0f}s")
+        return
+    
+    job = manager.fetch(job.job_id)
+    st.session_state.generation_job_id = None
+    if 'job' in st.query_params:
+        del st.query_params['job']
+    if job is None:
+        return
+    
+    if job.status == 'failed':
+        st.session_state.generation_error = job.error
+        st.error(f"🚨 Agent execution failed: {job.error}")
+        return
+    
+    post = job.result
+    # Update session state
+    st.session_state.total_generated += 1
+    st.session_state.post_history.append({
+        'title': post.get('title'),
+        'topic': job.params['topic'],
+        'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'agentic': True  # Mark as generated with agent
+    })
+    
+    # Store the generated post and navigate to results
+    st.session_state.generated_post = post
+    st.session_state.current_page = 'results'
+    st.rerun()
+
+def render_trace_waterfall(trace, trace_id=""):
+    """Render recorded orchestration spans as a waterfall of timed bars"""
+    total_ms = max((row['offset_ms'] + row['duration_ms'] for row in trace), default=0) or 1
+    st.markdown(f"""
+    <div style="color: #00ff88; font-size: 0.85rem; margin-bottom: 0.5rem;">
+        <strong>Trace {html.escape(trace_id[:16])} · {total_ms:.0f} ms total</strong>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    rows = []
+    for row in trace:
+        left = row['offset_ms'] / total_ms * 100
+        width = max(row['duration_ms'] / total_ms * 100, 0.5)
+        color = '#ff4d4d' if row['status'] == 'error' else ('#00ff88' if row['name'].startswith('tool.') else '#3898EC')
+        # Attributes carry user input (topic) and exception messages
+        details = html.escape(', '.join(f"{key}={value}" for key, value in row['attributes'].items()), quote=True)
+        rows.append(f"""
+        <div style="display: flex; align-items: center; margin: 0.2rem 0; font-size: 0.8rem; color: #ffffff;" title="{details}">
+            <div style="width: 32%; padding-left: {row['depth'] * 0.8}rem; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;">
+                {html.escape(row['name'], quote=True)}
+            </div>
+            <div style="width: 56%; position: relative; height: 0.9rem; background: rgba(0, 0, 0, 0.3); border-radius: 3px;">
+                <div style="position: absolute; left: {left:.2f}%; width: {width:.2f}%; height: 100%; background: {color}; border-radius: 3px;"></div>
+            </div>
+            <div style="width: 12%; text-align: right;">{row['duration_ms']:.0f} ms</div>
         </div>
-        """, unsafe_allow_html=True)
-        
-        metadata = post['orchestration_metadata']
-        
-        # Show framework information prominently
-        framework = metadata.get('framework', 'LangChain ReAct Agent')
-        workflow_type = metadata.get('workflow_type', 'LangChain Multi-Agent System')
-        
-        st.markdown(f"""
+        """)
+    st.markdown("".join(rows), unsafe_allow_html=True)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_framework_panel_html(framework: str, workflow_type: str, tools_available: tuple, reasoning_steps: int) -> str:
+    """Framework banner, stat cards and tool list, rendered once per post"""
+    tools_html = f"""
+    <div style="
+        background: rgba(255, 150, 0, 0.1);
+        border: 1px solid rgba(255, 150, 0, 0.3);
+        border-radius: 10px;
+        padding: 1rem;
+        margin: 1rem 0;
+    ">
+        <h4 style="color: #ff9600; font-family: 'Orbitron', monospace; margin-bottom: 0.5rem;">
+            🛠️ LANGCHAIN TOOLS AVAILABLE TO AGENT
+        </h4>
+        <div style="color: #ffffff; font-size: 0.9rem;">
+            {', '.join(tools_available)}
+        </div>
+    </div>
+    """ if tools_available else ""
+    
+    stat_cards = "".join(f"""
         <div style="
-            background: linear-gradient(135deg, rgba(0, 255, 136, 0.2), rgba(56, 152, 236, 0.2));
-            border: 2px solid rgba(0, 255, 136, 0.5);
-            border-radius: 15px;
-            padding: 1.5rem;
-            margin: 1rem 0;
+            flex: 1;
+            background: rgba({rgb}, 0.15);
+            border: 2px solid rgba({rgb}, 0.4);
+            border-radius: 10px;
+            padding: 1rem;
             text-align: center;
         ">
-            <h2 style="color: #00ff88; margin: 0; font-family: 'Orbitron', monospace;">
-                ✅ REAL AGENT FRAMEWORK USED
-            </h2>
-            <h3 style="color: #3898EC; margin: 0.5rem 0;">
-                {framework}
-            </h3>
-            <p style="color: #ffffff; margin: 0.5rem 0; font-size: 1.1rem;">
-                {workflow_type}
-            </p>
+            <h4 style="color: {color}; margin: 0; font-size: 2rem;">{icon}</h4>
+            <h3 style="color: {color}; margin: 0.5rem 0;">{value}</h3>
+            <p style="color: #ffffff; margin: 0; font-size: 0.9rem;">{label}</p>
         </div>
-        """, unsafe_allow_html=True)
-        
-        # Show tool usage statistics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown(f"""
-            <div style="
-                background: rgba(0, 255, 136, 0.15);
-                border: 2px solid rgba(0, 255, 136, 0.4);
-                border-radius: 10px;
-                padding: 1rem;
-                text-align: center;
-            ">
-                <h4 style="color: #00ff88; margin: 0; font-size: 2rem;">🔧</h4>
-                <h3 style="color: #00ff88; margin: 0.5rem 0;">{len(metadata.get('tools_available', []))}</h3>
-                <p style="color: #ffffff; margin: 0; font-size: 0.9rem;">LangChain Tools</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div style="
-                background: rgba(56, 152, 236, 0.15);
-                border: 2px solid rgba(56, 152, 236, 0.4);
-                border-radius: 10px;
-                padding: 1rem;
-                text-align: center;
-            ">
-                <h4 style="color: #3898EC; margin: 0; font-size: 2rem;">🧩</h4>
-                <h3 style="color: #3898EC; margin: 0.5rem 0;">{metadata.get('reasoning_steps', 0)}</h3>
-                <p style="color: #ffffff; margin: 0; font-size: 0.9rem;">ReAct Steps</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div style="
-                background: rgba(128, 0, 255, 0.15);
-                border: 2px solid rgba(128, 0, 255, 0.4);
-                border-radius: 10px;
-                padding: 1rem;
-                text-align: center;
-            ">
-                <h4 style="color: #8000ff; margin: 0; font-size: 2rem;">⚡</h4>
-                <h3 style="color: #8000ff; margin: 0.5rem 0;">ReAct</h3>
-                <p style="color: #ffffff; margin: 0; font-size: 0.9rem;">Agent Type</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Show tools available
-        if metadata.get('tools_available'):
-            st.markdown(f"""
-            <div style="
-                background: rgba(255, 150, 0, 0.1);
-                border: 1px solid rgba(255, 150, 0, 0.3);
-                border-radius: 10px;
-                padding: 1rem;
-                margin: 1rem 0;
-            ">
-                <h4 style="color: #ff9600; font-family: 'Orbitron', monospace; margin-bottom: 0.5rem;">
-                    🛠️ LANGCHAIN TOOLS AVAILABLE TO AGENT
-                </h4>
-                <div style="color: #ffffff; font-size: 0.9rem;">
-                    {', '.join(metadata['tools_available'])}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Show orchestration log (proof of multi-step reasoning)
-        if metadata.get('orchestration_log'):
-            with st.expander("🔍 VIEW LANGCHAIN AGENT REASONING & ORCHESTRATION LOG", expanded=False):
-                st.markdown("""
-                <div style="color: #00ff88; font-size: 0.85rem; margin-bottom: 0.5rem;">
-                    <strong>This log shows the LangChain ReAct framework orchestration process:</strong>
-                </div>
-                """, unsafe_allow_html=True)
-                for log_entry in metadata['orchestration_log']:
-                    st.markdown(f"""
-                    <div style="
-                        background: rgba(0, 0, 0, 0.3);
-                        border-left: 3px solid #3898EC;
-                        padding: 0.5rem;
-                        margin: 0.3rem 0;
-                        color: #ffffff;
-                        font-size: 0.85rem;
-                    ">
-                        {log_entry}
-                    </div>
-                    """, unsafe_allow_html=True)
+    """ for rgb, color, icon, value, label in (
+        ('0, 255, 136', '#00ff88', '🔧', len(tools_available), 'LangChain Tools'),
+        ('56, 152, 236', '#3898EC', '🧩', reasoning_steps, 'ReAct Steps'),
+        ('128, 0, 255', '#8000ff', '⚡', 'ReAct', 'Agent Type'),
+    ))
     
-    st.markdown("""
+    return f"""
+    <div class="control-panel">
+        <div class="panel-title">🤖 LANGCHAIN FRAMEWORK - REAL AGENT SDK IMPLEMENTATION</div>
+    </div>
+    <div style="
+        background: linear-gradient(135deg, rgba(0, 255, 136, 0.2), rgba(56, 152, 236, 0.2));
+        border: 2px solid rgba(0, 255, 136, 0.5);
+        border-radius: 15px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        text-align: center;
+    ">
+        <h2 style="color: #00ff88; margin: 0; font-family: 'Orbitron', monospace;">
+            ✅ REAL AGENT FRAMEWORK USED
+        </h2>
+        <h3 style="color: #3898EC; margin: 0.5rem 0;">
+            {framework}
+        </h3>
+        <p style="color: #ffffff; margin: 0.5rem 0; font-size: 1.1rem;">
+            {workflow_type}
+        </p>
+    </div>
+    <div style="display: flex; gap: 1rem;">{stat_cards}</div>
+    {tools_html}
+    """
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_post_card_html(title: str, content: str, hashtags: str, cta: str) -> str:
+    """Title, content, hashtags and call to action of a post, rendered once per post"""
+    return f"""
     <div class="control-panel">
         <div class="panel-title">📖 GENERATED CONTENT</div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Compact title styling
-    title = post.get('title', 'Untitled')
-    st.markdown(f"""
     <div style="
         background: rgba(0, 255, 255, 0.1);
         border: 1px solid rgba(0, 255, 255, 0.3);
@@ -1559,10 +438,6 @@ def render_post_display(post):
             🎯 {title}
         </h4>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Content with compact formatting
-    st.markdown("""
     <div style="
         background: rgba(0, 255, 255, 0.1);
         border: 1px solid rgba(0, 255, 255, 0.3);
@@ -1574,16 +449,6 @@ def render_post_display(post):
             📝 GENERATED CONTENT
         </h4>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Use compact content display
-    content = post.get('content', 'No content')
-    # Handle if content is a list
-    if isinstance(content, list):
-        content = '\n\n'.join(content)
-    
-    # Create a compact styled container for the content
-    st.markdown(f"""
     <div style="
         background: rgba(0, 0, 0, 0.2);
         border: 1px solid rgba(0, 255, 255, 0.2);
@@ -1603,20 +468,10 @@ def render_post_display(post):
             word-spacing: 1px;
             letter-spacing: 0.3px;
         ">
-        {content.replace(chr(10), '<br><br>') if isinstance(content, str) else content}
+        {content.replace(chr(10), '<br><br>')}
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Compact hashtags and CTA sections
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        hashtags = post.get('hashtags', 'No hashtags')
-        # Handle if hashtags is a list
-        if isinstance(hashtags, list):
-            hashtags = ' '.join(hashtags)
-        st.markdown(f"""
+    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
         <div style="
             background: rgba(0, 255, 136, 0.1);
             border: 1px solid rgba(0, 255, 136, 0.3);
@@ -1644,17 +499,9 @@ def render_post_display(post):
                 word-spacing: 1px;
                 letter-spacing: 0.2px;
             ">
-            {hashtags.replace(chr(10), '<br>') if isinstance(hashtags, str) else hashtags}
+            {hashtags.replace(chr(10), '<br>')}
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        cta = post.get('call_to_action', 'No CTA')
-        # Handle if CTA is a list
-        if isinstance(cta, list):
-            cta = ' '.join(cta)
-        st.markdown(f"""
         <div style="
             background: rgba(255, 150, 0, 0.1);
             border: 1px solid rgba(255, 150, 0, 0.3);
@@ -1682,12 +529,46 @@ def render_post_display(post):
                 word-spacing: 1px;
                 letter-spacing: 0.2px;
             ">
-            {cta.replace(chr(10), '<br>') if isinstance(cta, str) else cta}
+            {cta.replace(chr(10), '<br>')}
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    # Compact download options
+    </div>
+    """
+
+
+def _as_text(value, separator: str) -> str:
+    return separator.join(value) if isinstance(value, list) else str(value)
+
+
+def render_post_display(post):
+    # First, show the LangChain framework proof (REAL ADK FRAMEWORK!)
+    if 'orchestration_metadata' in post:
+        metadata = post['orchestration_metadata']
+        st.markdown(build_framework_panel_html(
+            metadata.get('framework', 'LangChain ReAct Agent'),
+            metadata.get('workflow_type', 'LangChain Multi-Agent System'),
+            tuple(metadata.get('tools_available', [])),
+            metadata.get('reasoning_steps', 0)
+        ), unsafe_allow_html=True)
+        
+        # Show the recorded trace as a waterfall (what actually ran, and for how long)
+        if metadata.get('trace'):
+            with st.expander("🔍 VIEW LANGCHAIN AGENT TRACE WATERFALL", expanded=False):
+                render_trace_waterfall(metadata['trace'], metadata.get('trace_id', ''))
+    
+    st.markdown(build_post_card_html(
+        _as_text(post.get('title', 'Untitled'), ' '),
+        _as_text(post.get('content', 'No content'), '\n\n'),
+        _as_text(post.get('hashtags', 'No hashtags'), ' '),
+        _as_text(post.get('call_to_action', 'No CTA'), ' ')
+    ), unsafe_allow_html=True)
+    
+    render_download_options(post)
+
+
+@timed_fragment('download')
+def render_download_options(post):
+    """Download and copy controls; using them reruns only this fragment"""
     st.markdown("""
     <div style="
         background: rgba(128, 0, 255, 0.1);
@@ -1701,6 +582,18 @@ def render_post_display(post):
         </h5>
     """, unsafe_allow_html=True)
     
+    text_content = f"""TITLE: {post.get('title', 'Untitled')}
+
+CONTENT:
+{post.get('content', 'No content')}
+
+HASHTAGS: {post.get('hashtags', 'No hashtags')}
+
+CALL TO ACTION: {post.get('call_to_action', 'No CTA')}
+
+---
+Generated: {post.get('generated_at', datetime.now().isoformat())}"""
+    
     col1, col2 = st.columns(2)
     with col1:
         st.download_button(
@@ -1712,26 +605,19 @@ def render_post_display(post):
         )
     
     with col2:
-        text_content = f"""TITLE: {post.get('title', 'Untitled')}
-
-CONTENT:
-{post.get('content', 'No content')}
-
-HASHTAGS: {post.get('hashtags', 'No hashtags')}
-
-CALL TO ACTION: {post.get('call_to_action', 'No CTA')}
-
----
-Generated: {post.get('generated_at', datetime.now().isoformat())}"""
-        
         st.download_button(
-            label="� DOWNLOAD TXT",
+            label="📄 DOWNLOAD TXT",
             data=text_content,
             file_name=f"post_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
             mime="text/plain",
             key="download_txt"
         )
     
+    # The code block's copy button works in the browser without any rerun
+    with st.expander("📋 COPY POST TEXT", expanded=False):
+        st.code(f"{post.get('title', '')}\n\n{post.get('content', '')}\n\n{post.get('hashtags', '')}\n\n"
+                f"{post.get('call_to_action', '')}", language=None)
+    
     st.markdown("</div>", unsafe_allow_html=True)
 
 def render_email_section(post):
@@ -1744,23 +630,30 @@ def render_email_section(post):
     tab1, tab2 = st.tabs(["📤 SINGLE RECIPIENT", "📮 MULTIPLE RECIPIENTS"])
     
     with tab1:
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            single_email = st.text_input("📧 RECIPIENT EMAIL", placeholder="recipient@example.com")
-            subject_prefix = st.text_input("📝 SUBJECT PREFIX", value="Generated LinkedIn Post")
-        
-        with col2:
-            st.markdown("### 🎛️ SEND CONTROLS")
-            if st.button("📤 SEND EMAIL"):
-                if single_email and validate_email(single_email):
-                    send_single_email(post, single_email, subject_prefix)
-                else:
-                    st.error("⚠️ Please enter a valid email address")
+        render_single_recipient_section(post)
     
     with tab2:
         render_multiple_recipients_section(post)
 
+# Email forms are fragments: typing or sending reruns only the form, not the
+# whole page (the sidebar email counter catches up on the next full rerun)
+@timed_fragment('email.single')
+def render_single_recipient_section(post):
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        single_email = st.text_input("📧 RECIPIENT EMAIL", placeholder="recipient@example.com")
+        subject_prefix = st.text_input("📝 SUBJECT PREFIX", value="Generated LinkedIn Post")
+    
+    with col2:
+        st.markdown("### 🎛️ SEND CONTROLS")
+        if st.button("📤 SEND EMAIL"):
+            if single_email and validate_email(single_email):
+                send_single_email(post, single_email, subject_prefix)
+            else:
+                st.error("⚠️ Please enter a valid email address")
+
+@timed_fragment('email.multiple')
 def render_multiple_recipients_section(post):
     st.markdown("### 📮 MULTIPLE RECIPIENTS SYSTEM")
     
@@ -1788,7 +681,7 @@ def render_multiple_recipients_section(post):
 
 def send_single_email(post, email, subject_prefix):
     try:
-        agent, success, message = initialize_agent()
+        agent, success, message = get_agent_session()
         if not success:
             st.error(f"🚨 {message}")
             return
@@ -1811,7 +704,7 @@ def send_single_email(post, email, subject_prefix):
 
 def send_multiple_emails(post, recipients, subject_prefix, validate_emails):
     try:
-        agent, success, message = initialize_agent()
+        agent, success, message = get_agent_session()
         if not success:
             st.error(f"🚨 {message}")
             return
@@ -2027,11 +920,14 @@ def render_generation_page():
     
     with col2:
         if st.button("🔙 BACK TO HOME"):
+            # The job keeps running; its result waits until it is fetched
             st.session_state.current_page = 'home'
+            if 'job' in st.query_params:
+                del st.query_params['job']
             st.rerun()
     
     # Generate the post
-    generate_single_post()
+    render_generation_status()
 
 # Results Page
 def render_results_page():
@@ -2043,10 +939,19 @@ def render_results_page():
             st.session_state.generated_post = None
             st.rerun()
     
+    with col2:
+        if st.button("🔄 REGENERATE"):
+            # Same parameters, new post (bypasses the topic cache)
+            st.session_state.generation_fresh = True
+            if submit_generation() is not None:
+                st.session_state.generated_post = None
+                st.rerun()
+    
     with col3:
         if st.button("🚀 GENERATE NEW"):
             st.session_state.current_page = 'home'
             st.session_state.generated_post = None
+            st.session_state.generation_fresh = True
             st.rerun()
     
     # Display the generated post
@@ -2160,40 +1065,14 @@ def render_neon_sidebar():
 def main():
     load_agent_css()
     initialize_session_state()
+    resume_generation_job()
     
     # Render the popup slide-in sidebar
     render_popup_sidebar()
     
     # Add sidebar stats
     with st.sidebar:
-        st.markdown("""
-        <style>
-        .sidebar-stats {
-            background: linear-gradient(135deg, rgba(0, 255, 136, 0.1) 0%, rgba(56, 152, 236, 0.1) 100%);
-            border-left: 3px solid #00ff88;
-            padding: 1.5rem;
-            border-radius: 8px;
-            margin-bottom: 1.5rem;
-        }
-        .stat-item {
-            display: flex;
-            justify-content: space-between;
-            padding: 0.8rem 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            color: #ffffff;
-            font-size: 0.95rem;
-        }
-        .stat-item:last-child {
-            border-bottom: none;
-        }
-        .stat-label {
-            color: #b0b8c1;
-        }
-        .stat-value {
-            color: #00ff88;
-            font-weight: bold;
-        }
-        </style>
+        st.markdown(f"""
         <div class="sidebar-stats">
             <h3 style="color: #00ff88; margin-bottom: 1rem; text-transform: uppercase; letter-spacing: 1px;">📊 Statistics</h3>
             <div class="stat-item">
@@ -2214,6 +1093,15 @@ def main():
             </div>
         </div>
         """, unsafe_allow_html=True)
+        
+        # Script execution time per interaction (full reruns vs fragment reruns)
+        if str(get_secret('UI_TIMINGS', 'false')).lower() == 'true':
+            with st.expander("⏱️ Script runs", expanded=False):
+                runs = recent_runs()
+                if runs:
+                    st.dataframe(runs, hide_index=True, use_container_width=True)
+                else:
+                    st.caption("No runs recorded yet")
     
     # Render neon sidebar
     render_neon_sidebar()
@@ -2226,6 +1114,7 @@ def main():
         # Render home page
         render_status_dashboard()
         render_post_generator()
+        start_import_warmer()
         
         # Footer - wrapped in container to stay at bottom
         st.markdown('<div class="footer-container">', unsafe_allow_html=True)
@@ -2263,4 +1152,5 @@ def main():
         st.markdown('</div>', unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with timed_app_run():
+        main()
\ No newline at end of file
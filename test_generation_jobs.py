@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Background generation job manager: dedupe per client and request, retry
+after a failure, fetch-once results and expiry of unfetched results.
+Runs offline: jobs are plain callables, no orchestrator involved.
+"""
+import sys
+import threading
+import time
+
+from src.generation_jobs import GenerationJobManager
+
+PARAMS = {'topic': 'AI in Healthcare', 'tone': 'professional', 'length': 2, 'audience': 'clinicians', 'fresh': False}
+
+
+def wait_done(job, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while not job.done:
+        assert time.time() < deadline, f"job {job.job_id} still {job.status}"
+        time.sleep(0.01)
+
+
+def test_duplicate_submissions_share_one_job():
+    print("\n" + "=" * 60)
+    print("GENERATION JOB DEDUPE TEST")
+    print("=" * 60)
+
+    manager = GenerationJobManager(workers=2)
+    release = threading.Event()
+    runs = []
+
+    def run():
+        runs.append(1)
+        release.wait(5)
+        return {'title': 'post'}
+
+    first = manager.submit('client-a', PARAMS, run)
+    # Same request with different case and spacing, e.g. a rerun or a double click
+    again = manager.submit('client-a', {**PARAMS, 'topic': '  ai in   HEALTHCARE '}, run)
+    other_client = manager.submit('client-b', PARAMS, run)
+    fresh = manager.submit('client-a', {**PARAMS, 'fresh': True}, run)
+    release.set()
+    for job in (first, other_client, fresh):
+        wait_done(job)
+
+    assert again is first
+    assert other_client is not first and fresh is not first
+    assert len(runs) == 3
+    assert manager.stats['deduplicated'] == 1
+    print("✓ DEDUPE TEST PASSED!")
+
+
+def test_failed_job_is_replaced_on_retry():
+    manager = GenerationJobManager(workers=1)
+
+    def fail():
+        raise ValueError("LLM unavailable")
+
+    failed = manager.submit('client-a', PARAMS, fail)
+    wait_done(failed)
+    assert failed.status == 'failed' and 'LLM unavailable' in failed.error
+
+    retry = manager.submit('client-a', PARAMS, lambda: {'title': 'post'})
+    wait_done(retry)
+    assert retry is not failed and retry.status == 'succeeded'
+    print("✓ RETRY TEST PASSED!")
+
+
+def test_result_is_fetched_once():
+    manager = GenerationJobManager(workers=1)
+    release = threading.Event()
+    job = manager.submit('client-a', PARAMS, lambda: release.wait(5) and {'title': 'post'})
+
+    # Not handed over while still running
+    assert manager.fetch(job.job_id) is None
+    release.set()
+    wait_done(job)
+
+    fetched = manager.fetch(job.job_id)
+    assert fetched is job and fetched.result == {'title': 'post'}
+    assert manager.fetch(job.job_id) is None and manager.get(job.job_id) is None
+    assert manager.find('client-a', PARAMS) is None
+    # After the fetch the same request runs again
+    assert manager.submit('client-a', PARAMS, lambda: {}) is not job
+    print("✓ FETCH-ONCE TEST PASSED!")
+
+
+def test_unfetched_results_expire():
+    manager = GenerationJobManager(workers=1, result_ttl_seconds=0.05)
+    job = manager.submit('client-a', PARAMS, lambda: {'title': 'post'})
+    wait_done(job)
+    assert manager.get(job.job_id) is job
+
+    time.sleep(0.1)
+    # Expiry runs on the next submission
+    manager.submit('client-b', PARAMS, lambda: {})
+    assert manager.get(job.job_id) is None
+    assert manager.stats['expired'] == 1
+    print("✓ EXPIRY TEST PASSED!")
+
+
+if __name__ == "__main__":
+    test_duplicate_submissions_share_one_job()
+    test_failed_job_is_replaced_on_retry()
+    test_result_is_fetched_once()
+    test_unfetched_results_expire()
+    sys.exit(0)
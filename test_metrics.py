@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Quick test to verify the Prometheus metrics endpoint can be scraped locally
+"""
+import sys
+import urllib.request
+
+from src.metrics import (
+    MetricsRegistry, start_metrics_server, stop_metrics_server
+)
+
+
+def test_metrics_endpoint():
+    """Start the sidecar on an ephemeral port, record samples and scrape them"""
+    print("\n" + "=" * 60)
+    print("METRICS ENDPOINT TEST")
+    print("=" * 60)
+
+    registry = MetricsRegistry()
+    latency = registry.histogram("test_phase_seconds", "Test latency", labels=("phase",))
+    errors = registry.counter("test_errors_total", "Test errors", labels=("error_class",))
+
+    latency.observe(0.02, phase="llm")
+    latency.observe(3.0, phase="llm")
+    errors.inc(error_class="TimeoutError")
+
+    server = start_metrics_server(port=0, host="127.0.0.1", registry=registry)
+    try:
+        port = server.server_address[1]
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+    finally:
+        stop_metrics_server()
+
+    print(body)
+    assert '# TYPE test_phase_seconds histogram' in body
+    assert 'test_phase_seconds_bucket{phase="llm",le="0.025"} 1.0' in body
+    assert 'test_phase_seconds_bucket{phase="llm",le="+Inf"} 2.0' in body
+    assert 'test_phase_seconds_count{phase="llm"} 2.0' in body
+    assert 'test_errors_total{error_class="TimeoutError"} 1.0' in body
+
+    print("✓ METRICS TEST PASSED!")
+
+
+if __name__ == "__main__":
+    test_metrics_endpoint()
+    sys.exit(0)